@@ -0,0 +1,105 @@
+"""Benchmark action allocations per simulation step, with and without pooling.
+
+Run with ``python -m benchmarks.action_allocations``.
+"""
+
+import gc
+import sys
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Type
+
+from games.catalog.simulation.stochastic import DiceRoll
+from games.primitive.action.base import Action
+from games.primitive.action.pool import ActionPool
+from games.primitive.action.random import RandomChoiceAction
+from games.primitive.actor.base import SimpleNonPlayer
+
+
+class CountingSlottedAction(RandomChoiceAction):
+    """Slotted random choice action that counts its instantiations."""
+
+    __slots__ = ()
+    created = 0
+
+    def __init__(self) -> None:
+        """Count and initialize the action."""
+        type(self).created += 1
+        super().__init__()
+
+
+class CountingDictAction(RandomChoiceAction):
+    """Random choice action with a ``__dict__`` (the pre-slots layout)."""
+
+    created = 0
+
+    def __init__(self) -> None:
+        """Count and initialize the action."""
+        type(self).created += 1
+        super().__init__()
+
+
+def instance_bytes(action: Action) -> int:
+    """Return the memory held by one action instance, including its dict."""
+    size = sys.getsizeof(action)
+    if hasattr(action, "__dict__"):
+        size += sys.getsizeof(action.__dict__)
+    return size
+
+
+def measure(
+    action_type: Type[Any], pool: Optional[ActionPool], steps: int, num_dice: int
+) -> Dict[str, float]:
+    """Step a DiceRoll and report allocations, GC activity and latency."""
+    sim = DiceRoll(num_dice=num_dice)
+    sim.actors = [SimpleNonPlayer(action_type)]
+    sim.action_pool = pool
+
+    action_type.created = 0
+    collections = gc.get_stats()[0]["collections"]
+    start = time.perf_counter()
+
+    for _ in range(steps):
+        sim.step()
+
+    elapsed = time.perf_counter() - start
+    per_step = action_type.created / steps
+
+    return {
+        "actions_per_step": per_step,
+        "bytes_per_step": per_step * instance_bytes(action_type()),
+        "gen0_collections": gc.get_stats()[0]["collections"] - collections,
+        "us_per_step": elapsed / steps * 1e6,
+    }
+
+
+def main(steps: int = 100_000, num_dice: int = 5) -> List[Dict[str, Any]]:
+    """Print and return allocation figures before and after slots/pooling."""
+    scenarios = [
+        ("dict layout, no pool (before)", CountingDictAction, None),
+        ("slots, no pool", CountingSlottedAction, None),
+        ("slots + pool (after)", CountingSlottedAction, ActionPool()),
+    ]
+    rows: List[Dict[str, Any]] = []
+
+    print(f"DiceRoll(num_dice={num_dice}), {steps} steps")
+    for name, action_type, pool in scenarios:
+        row: Dict[str, Any] = {"scenario": name}
+        row.update(measure(action_type, pool, steps, num_dice))
+        rows.append(row)
+        print(
+            f"{name:32} "
+            f"actions/step={row['actions_per_step']:8.4f} "
+            f"bytes/step={row['bytes_per_step']:8.1f} "
+            f"gen0 GCs={row['gen0_collections']:6d} "
+            f"us/step={row['us_per_step']:6.2f}"
+        )
+
+    return rows
+
+
+if __name__ == "__main__":
+    main()
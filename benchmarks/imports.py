@@ -0,0 +1,79 @@
+"""Cold import-time budgets for the package's entry points.
+
+Run with ``python -m benchmarks.imports`` (or ``nox -s import_time``). Every
+module is imported in a fresh interpreter, the best of several runs is kept
+and the run fails when any module takes longer than its budget.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+
+# milliseconds allowed for a cold import, on top of interpreter startup
+BUDGETS_MS: Dict[str, float] = {
+    "games.catalog": 50.0,
+    "games.visualization.board": 50.0,
+}
+
+# imports the measured module without timing interpreter startup
+_PROBE = (
+    "import time; start = time.perf_counter(); import {module}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_time_ms(module: str, repeat: int = 5) -> float:
+    """Return the best cold import time of a module over fresh interpreters."""
+    timings: List[float] = []
+
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        timings.append(float(output) * 1000)
+
+    return min(timings)
+
+
+def check_budgets(
+    budgets: Dict[str, float], repeat: int = 5, scale: float = 1.0
+) -> List[str]:
+    """Print every module's import time and return those over budget."""
+    failures: List[str] = []
+
+    for module, budget in budgets.items():
+        elapsed = import_time_ms(module, repeat)
+        print(f"{module:32} {elapsed:8.1f} ms (budget {budget * scale:.0f} ms)")
+
+        if elapsed > budget * scale:
+            failures.append(f"{module}: {elapsed:.1f} ms > {budget * scale:.0f} ms")
+
+    return failures
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Check the import budgets and report modules that exceed them."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply budgets, e.g. on slow CI"
+    )
+    args = parser.parse_args(argv)
+
+    failures = check_budgets(BUDGETS_MS, repeat=args.repeat, scale=args.scale)
+    for failure in failures:
+        print(f"OVER BUDGET {failure}", file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
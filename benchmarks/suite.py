@@ -0,0 +1,373 @@
+"""Throughput benchmarks with a JSON baseline for regression tracking.
+
+Run with ``python -m benchmarks.suite`` (or ``nox -s benchmarks``). Results are
+compared against ``benchmarks/baseline.json`` and the run fails when any
+benchmark's latency or peak memory regresses beyond the threshold. Pass
+``--update`` to record the current results as the new baseline.
+
+Latencies are absolute timings, so a baseline only holds for the machine
+that recorded it and is not kept under version control. When there is no
+baseline yet, the first run records one instead of checking; run the suite
+once on the revision to compare against before measuring a change.
+"""
+
+import argparse
+import itertools
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+import chess
+import matplotlib
+
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+from sgfmill import boards  # noqa: E402
+
+from games.catalog.simulation.base import Simulation  # noqa: E402
+from games.catalog.simulation.stochastic import CardDraw  # noqa: E402
+from games.catalog.simulation.stochastic import CoinFlip  # noqa: E402
+from games.catalog.simulation.stochastic import DiceRoll  # noqa: E402
+from games.primitive.action.random import RandomChoiceAction  # noqa: E402
+from games.primitive.state.discrete import ChoiceState  # noqa: E402
+from games.visualization.board.adapter.chess import ChessBoardWrapper  # noqa: E402
+from games.visualization.board.adapter.chess import chess_board_to_codes  # noqa: E402
+from games.visualization.board.adapter.chess import chess_board_to_grid  # noqa: E402
+from games.visualization.board.adapter.go import GoBoardWrapper  # noqa: E402
+from games.visualization.board.adapter.go import go_board_to_codes  # noqa: E402
+from games.visualization.board.adapter.go import go_board_to_grid  # noqa: E402
+from games.visualization.board.background.cache import BackgroundCache  # noqa: E402
+from games.visualization.board.raster import NumpyBoardRenderer  # noqa: E402
+from games.visualization.board.scene.chess import ChessScene  # noqa: E402
+from games.visualization.board.scene.go import GoScene  # noqa: E402
+from games.visualization.board.session import RenderSession  # noqa: E402
+
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# relative slowdown (or memory growth) tolerated before a run fails
+DEFAULT_THRESHOLD = 0.25
+
+# peak memory differences below this many bytes are treated as noise
+MEMORY_SLACK = 4096
+
+# Builds the callable to time; setup cost is excluded from measurements
+Setup = Callable[[], Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A named workload, built fresh for every measurement."""
+
+    name: str
+    setup: Setup
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measured figures of one benchmark."""
+
+    name: str
+    calls_per_sec: float
+    latency_us: float
+    peak_bytes: int
+
+
+def _stepper(simulation: Simulation) -> Callable[[], Any]:
+    """Return the step method of a ready simulation."""
+    return simulation.step
+
+
+def _forker(num_sides: int) -> Callable[[], Any]:
+    """Return the fork method of a stepped five-dice simulation."""
+    simulation = DiceRoll(5, num_sides)
+    simulation.step()
+    return simulation.fork
+
+
+def _hashed_stepper() -> Callable[[], Any]:
+    """Step a five-dice simulation and read its running state hash."""
+    simulation = DiceRoll(5, 6)
+    simulation.step()
+
+    def step() -> int:
+        """Take one step and return the new hash."""
+        simulation.step()
+        return simulation.state_hash
+
+    return step
+
+
+def _step_rollback() -> Callable[[], Any]:
+    """Step a journaled five-dice simulation and roll the step back."""
+    simulation = DiceRoll(5, 6)
+    simulation.enable_journal()
+    simulation.step()
+    savepoint = simulation.savepoint()
+
+    def explore() -> None:
+        """Try one step from the savepoint."""
+        simulation.step()
+        simulation.rollback(savepoint)
+
+    return explore
+
+
+def _choice_update() -> Callable[[], Any]:
+    """Update a ChoiceState with a valid value."""
+    state = ChoiceState(set(range(1, 7)))
+    return lambda: state.update(4)
+
+
+def _dispatch() -> Callable[[], Any]:
+    """Look up the winning rule of a DiceRoll for one action/state pair."""
+    simulation = DiceRoll()
+    action, state = RandomChoiceAction(), simulation.states[0]
+    return lambda: simulation._find_rule(action, state)
+
+
+def _chess_grid() -> Callable[[], Any]:
+    """Convert the starting chess position into a grid."""
+    wrapper = ChessBoardWrapper(chess.Board())
+    return lambda: chess_board_to_grid(wrapper)
+
+
+def _go_board() -> boards.Board:
+    """Return a 19x19 Go board with a few dozen stones."""
+    board = boards.Board(19)
+    for i in range(40):
+        board.play(i % 19, 3 * (i // 19) + 4, "b" if i % 2 else "w")
+    return board
+
+
+def _go_grid() -> Callable[[], Any]:
+    """Convert a populated Go board into a grid."""
+    wrapper = GoBoardWrapper(_go_board())
+    return lambda: go_board_to_grid(wrapper)
+
+
+def _chess_codes() -> Callable[[], Any]:
+    """Encode the starting chess position from its bitboards."""
+    board = chess.Board()
+    return lambda: chess_board_to_codes(board)
+
+
+def _go_codes() -> Callable[[], Any]:
+    """Encode a populated Go board."""
+    board = _go_board()
+    return lambda: go_board_to_codes(board)
+
+
+def _render_chess(cache: bool = False) -> Callable[[], Any]:
+    """Render and rasterize the starting chess position, then close it."""
+    scene = ChessScene(chess.Board())
+    scene.renderer.background_cache = BackgroundCache() if cache else None
+    grid = chess_board_to_grid(ChessBoardWrapper(scene.board))
+
+    def render() -> None:
+        """Render one frame."""
+        ax = scene.renderer.render(grid, spec=scene.spec, return_ax=True)
+        ax.figure.canvas.draw()
+        plt.close(ax.figure)
+
+    return render
+
+
+def _render_chess_numpy() -> Callable[[], Any]:
+    """Rasterize the starting chess position without matplotlib."""
+    scene = ChessScene(chess.Board())
+    renderer = NumpyBoardRenderer(scene.renderer.background, scene.renderer.geometry)
+    grid = chess_board_to_grid(ChessBoardWrapper(scene.board))
+
+    return lambda: renderer.render_array(grid, spec=scene.spec)
+
+
+def _render_go(batch_cells: bool) -> Callable[[], Any]:
+    """Render and rasterize a populated Go board, then close it."""
+    scene = GoScene(_go_board())
+    scene.renderer.batch_cells = batch_cells
+    grid = scene.board_to_grid(scene.board)
+
+    def render() -> None:
+        """Render one frame."""
+        ax = scene.renderer.render(grid, spec=scene.spec, return_ax=True)
+        ax.figure.canvas.draw()
+        plt.close(ax.figure)
+
+    return render
+
+
+def _session_update() -> Callable[[], Any]:
+    """Blit one move into a persistent chess render session."""
+    board = chess.Board()
+    scene = ChessScene(board)
+    grids = [chess_board_to_grid(ChessBoardWrapper(board))]
+    board.push_san("e4")
+    grids.append(chess_board_to_grid(ChessBoardWrapper(board)))
+
+    session = RenderSession(scene.renderer, grids[0], spec=scene.spec)
+    moves = itertools.count()
+
+    # alternate between the two positions so every call changes two squares
+    return lambda: session.update(grids[next(moves) % 2])
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("coin_flip_step", lambda: _stepper(CoinFlip())),
+    Benchmark("dice_roll_1x6_step", lambda: _stepper(DiceRoll(1, 6))),
+    Benchmark("dice_roll_5x6_step", lambda: _stepper(DiceRoll(5, 6))),
+    Benchmark("dice_roll_20x20_step", lambda: _stepper(DiceRoll(20, 20))),
+    Benchmark("card_draw_step", lambda: _stepper(CardDraw())),
+    Benchmark("simulation_fork_d6", lambda: _forker(6)),
+    Benchmark("simulation_fork_d100000", lambda: _forker(100_000)),
+    Benchmark("simulation_step_rollback", _step_rollback),
+    Benchmark("dice_roll_5x6_step_hashed", _hashed_stepper),
+    Benchmark("choice_state_update", _choice_update),
+    Benchmark("rule_dispatch", _dispatch),
+    Benchmark("chess_board_to_grid", _chess_grid),
+    Benchmark("go_board_to_grid", _go_grid),
+    Benchmark("chess_board_to_codes", _chess_codes),
+    Benchmark("go_board_to_codes", _go_codes),
+    Benchmark("render_chess", _render_chess),
+    Benchmark("render_chess_cached_background", lambda: _render_chess(True)),
+    Benchmark("render_chess_numpy", _render_chess_numpy),
+    Benchmark("render_go", lambda: _render_go(False)),
+    Benchmark("render_go_batched", lambda: _render_go(True)),
+    Benchmark("render_session_update", _session_update),
+]
+
+
+def measure(
+    benchmark: Benchmark, min_time: float = 0.2, repeat: int = 5
+) -> BenchmarkResult:
+    """Time a benchmark (best of ``repeat``) and trace its peak memory."""
+    call = benchmark.setup()
+    call()  # warm up caches and lazy state
+
+    # grow the loop until one round takes long enough to time reliably
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeat:
+            break
+        number *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        best = min(best, time.perf_counter() - start)
+
+    # memory is traced separately, since tracing slows every allocation
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latency = best / number
+    return BenchmarkResult(benchmark.name, 1 / latency, latency * 1e6, peak)
+
+
+def compare(
+    baseline: Dict[str, Dict[str, Any]],
+    results: Sequence[BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """Return a description of every regression against the baseline."""
+    regressions: List[str] = []
+
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None:
+            continue
+
+        if result.latency_us > reference["latency_us"] * (1 + threshold):
+            regressions.append(
+                f"{result.name}: latency {result.latency_us:.2f} us "
+                f"vs baseline {reference['latency_us']:.2f} us"
+            )
+
+        limit = reference["peak_bytes"] * (1 + threshold) + MEMORY_SLACK
+        if result.peak_bytes > limit:
+            regressions.append(
+                f"{result.name}: peak memory {result.peak_bytes} B "
+                f"vs baseline {reference['peak_bytes']} B"
+            )
+
+    return regressions
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load a baseline file, or return an empty baseline if it is missing."""
+    if not path.exists():
+        return {}
+    baseline: Dict[str, Dict[str, Any]] = json.loads(path.read_text())
+    return baseline
+
+
+def save_baseline(path: Path, baseline: Dict[str, Dict[str, Any]]) -> None:
+    """Write a baseline file keyed by benchmark name."""
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the suite, print a table and check it against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--only", nargs="*", default=None, help="benchmark names")
+    parser.add_argument("--update", action="store_true", help="rewrite baseline")
+    args = parser.parse_args(argv)
+
+    selected = [b for b in BENCHMARKS if args.only is None or b.name in args.only]
+    results: List[BenchmarkResult] = []
+
+    for benchmark in selected:
+        result = measure(benchmark, min_time=args.min_time)
+        results.append(result)
+        print(
+            f"{result.name:32} {result.calls_per_sec:12.0f} calls/s "
+            f"{result.latency_us:10.2f} us {result.peak_bytes:10d} B peak"
+        )
+
+    if args.update:
+        # keep entries of benchmarks that were not selected this time
+        baseline = load_baseline(args.baseline)
+        baseline.update({result.name: asdict(result) for result in results})
+        save_baseline(args.baseline, baseline)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        save_baseline(args.baseline, {r.name: asdict(r) for r in results})
+        print(f"no baseline yet, this run was recorded to {args.baseline}")
+        return 0
+
+    regressions = compare(load_baseline(args.baseline), results, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -202,3 +202,17 @@ def deptry(session: nox.Session) -> None:
     """Run deptry."""
     install_lint_deps(session, deps=["deptry"])
     session.run("deptry", "src/")
+
+
+@nox.session()
+def benchmarks(session: nox.Session) -> None:
+    """Run the benchmark suite against this machine's baseline, recording it first."""
+    install_project(session, with_dev=False)
+    session.run("python", "-m", "benchmarks.suite", *session.posargs)
+
+
+@nox.session()
+def import_time(session: nox.Session) -> None:
+    """Check cold import times of the package entry points against budgets."""
+    install_project(session, with_dev=False)
+    session.run("python", "-m", "benchmarks.imports", *session.posargs)
@@ -1,55 +1,358 @@
 """This module defines the abstract base class for simulations."""
 
+import copy
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import TypeVar
 
+import numpy as np
+from numpy.typing import DTypeLike
+from numpy.typing import NDArray
+
+from games.catalog.simulation.batch import BatchPlan
+from games.catalog.simulation.dispatch import DispatchCache
+from games.catalog.simulation.dispatch import RuleList
+from games.catalog.simulation.journal import UndoJournal
+from games.catalog.simulation.stats import Accumulator
+from games.primitive.action.base import Action
+from games.primitive.action.pool import ActionPool
 from games.primitive.actor.base import Actor
+from games.primitive.rng.base import RandomStream
+from games.primitive.rng.base import SeedLike
+from games.primitive.rng.stochastic import Stochastic
+from games.primitive.rng.stream import PythonRandomStream
 from games.primitive.rule.base import Rule
 from games.primitive.state.base import State
+from games.primitive.state.discrete import ChoiceState
+from games.primitive.state.zobrist import ZobristHash
+
+
+_ComponentT = TypeVar("_ComponentT")
+_SimulationT = TypeVar("_SimulationT", bound="Simulation")
+
+
+def _fork_component(component: _ComponentT) -> _ComponentT:
+    """Return a component a fork may bind to its own stream.
+
+    Stochastic rules and actors are copied shallowly, so the stream is the
+    only thing they stop sharing; anything else is returned as is.
+    """
+    if not isinstance(component, Stochastic):
+        return component
+
+    clone = copy.copy(component)
+
+    # cached executors are bound to the original component and its stream
+    clear_executors = getattr(clone, "clear_executors", None)
+    if callable(clear_executors):
+        clear_executors()
+
+    return clone
 
 
 class Simulation(ABC):
     """Abstract Base Class for simulations that evolve over time."""
 
-    def __init__(self) -> None:
+    def __init__(self, rng: Optional[RandomStream] = None) -> None:
         """Initialize the simulation by preparing internal components."""
+        self.dispatch_cache = DispatchCache()
         self.states: List[State] = []
-        self.rules: List[Rule] = []
+        self.rules = []
         self.actors: List[Actor] = []
+        self.accumulators: List[Accumulator] = []
+        self._action_pool: Optional[ActionPool] = None
+        self.journal: Optional[UndoJournal] = None
+        self._zobrist: Optional[ZobristHash] = None
         self._register_components()
+        self.rng = rng or PythonRandomStream()
+
+    @property
+    def rng(self) -> RandomStream:
+        """Return the random stream owned by this simulation."""
+        return self._rng
+
+    @rng.setter
+    def rng(self, stream: RandomStream) -> None:
+        """Replace the random stream and bind it to stochastic components."""
+        self._rng = stream
+        self._bind_rng()
+
+    def seed(self, seed: SeedLike) -> None:
+        """Reseed the simulation with a fresh stream of the same kind."""
+        self.rng = type(self._rng)(seed)
+
+    def fork(self: _SimulationT, rng: Optional[RandomStream] = None) -> _SimulationT:
+        """Return an independent copy that shares all but the state values.
+
+        Every state is copied shallowly, so a ``ChoiceState`` fork copies its
+        value code and shares its choice set, index and value array: forking
+        costs the same whatever the number of choices. Rules and actors are
+        shared, and so is the random stream unless the fork is given its own
+        ``rng`` (e.g. ``sim.rng.spawn(1)[0]``), in which case stochastic rules
+        and actors are copied to draw from it. Accumulators are not carried
+        over, nor is the journal. Rules and actors are expected not to hold on
+        to states.
+        """
+        clone = copy.copy(self)
+
+        clone.states = [copy.copy(state) for state in self.states]
+        clone.accumulators = []
+        clone.journal = None
+        clone.dispatch_cache = DispatchCache()
+
+        # the copied states still update this simulation's hash until rebound
+        clone._zobrist = None
+        if self._zobrist is not None:
+            clone._bind_hash()
+
+        if rng is None:
+            # the rule list reports changes to its owner, so it is rebuilt
+            clone._rules = RuleList(self._rules, on_change=clone._rules_changed)
+            return clone
+
+        clone.actors = [_fork_component(actor) for actor in self.actors]
+        clone._rng = rng
+
+        # the rules setter binds the stream to the fresh rule list
+        clone.rules = [_fork_component(rule) for rule in self._rules]
+
+        return clone
+
+    @property
+    def state_hash(self) -> int:
+        """Return a 64-bit Zobrist hash of the values of the choice states.
+
+        The hash is built on first access, in O(states); from then on, every
+        change of a choice state updates it in O(1). Equal values give equal
+        hashes, across forks and across simulations with the same kinds of
+        states. States other than ``ChoiceState`` are not hashed.
+        """
+        if self._zobrist is None:
+            self._bind_hash()
+        assert self._zobrist is not None
+        return self._zobrist.value
+
+    def _bind_hash(self) -> None:
+        """Start a hash of the choice states and keep it up to date."""
+        self._zobrist = ZobristHash()
+        for position, state in enumerate(self.states):
+            if isinstance(state, ChoiceState):
+                state.bind_hash(self._zobrist, position)
+
+    def _bind_rng(self) -> None:
+        """Point every stochastic rule and actor at the simulation's stream."""
+        stream = getattr(self, "_rng", None)
+        if stream is None:
+            return
+
+        for component in [*self._rules, *self.actors]:
+            if isinstance(component, Stochastic):
+                component.rng = stream
+
+    @property
+    def action_pool(self) -> Optional[ActionPool]:
+        """Return the pool recycling resolved actions, if enabled."""
+        return self._action_pool
+
+    @action_pool.setter
+    def action_pool(self, pool: Optional[ActionPool]) -> None:
+        """Enable (or disable with None) action recycling for all actors."""
+        self._action_pool = pool
+        for actor in self.actors:
+            actor.pool = pool
+
+    def _rules_changed(self) -> None:
+        """React to rules being replaced or mutated."""
+        self.dispatch_cache.invalidate()
+        self._bind_rng()
+
+    @property
+    def rules(self) -> List[Rule]:
+        """Return the rules, wrapped so that mutations invalidate dispatch."""
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: Iterable[Rule]) -> None:
+        """Replace the rules and invalidate the dispatch cache."""
+        self._rules = RuleList(rules, on_change=self._rules_changed)
+        self._rules_changed()
 
     @abstractmethod
     def _register_components(self) -> None:
         """Set up states, rules, and actors."""
         pass
 
+    def enable_journal(self) -> UndoJournal:
+        """Start recording state changes, so steps can be undone."""
+        if self.journal is None:
+            self.journal = UndoJournal()
+        return self.journal
+
+    def disable_journal(self) -> None:
+        """Stop recording state changes and forget the recorded ones."""
+        self.journal = None
+
+    def _require_journal(self) -> UndoJournal:
+        """Return the journal, which undoing requires."""
+        if self.journal is None:
+            raise RuntimeError("Journaling is not enabled; call enable_journal().")
+        return self.journal
+
+    def undo(self, n: int = 1) -> None:
+        """Roll the states back by ``n`` steps (batches count as one)."""
+        self._require_journal().undo(n)
+
+    def savepoint(self) -> int:
+        """Return a marker of the current states, for :meth:`rollback`."""
+        return self._require_journal().savepoint()
+
+    def rollback(self, savepoint: int) -> None:
+        """Roll the states back to how they were at a savepoint."""
+        self._require_journal().rollback(savepoint)
+
+    def _find_rule(self, action: Action, state: State) -> Optional[Rule]:
+        """Return the first rule accepting the action and state, if any."""
+        return self.dispatch_cache.lookup(action, state, self._rules)
+
+    def _resolve(self, actor: Actor, state: State) -> None:
+        """Resolve and apply one actor's decision on a single state."""
+        journal = self.journal
+        snapshot = state.snapshot() if journal is not None else None
+
+        # get actor's decision
+        action = actor.decide(state)
+
+        # update action with executor if necessary
+        rule = self._find_rule(action, state)
+        if rule is not None:
+            rule.apply(action, state)
+
+        if action.is_resolved:
+            action.apply(state)
+        else:
+            raise RuntimeError(f"No rule could resolve action: {action}")
+
+        if journal is not None:
+            journal.record(state, snapshot)
+
+        if self._action_pool is not None:
+            self._action_pool.release(action)
+
     def _run_cycle(self) -> None:
         """Run one actor–action–rule–state resolution cycle."""
         # loop over actors
         for actor in self.actors:
             # loop over states
             for state in self.states:
-                # get actor's decision
-                action = actor.decide(state)
-
-                # loop over all rules
-                for rule in self.rules:
-                    # check action against rules
-                    if rule.accepts(action, state):
-                        # update action with executor if necessary
-                        rule.apply(action, state)
-                        break
-
-                if action.is_resolved:
-                    action.apply(state)
-                else:
-                    raise RuntimeError(f"No rule could resolve action: {action}")
+                self._resolve(actor, state)
 
     def step(self) -> None:
         """Advance the simulation by one step using actor–action–rule–state logic."""
+        if self.journal is not None:
+            self.journal.begin_step()
+
         self._run_cycle()
 
+        if self.accumulators:
+            row = [state.value for state in self.states]
+            for accumulator in self.accumulators:
+                accumulator.update(row)
+
+    def attach(self, accumulator: Accumulator) -> None:
+        """Feed every subsequent step or batch into an accumulator."""
+        self.accumulators.append(accumulator)
+
+    def detach(self, accumulator: Accumulator) -> None:
+        """Stop feeding an accumulator."""
+        self.accumulators.remove(accumulator)
+
+    def run_batch(
+        self, n_steps: int, rng: Optional[np.random.Generator] = None
+    ) -> NDArray[Any]:
+        """Advance ``n_steps`` steps at once and return the outcome array.
+
+        The components are compiled into a :class:`BatchPlan` so vectorizable
+        rules draw all steps in bulk from the simulation's stream (or ``rng``).
+        Row ``i`` holds every state's value after step ``i``; ``is_done()`` is
+        not consulted between steps.
+        """
+        if n_steps < 0:
+            raise ValueError("Number of steps must be non-negative.")
+
+        # with a journal, the whole batch is undone as one step
+        journal = self.journal
+        if journal is not None:
+            journal.begin_step()
+            snapshots = [state.snapshot() for state in self.states]
+
+        outcomes = BatchPlan(self).run(n_steps, rng or self._rng.generator)
+
+        if journal is not None:
+            # snapshots were taken from these very states
+            for state, snapshot in zip(self.states, snapshots):  # noqa: B905
+                journal.record(state, snapshot)
+
+        for accumulator in self.accumulators:
+            accumulator.update_batch(outcomes)
+
+        return outcomes
+
+    def run(
+        self, max_steps: Optional[int] = None, batch_size: int = 1024
+    ) -> Iterator[NDArray[Any]]:
+        """Step until done or out of budget, yielding chunks of outcomes.
+
+        Each chunk is an array of shape ``(batch, n_states)`` holding every
+        state's value after each step; only the last chunk may be shorter.
+        Without ``max_steps`` the generator runs until ``is_done()``.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive.")
+        if max_steps is not None and max_steps < 0:
+            raise ValueError("Number of steps must be non-negative.")
+
+        dtype = self._outcome_dtype()
+        chunk: NDArray[Any] = np.empty((batch_size, len(self.states)), dtype=dtype)
+        filled = taken = 0
+
+        while (max_steps is None or taken < max_steps) and not self.is_done():
+            self.step()
+            taken += 1
+
+            for index, state in enumerate(self.states):
+                chunk[filled, index] = state.value
+            filled += 1
+
+            if filled == batch_size:
+                yield chunk
+                chunk = np.empty_like(chunk)
+                filled = 0
+
+        if filled:
+            yield chunk[:filled]
+
+    def _outcome_dtype(self) -> DTypeLike:
+        """Return a dtype able to hold every state's values."""
+        arrays = [
+            state.values_array
+            for state in self.states
+            if isinstance(state, ChoiceState)
+        ]
+
+        # arbitrary states (or never-set ones) need Python objects
+        if not arrays or len(arrays) < len(self.states) or not self.actors:
+            return object
+
+        try:
+            return np.result_type(*(array.dtype for array in arrays))
+        except TypeError:
+            return object
+
     @abstractmethod
     def is_done(self) -> bool:
         """Check whether the simulation has reached a stopping condition."""
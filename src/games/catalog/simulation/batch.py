@@ -0,0 +1,151 @@
+"""This module compiles simulations into plans for batched execution."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Set
+
+import numpy as np
+from numpy.typing import DTypeLike
+from numpy.typing import NDArray
+
+from games.primitive.actor.base import Actor
+from games.primitive.actor.base import SimpleNonPlayer
+from games.primitive.rule.base import BatchExecutor
+from games.primitive.rule.base import VectorizedRule
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from games.catalog.simulation.base import Simulation
+
+
+@dataclass(frozen=True)
+class PlanSlot:
+    """One actor–state pairing of a compiled plan."""
+
+    actor: Actor
+    state_index: int
+    batch_executor: Optional[BatchExecutor] = None
+
+    @property
+    def is_vectorized(self) -> bool:
+        """Check whether the slot can be advanced without the object path."""
+        return self.batch_executor is not None
+
+
+class BatchPlan:
+    """Compiled actor–action–rule–state plan that advances a simulation in bulk.
+
+    Slots resolved by a :class:`VectorizedRule` for an actor that always takes
+    the same action type are drawn as NumPy arrays; all other slots fall back
+    to the regular per-object resolution path, step by step.
+    """
+
+    def __init__(self, simulation: "Simulation") -> None:
+        """Compile the simulation's actors, states and rules into slots."""
+        self.simulation = simulation
+        self.slots: List[PlanSlot] = [
+            self._compile_slot(actor, index)
+            for actor in simulation.actors
+            for index in range(len(simulation.states))
+        ]
+
+    def _compile_slot(self, actor: Actor, index: int) -> PlanSlot:
+        """Resolve the rule for one actor–state pair once, up front."""
+        # only actors with a fixed action type have a static resolution
+        if not isinstance(actor, SimpleNonPlayer):
+            return PlanSlot(actor, index)
+
+        state = self.simulation.states[index]
+        action = actor.decide(state)
+
+        try:
+            rule = self.simulation._find_rule(action, state)
+
+            if not isinstance(rule, VectorizedRule):
+                return PlanSlot(actor, index)
+
+            return PlanSlot(actor, index, rule.bind_batch_executor(action, state))
+        finally:
+            # the probe is never applied, so pooled actions go straight back
+            pool = self.simulation.action_pool
+            if pool is not None:
+                pool.release(action)
+
+    @property
+    def is_vectorized(self) -> bool:
+        """Check whether every slot of the plan is vectorized."""
+        return all(slot.is_vectorized for slot in self.slots)
+
+    def run(self, n_steps: int, rng: np.random.Generator) -> NDArray[Any]:
+        """Advance ``n_steps`` steps and return outcomes as ``(steps, states)``."""
+        states = self.simulation.states
+        draws = [
+            None if slot.batch_executor is None else slot.batch_executor(rng, n_steps)
+            for slot in self.slots
+        ]
+        outcomes: NDArray[Any] = np.empty(
+            (n_steps, len(states)), dtype=self._outcome_dtype(draws)
+        )
+
+        if n_steps == 0:
+            return outcomes
+
+        # states without any slot simply keep their current value
+        for index in set(range(len(states))) - self._written:
+            outcomes[:, index] = states[index].value
+
+        if self.is_vectorized:
+            # later slots overwrite earlier ones, as in the object path
+            for i, draw in enumerate(draws):
+                outcomes[:, self.slots[i].state_index] = draw
+        else:
+            self._run_mixed(outcomes, draws)
+
+        # leave states holding the final outcome, as repeated step() would
+        for index, value in enumerate(outcomes[-1].tolist()):
+            states[index].value = value
+
+        return outcomes
+
+    @property
+    def _written(self) -> Set[int]:
+        """Return indices of states written by at least one slot."""
+        return {slot.state_index for slot in self.slots}
+
+    def _outcome_dtype(self, draws: List[Optional[NDArray[Any]]]) -> DTypeLike:
+        """Find a dtype shared by all drawn outcomes, falling back to object."""
+        # untouched states or object-path slots may hold arbitrary values
+        if not draws or len(self._written) < len(self.simulation.states):
+            return object
+
+        dtypes = []
+        for draw in draws:
+            if draw is None:
+                return object
+            dtypes.append(draw.dtype)
+
+        try:
+            return np.result_type(*dtypes)
+        except TypeError:
+            return object
+
+    def _run_mixed(
+        self, outcomes: NDArray[Any], draws: List[Optional[NDArray[Any]]]
+    ) -> None:
+        """Interleave vectorized draws with the per-object fallback path."""
+        states = self.simulation.states
+
+        for step in range(outcomes.shape[0]):
+            for i, draw in enumerate(draws):
+                slot = self.slots[i]
+
+                if draw is not None:
+                    outcomes[step, slot.state_index] = draw[step]
+                    continue
+
+                state = states[slot.state_index]
+                self.simulation._resolve(slot.actor, state)
+                outcomes[step, slot.state_index] = state.value
@@ -0,0 +1,135 @@
+"""This module caches rule resolution for the simulation dispatch loop."""
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import SupportsIndex
+from typing import Tuple
+from typing import Type
+
+from games.primitive.action.base import Action
+from games.primitive.rule.base import Rule
+from games.primitive.state.base import State
+
+
+class DispatchCache:
+    """Memoizes the winning rule per ``(action type, state type)`` pair.
+
+    Rules are expected to accept or reject based on the types of the action
+    and state only; the first lookup for a pair scans the rules, every later
+    lookup is a single dictionary access.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache with zeroed counters."""
+        self._winners: Dict[Tuple[Type[Action], Type[State]], Optional[Rule]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def lookup(
+        self, action: Action, state: State, rules: Iterable[Rule]
+    ) -> Optional[Rule]:
+        """Return the first rule accepting the pair, scanning only on a miss."""
+        key = (type(action), type(state))
+
+        try:
+            rule = self._winners[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            return rule
+
+        rule = next((rule for rule in rules if rule.accepts(action, state)), None)
+        self._winners[key] = rule
+
+        return rule
+
+    def invalidate(self) -> None:
+        """Forget all memoized rules (counters are kept)."""
+        self._winners.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Return the fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        """Return the number of memoized pairs."""
+        return len(self._winners)
+
+
+class RuleList(List[Rule]):
+    """List of rules that reports every in-place mutation to a callback."""
+
+    def __init__(self, rules: Iterable[Rule], on_change: Callable[[], None]) -> None:
+        """Initialize with the given rules and change callback."""
+        super().__init__(rules)
+        self._on_change = on_change
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Replace one or more rules."""
+        super().__setitem__(index, value)
+        self._on_change()
+
+    def __delitem__(self, index: Any) -> None:
+        """Delete one or more rules."""
+        super().__delitem__(index)
+        self._on_change()
+
+    def __iadd__(self, rules: Iterable[Rule]) -> "RuleList":  # type: ignore[override, misc]
+        """Extend the rules in place."""
+        super().__iadd__(rules)
+        self._on_change()
+        return self
+
+    def __imul__(self, factor: SupportsIndex) -> "RuleList":
+        """Repeat the rules in place."""
+        super().__imul__(factor)
+        self._on_change()
+        return self
+
+    def append(self, rule: Rule) -> None:
+        """Append a rule."""
+        super().append(rule)
+        self._on_change()
+
+    def extend(self, rules: Iterable[Rule]) -> None:
+        """Append several rules."""
+        super().extend(rules)
+        self._on_change()
+
+    def insert(self, index: Any, rule: Rule) -> None:
+        """Insert a rule before the given index."""
+        super().insert(index, rule)
+        self._on_change()
+
+    def remove(self, rule: Rule) -> None:
+        """Remove the first occurrence of a rule."""
+        super().remove(rule)
+        self._on_change()
+
+    def pop(self, index: Any = -1) -> Rule:
+        """Remove and return a rule."""
+        rule = super().pop(index)
+        self._on_change()
+        return rule
+
+    def clear(self) -> None:
+        """Remove all rules."""
+        super().clear()
+        self._on_change()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sort the rules in place."""
+        super().sort(*args, **kwargs)
+        self._on_change()
+
+    def reverse(self) -> None:
+        """Reverse the rule order in place."""
+        super().reverse()
+        self._on_change()
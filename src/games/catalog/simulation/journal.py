@@ -0,0 +1,78 @@
+"""This module records state changes so simulations can be rolled back."""
+
+from typing import Any
+from typing import List
+
+from games.primitive.state.base import State
+
+
+class UndoJournal:
+    """Stack of the values states held before each change, grouped by step.
+
+    Only changes are recorded, as the state and its prior
+    :meth:`~games.primitive.state.base.State.snapshot` (a code for choice
+    states), so rolling back costs as much as the changes being undone.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty journal."""
+        self._states: List[State] = []
+        self._snapshots: List[Any] = []
+        self._steps: List[int] = []
+
+    def __len__(self) -> int:
+        """Return the number of steps that can be undone."""
+        return len(self._steps)
+
+    @property
+    def changes(self) -> int:
+        """Return the number of recorded state changes."""
+        return len(self._states)
+
+    def begin_step(self) -> None:
+        """Start grouping the following changes into a new step."""
+        self._steps.append(len(self._states))
+
+    def record(self, state: State, snapshot: Any) -> None:
+        """Record a state's prior snapshot, if the state has since changed."""
+        if state.snapshot() != snapshot:
+            self._states.append(state)
+            self._snapshots.append(snapshot)
+
+    def savepoint(self) -> int:
+        """Return a marker of the current position, for :meth:`rollback`.
+
+        The marker counts the steps begun so far, so steps that changed
+        nothing still keep their place.
+        """
+        return len(self._steps)
+
+    def _restore(self, index: int) -> None:
+        """Undo every change recorded from ``index`` on, newest first."""
+        states, snapshots = self._states, self._snapshots
+        for position in range(len(states) - 1, index - 1, -1):
+            states[position].restore(snapshots[position])
+
+        del states[index:], snapshots[index:]
+
+    def rollback(self, savepoint: int) -> None:
+        """Restore every state to how it was at a savepoint."""
+        if not 0 <= savepoint <= len(self._steps):
+            raise ValueError(f"Unknown savepoint: {savepoint}.")
+
+        if savepoint < len(self._steps):
+            self._restore(self._steps[savepoint])
+            del self._steps[savepoint:]
+
+    def undo(self, n: int = 1) -> None:
+        """Restore every state to how it was ``n`` steps ago."""
+        if not 0 <= n <= len(self._steps):
+            raise ValueError(f"Cannot undo {n} of {len(self._steps)} steps.")
+
+        self.rollback(len(self._steps) - n)
+
+    def clear(self) -> None:
+        """Forget every recorded change, keeping the states as they are."""
+        self._states.clear()
+        self._snapshots.clear()
+        self._steps.clear()
@@ -0,0 +1,146 @@
+"""This module runs independent simulation replicas over a process pool."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+from games.catalog.simulation.base import Simulation
+from games.catalog.simulation.stats import Accumulator
+from games.catalog.simulation.stats import Histogram
+from games.catalog.simulation.stats import add_histogram
+from games.catalog.simulation.stats import histograms
+
+
+# Builds a fresh simulation in a worker (must be picklable, e.g. a class)
+SimulationFactory = Callable[[], Simulation]
+
+# Builds a fresh accumulator in a worker (must be picklable, e.g. a class)
+AccumulatorFactory = Callable[[], Accumulator]
+
+
+@dataclass
+class ReplicaResult:
+    """Outcome histograms per state, merged over many replicas."""
+
+    n_replicas: int = 0
+    n_steps: int = 0
+    histograms: List[Histogram] = field(default_factory=list)
+    accumulators: List[Accumulator] = field(default_factory=list)
+
+    def merge(self, other: "ReplicaResult") -> None:
+        """Add another result's replicas and counts into this one."""
+        if self.n_replicas and other.n_replicas and self.n_steps != other.n_steps:
+            raise ValueError("Cannot merge results with different step budgets.")
+
+        # grow to the wider of the two results
+        for _ in range(len(other.histograms) - len(self.histograms)):
+            self.histograms.append({})
+
+        for index, theirs in enumerate(other.histograms):
+            add_histogram(self.histograms[index], theirs)
+
+        if not self.accumulators:
+            self.accumulators = list(other.accumulators)
+        elif other.accumulators:
+            for index, accumulator in enumerate(other.accumulators):
+                self.accumulators[index].merge(accumulator)
+
+        self.n_steps = self.n_steps or other.n_steps
+        self.n_replicas += other.n_replicas
+
+    def frequencies(self, index: int) -> Dict[Any, float]:
+        """Return relative outcome frequencies of one state."""
+        histogram = self.histograms[index]
+        total = sum(histogram.values())
+        return {value: count / total for value, count in histogram.items()}
+
+
+def _run_chunk(
+    factory: SimulationFactory,
+    n_steps: int,
+    seeds: Sequence[np.random.SeedSequence],
+    accumulator_factories: Sequence[AccumulatorFactory] = (),
+) -> ReplicaResult:
+    """Run a chunk of replicas in a worker and merge their histograms."""
+    # replicas of a chunk feed the same accumulators directly
+    accumulators = [make() for make in accumulator_factories]
+    result = ReplicaResult(accumulators=accumulators)
+
+    for seed in seeds:
+        simulation = factory()
+        simulation.seed(seed)
+        for accumulator in accumulators:
+            simulation.attach(accumulator)
+
+        outcomes = simulation.run_batch(n_steps)
+        result.merge(ReplicaResult(1, n_steps, histograms(outcomes)))
+
+    return result
+
+
+def _chunk(
+    seeds: List[np.random.SeedSequence], n_chunks: int
+) -> List[List[np.random.SeedSequence]]:
+    """Split the replica seeds into at most ``n_chunks`` contiguous chunks."""
+    size, extra = divmod(len(seeds), n_chunks)
+    bounds: List[Tuple[int, int]] = []
+    start = 0
+
+    for i in range(n_chunks):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            bounds.append((start, stop))
+        start = stop
+
+    return [seeds[start:stop] for start, stop in bounds]
+
+
+def run_replicas(
+    factory: SimulationFactory,
+    n_replicas: int,
+    n_steps: int,
+    *,
+    seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    chunks_per_worker: int = 4,
+    accumulators: Sequence[AccumulatorFactory] = (),
+) -> ReplicaResult:
+    """Run independent replicas in parallel and merge their histograms.
+
+    Every replica gets its own child of a single ``SeedSequence``, so a seeded
+    run is reproducible regardless of the number of workers. Replicas are sent
+    to workers in a few large chunks to keep inter-process traffic low.
+    Each factory in ``accumulators`` is instantiated per chunk and merged into
+    ``ReplicaResult.accumulators`` in the same order.
+    """
+    if n_replicas < 1:
+        raise ValueError("Must run at least one replica.")
+    if n_steps < 1:
+        raise ValueError("Must run at least one step per replica.")
+    if chunks_per_worker < 1:
+        raise ValueError("Must send at least one chunk per worker.")
+
+    workers = max_workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed).spawn(n_replicas)
+    chunks = _chunk(seeds, workers * chunks_per_worker)
+
+    result = ReplicaResult(n_steps=n_steps)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_chunk, factory, n_steps, chunk, accumulators)
+            for chunk in chunks
+        ]
+        for future in futures:
+            result.merge(future.result())
+
+    return result
@@ -0,0 +1,215 @@
+"""This module defines streaming statistics over simulation outcomes."""
+
+from abc import ABC
+from abc import abstractmethod
+from collections import Counter
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+Histogram = Dict[Any, int]
+
+_AccumulatorT = TypeVar("_AccumulatorT", bound="Accumulator")
+
+
+def histograms(outcomes: NDArray[Any]) -> List[Histogram]:
+    """Count the outcomes of each state column of a batch."""
+    counts: List[Histogram] = []
+
+    for column in outcomes.T:
+        if column.dtype == object:
+            counts.append(dict(Counter(column.tolist())))
+        else:
+            values, totals = np.unique(column, return_counts=True)
+            counts.append(
+                {value: int(totals[i]) for i, value in enumerate(values.tolist())}
+            )
+
+    return counts
+
+
+def add_histogram(target: Histogram, source: Mapping[Any, int]) -> None:
+    """Add the counts of one histogram into another in place."""
+    for value, count in source.items():
+        target[value] = target.get(value, 0) + count
+
+
+def chi_square_uniform(
+    histogram: Mapping[Any, int], choices: Optional[Iterable[Any]] = None
+) -> float:
+    """Return Pearson's chi-square statistic against a uniform distribution.
+
+    ``choices`` lists every possible outcome so that unseen ones count as
+    zero; by default only observed outcomes are considered.
+    """
+    categories = list(histogram) if choices is None else list(choices)
+    if not categories:
+        raise ValueError("Need at least one category.")
+
+    observed = np.array([histogram.get(c, 0) for c in categories], dtype=float)
+    expected = observed.sum() / len(categories)
+    if expected == 0:
+        raise ValueError("Need at least one observation.")
+
+    return float(((observed - expected) ** 2 / expected).sum())
+
+
+class Accumulator(ABC):
+    """Abstract base class for statistics updated one step or batch at a time."""
+
+    @abstractmethod
+    def update(self, row: Sequence[Any]) -> None:
+        """Fold one step's state values into the statistic."""
+        pass
+
+    @abstractmethod
+    def update_batch(self, outcomes: NDArray[Any]) -> None:
+        """Fold a ``(steps, states)`` outcome array into the statistic."""
+        pass
+
+    @abstractmethod
+    def merge(self: _AccumulatorT, other: _AccumulatorT) -> None:
+        """Combine another accumulator's observations into this one."""
+        pass
+
+
+class ChoiceCounter(Accumulator):
+    """Counts how often each choice occurred, per state."""
+
+    def __init__(self) -> None:
+        """Initialize with no observations."""
+        self.counts: List[Histogram] = []
+
+    def _grow(self, n_states: int) -> None:
+        """Make room for ``n_states`` histograms."""
+        for _ in range(n_states - len(self.counts)):
+            self.counts.append({})
+
+    def update(self, row: Sequence[Any]) -> None:
+        """Count one step's values."""
+        self._grow(len(row))
+        for index, value in enumerate(row):
+            counts = self.counts[index]
+            counts[value] = counts.get(value, 0) + 1
+
+    def update_batch(self, outcomes: NDArray[Any]) -> None:
+        """Count a batch of outcomes, column by column."""
+        self.merge_histograms(histograms(outcomes))
+
+    def merge_histograms(self, counts: Sequence[Mapping[Any, int]]) -> None:
+        """Add per-state histograms into the counter."""
+        self._grow(len(counts))
+        for index, histogram in enumerate(counts):
+            add_histogram(self.counts[index], histogram)
+
+    def merge(self, other: "ChoiceCounter") -> None:
+        """Add another counter's histograms into this one."""
+        self.merge_histograms(other.counts)
+
+    def chi_square(self, index: int, choices: Optional[Iterable[Any]] = None) -> float:
+        """Return the chi-square statistic of one state against uniform."""
+        return chi_square_uniform(self.counts[index], choices)
+
+
+class RunningMoments(Accumulator):
+    """Welford mean and variance of numeric state values, per state."""
+
+    def __init__(self) -> None:
+        """Initialize with no observations."""
+        self.count: int = 0
+        self.mean: NDArray[np.float64] = np.zeros(0)
+        self._m2: NDArray[np.float64] = np.zeros(0)
+
+    def update(self, row: Sequence[Any]) -> None:
+        """Fold one step's values in with Welford's update."""
+        x = np.asarray(row, dtype=float)
+        if self.count == 0:
+            self.mean = np.zeros_like(x)
+            self._m2 = np.zeros_like(x)
+
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+
+    def update_batch(self, outcomes: NDArray[Any]) -> None:
+        """Fold a batch in by combining its moments with the running ones."""
+        if len(outcomes) == 0:
+            return
+
+        x = np.asarray(outcomes, dtype=float)
+        batch = RunningMoments()
+        batch.count = len(x)
+        batch.mean = x.mean(axis=0)
+        batch._m2 = ((x - batch.mean) ** 2).sum(axis=0)
+
+        self.merge(batch)
+
+    def merge(self, other: "RunningMoments") -> None:
+        """Combine moments with Chan et al.'s parallel formula."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count = other.count
+            self.mean = other.mean.copy()
+            self._m2 = other._m2.copy()
+            return
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 = self._m2 + other._m2 + delta**2 * self.count * other.count / total
+        self.mean = self.mean + delta * other.count / total
+        self.count = total
+
+    def variance(self, ddof: int = 0) -> NDArray[np.float64]:
+        """Return the per-state variance."""
+        if self.count <= ddof:
+            raise ValueError("Not enough observations for the requested ddof.")
+        return self._m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 0) -> NDArray[np.float64]:
+        """Return the per-state standard deviation."""
+        return np.sqrt(self.variance(ddof))
+
+
+class DiceSumDistribution(Accumulator):
+    """Distribution of the sum of all state values per step (e.g. dice)."""
+
+    def __init__(self) -> None:
+        """Initialize with no observations."""
+        self.counts: Histogram = {}
+
+    @property
+    def count(self) -> int:
+        """Return the number of observed steps."""
+        return sum(self.counts.values())
+
+    def update(self, row: Sequence[Any]) -> None:
+        """Count one step's total."""
+        total = sum(row)
+        self.counts[total] = self.counts.get(total, 0) + 1
+
+    def update_batch(self, outcomes: NDArray[Any]) -> None:
+        """Count the totals of a batch of steps."""
+        if len(outcomes) == 0:
+            return
+        (totals,) = histograms(outcomes.sum(axis=1, keepdims=True))
+        add_histogram(self.counts, totals)
+
+    def merge(self, other: "DiceSumDistribution") -> None:
+        """Add another distribution's counts into this one."""
+        add_histogram(self.counts, other.counts)
+
+    def pmf(self) -> Dict[Any, float]:
+        """Return the empirical probability of each total, sorted by total."""
+        count = self.count
+        return {total: self.counts[total] / count for total in sorted(self.counts)}
@@ -1,8 +1,11 @@
 """Module contains simulations of chance-based events."""
 
+from typing import Optional
+
 from games.catalog.simulation.base import Simulation
 from games.primitive.action.random import RandomChoiceAction
 from games.primitive.actor.base import SimpleNonPlayer
+from games.primitive.rng.base import RandomStream
 from games.primitive.rule.random import RandomChoiceRule
 from games.primitive.state.discrete import ChoiceState
 
@@ -24,7 +27,12 @@ class CoinFlip(Simulation):
 class DiceRoll(Simulation):
     """A simulation of rolling multiple dice using atomic states and rules."""
 
-    def __init__(self, num_dice: int = 1, num_sides: int = 6) -> None:
+    def __init__(
+        self,
+        num_dice: int = 1,
+        num_sides: int = 6,
+        rng: Optional[RandomStream] = None,
+    ) -> None:
         """Initialize the simulation with a specified number of dice."""
         # check correct parameters
         if num_dice < 1:
@@ -37,7 +45,7 @@ class DiceRoll(Simulation):
         self.num_sides = num_sides
 
         # register
-        super().__init__()
+        super().__init__(rng=rng)
 
     def _register_components(self) -> None:
         """Setup the dice roll states, rules, and actors."""
@@ -11,12 +11,20 @@ from games.primitive.state.base import State
 class Action(ABC):
     """Abstract base class for all actions."""
 
+    __slots__ = ("_executor", "_valid", "_invalidated")
+
     def __init__(self) -> None:
         """Initialize executor function to default None value."""
         self._executor: Optional[Callable[[State], None]] = None
         self._valid: bool = False
         self._invalidated: bool = False
 
+    def reset(self) -> None:
+        """Return the action to its unresolved state so it can be reused."""
+        self._executor = None
+        self._valid = False
+        self._invalidated = False
+
     @property
     def is_valid(self) -> bool:
         """Check whether the action has passed validation."""
@@ -0,0 +1,51 @@
+"""Defines a pool that recycles resolved actions instead of reallocating."""
+
+from typing import Dict
+from typing import List
+from typing import Type
+from typing import TypeVar
+from typing import cast
+
+from games.primitive.action.base import Action
+
+
+_ActionT = TypeVar("_ActionT", bound=Action)
+
+
+class ActionPool:
+    """Keeps reset actions per action type for actors to reuse."""
+
+    def __init__(self, max_size: int = 16) -> None:
+        """Initialize with the maximum number of idle actions per type."""
+        if max_size < 1:
+            raise ValueError("Pool size must be positive.")
+        self.max_size = max_size
+        self._idle: Dict[Type[Action], List[Action]] = {}
+        self.created: int = 0
+        self.reused: int = 0
+
+    def acquire(self, action_type: Type[_ActionT]) -> _ActionT:
+        """Return an idle action of the given type, or a new one."""
+        idle = self._idle.get(action_type)
+
+        if idle:
+            self.reused += 1
+            return cast(_ActionT, idle.pop())
+
+        self.created += 1
+        return action_type()
+
+    def release(self, action: Action) -> None:
+        """Reset an action and keep it for reuse, if there is room."""
+        idle = self._idle.setdefault(type(action), [])
+
+        # never hand out the same object twice
+        if len(idle) >= self.max_size or action in idle:
+            return
+
+        action.reset()
+        idle.append(action)
+
+    def __len__(self) -> int:
+        """Return the number of idle actions across all types."""
+        return sum(len(idle) for idle in self._idle.values())
@@ -6,6 +6,8 @@ from games.primitive.action.base import Action
 class RandomChoiceAction(Action):
     """Action representing a random selection from a ChoiceState's options."""
 
+    __slots__ = ()
+
     def describe(self) -> str:
         """Description of the random choice action."""
         return "Randomly select one of the available choices from the state."
@@ -2,15 +2,30 @@
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Optional
 from typing import Type
+from typing import TypeVar
 
 from games.primitive.action.base import Action
+from games.primitive.action.pool import ActionPool
 from games.primitive.state.base import State
 
 
+_ActionT = TypeVar("_ActionT", bound=Action)
+
+
 class Actor(ABC):
     """Abstract base class for all entities capable of generating actions."""
 
+    # set by the owning simulation to recycle actions
+    pool: Optional[ActionPool] = None
+
+    def _new_action(self, action_type: Type[_ActionT]) -> _ActionT:
+        """Instantiate an action, taking it from the pool if there is one."""
+        if self.pool is not None:
+            return self.pool.acquire(action_type)
+        return action_type()
+
     @abstractmethod
     def decide(self, state: State) -> Action:
         """Decide on an action to take based on the current state."""
@@ -40,4 +55,4 @@ class SimpleNonPlayer(NonPlayer):
 
     def decide(self, state: State) -> Action:
         """Always instantiate and return the same action type."""
-        return self.action_type()
+        return self._new_action(self.action_type)
@@ -1,15 +1,15 @@
 """Defines actors that make randomized decisions."""
 
-import random
 from typing import List
 from typing import Type
 
 from games.primitive.action.base import Action
 from games.primitive.actor.base import Actor
+from games.primitive.rng.stochastic import Stochastic
 from games.primitive.state.base import State
 
 
-class RandomActor(Actor):
+class RandomActor(Actor, Stochastic):
     """An actor that randomly selects an available action."""
 
     def __init__(self, possible_actions: List[Type[Action]]) -> None:
@@ -20,5 +20,5 @@ class RandomActor(Actor):
 
     def decide(self, state: State) -> Action:
         """Randomly instantiate and return one of the possible action types."""
-        action_cls = random.choice(self.possible_actions)
-        return action_cls()
+        action_cls = self.rng.choice(self.possible_actions)
+        return self._new_action(action_cls)
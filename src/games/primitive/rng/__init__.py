@@ -0,0 +1 @@
+"""Defines the random number streams that drive stochastic components."""
@@ -0,0 +1,69 @@
+"""Base module for defining the abstract base class (ABC) for random streams."""
+
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import TypeVar
+from typing import Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+# Anything accepted as a seed: entropy, or an explicit SeedSequence
+SeedLike = Union[None, int, Sequence[int], np.random.SeedSequence]
+
+_T = TypeVar("_T")
+_StreamT = TypeVar("_StreamT", bound="RandomStream")
+
+
+class RandomStream(ABC):
+    """Abstract base class for seedable, splittable random number streams."""
+
+    def __init__(self, seed: SeedLike = None) -> None:
+        """Initialize the stream from a seed or a SeedSequence."""
+        if isinstance(seed, np.random.SeedSequence):
+            self._seed_sequence = seed
+        else:
+            self._seed_sequence = np.random.SeedSequence(seed)
+
+    @property
+    def seed_sequence(self) -> np.random.SeedSequence:
+        """Return the SeedSequence the stream was created from."""
+        return self._seed_sequence
+
+    @abstractmethod
+    def randbelow(self, n: int) -> int:
+        """Return a uniformly random integer in ``[0, n)``."""
+        pass
+
+    @abstractmethod
+    def random(self) -> float:
+        """Return a uniformly random float in ``[0, 1)``."""
+        pass
+
+    @property
+    @abstractmethod
+    def generator(self) -> np.random.Generator:
+        """Return a NumPy generator for bulk draws from this stream."""
+        pass
+
+    def choice(self, seq: Sequence[_T]) -> _T:
+        """Return a uniformly random element of a non-empty sequence."""
+        return seq[self.randbelow(len(seq))]
+
+    def integers(self, n: int, size: int) -> NDArray[np.int64]:
+        """Return ``size`` uniformly random integers in ``[0, n)`` at once."""
+        return self.generator.integers(n, size=size)
+
+    def spawn(self: _StreamT, n: int) -> List[_StreamT]:
+        """Split off ``n`` statistically independent child streams."""
+        return [type(self)(child) for child in self._seed_sequence.spawn(n)]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the stream."""
+        entropy: Optional[Any] = self._seed_sequence.entropy
+        return f"<{self.__class__.__name__}: entropy={entropy!r}>"
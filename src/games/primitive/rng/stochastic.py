@@ -0,0 +1,33 @@
+"""Defines the mixin for components that draw random numbers."""
+
+from typing import Optional
+
+from games.primitive.rng.base import RandomStream
+from games.primitive.rng.stream import PythonRandomStream
+
+
+_default_stream: Optional[RandomStream] = None
+
+
+def default_stream() -> RandomStream:
+    """Return the shared, unseeded stream used by unbound components."""
+    global _default_stream
+    if _default_stream is None:
+        _default_stream = PythonRandomStream()
+    return _default_stream
+
+
+class Stochastic:
+    """Mixin for rules and actors that draw from a bound RandomStream."""
+
+    _rng: Optional[RandomStream] = None
+
+    @property
+    def rng(self) -> RandomStream:
+        """Return the bound stream, or the shared default stream."""
+        return self._rng if self._rng is not None else default_stream()
+
+    @rng.setter
+    def rng(self, stream: RandomStream) -> None:
+        """Bind the stream this component draws from."""
+        self._rng = stream
@@ -0,0 +1,79 @@
+"""Defines random streams backed by the standard library and by NumPy."""
+
+import random
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from games.primitive.rng.base import RandomStream
+from games.primitive.rng.base import SeedLike
+
+
+class PythonRandomStream(RandomStream):
+    """Random stream backed by a private ``random.Random`` instance."""
+
+    def __init__(self, seed: SeedLike = None) -> None:
+        """Initialize the stream and its private Mersenne Twister."""
+        super().__init__(seed)
+        state = self._seed_sequence.generate_state(4, dtype=np.uint64)
+        self._random = random.Random(int.from_bytes(state.tobytes(), "little"))
+        self._generator: Optional[np.random.Generator] = None
+
+    def randbelow(self, n: int) -> int:
+        """Return a uniformly random integer in ``[0, n)``."""
+        return self._random.randrange(n)
+
+    def random(self) -> float:
+        """Return a uniformly random float in ``[0, 1)``."""
+        return self._random.random()
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """Return a NumPy generator seeded once from this stream."""
+        if self._generator is None:
+            self._generator = np.random.default_rng(self._random.getrandbits(128))
+        return self._generator
+
+
+class NumpyRandomStream(RandomStream):
+    """Random stream backed by ``numpy.random.Generator``.
+
+    Scalar draws are served from a block of uniforms generated in one call,
+    so per-draw cost is an index increment rather than a generator call.
+    """
+
+    def __init__(self, seed: SeedLike = None, block_size: int = 4096) -> None:
+        """Initialize the stream with the size of its pre-generated blocks."""
+        if block_size < 1:
+            raise ValueError("Block size must be positive.")
+        super().__init__(seed)
+        self._generator = np.random.default_rng(self._seed_sequence)
+        self._block_size = block_size
+        self._block: NDArray[np.float64] = np.empty(0)
+        self._position = 0
+
+    def _next_uniform(self) -> float:
+        """Return the next uniform from the current block, refilling if empty."""
+        if self._position == len(self._block):
+            self._block = self._generator.random(self._block_size)
+            self._position = 0
+
+        u = float(self._block[self._position])
+        self._position += 1
+        return u
+
+    def randbelow(self, n: int) -> int:
+        """Return a uniformly random integer in ``[0, n)``."""
+        if n < 1:
+            raise ValueError("Upper bound must be positive.")
+        return int(self._next_uniform() * n)
+
+    def random(self) -> float:
+        """Return a uniformly random float in ``[0, 1)``."""
+        return self._next_uniform()
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """Return the backing NumPy generator."""
+        return self._generator
@@ -2,13 +2,28 @@
 
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+import numpy as np
+from numpy.typing import NDArray
 
 from games.primitive.action.base import Action
 from games.primitive.state.base import State
 
 
+# Applies a resolved action to a state
+Executor = Callable[[State], None]
+
+# Draws ``n`` outcomes for a state in one call using the given generator
+BatchExecutor = Callable[[np.random.Generator, int], NDArray[Any]]
+
+
 class Rule(ABC):
     """Abstract base class for rules that resolve actions."""
 
@@ -40,19 +55,59 @@ class ValidationRule(Rule, ABC):
 
 
 class ExecutorRule(Rule, ABC):
-    """Abstract base class for rules that only assigns an executor to an action."""
+    """Abstract base class for rules that only assigns an executor to an action.
+
+    Rules whose executors depend only on the action and state *types* can set
+    ``reuse_executors``: the executor is then bound once per type pair and
+    the same callable is handed to every later action, so resolving an action
+    allocates no functions.
+    """
+
+    # bind once per (action type, state type) pair and reuse the executor
+    reuse_executors: bool = False
+
+    _executors: Optional[Dict[Tuple[Type[Action], Type[State]], Executor]] = None
 
     @abstractmethod
-    def bind_executor(self, action: Action, state: State) -> Callable[[State], None]:
+    def bind_executor(self, action: Action, state: State) -> Executor:
         """Return the executor function to apply to the action."""
         pass
 
+    def executor_for(self, action: Action, state: State) -> Executor:
+        """Return the executor for the pair, binding it only when needed."""
+        if not self.reuse_executors:
+            return self.bind_executor(action, state)
+
+        executors = self._executors
+        if executors is None:
+            executors = self._executors = {}
+
+        key = (type(action), type(state))
+        executor = executors.get(key)
+        if executor is None:
+            executor = executors[key] = self.bind_executor(action, state)
+
+        return executor
+
+    def clear_executors(self) -> None:
+        """Forget all reusable executors bound so far."""
+        self._executors = None
+
     def apply(self, action: Action, state: State) -> None:
         """Apply the executor rule to the given action."""
-        action.executor = self.bind_executor(action, state)
+        action.executor = self.executor_for(action, state)
         action.validate()
 
 
+class VectorizedRule(Rule, ABC):
+    """Abstract base class for rules that can also resolve actions in bulk."""
+
+    @abstractmethod
+    def bind_batch_executor(self, action: Action, state: State) -> BatchExecutor:
+        """Return a function that draws many independent outcomes at once."""
+        pass
+
+
 class CompoundRule(Rule, ABC):
     """Abstract base class for rule that applies multiple rules to an action."""
 
@@ -1,27 +1,47 @@
 """Module defining rules for random decision-making."""
 
-import random
-from typing import Callable
+from typing import Any
+from typing import cast
+
+import numpy as np
+from numpy.typing import NDArray
 
 from games.primitive.action.base import Action
 from games.primitive.action.random import RandomChoiceAction
+from games.primitive.rng.stochastic import Stochastic
+from games.primitive.rule.base import BatchExecutor
+from games.primitive.rule.base import Executor
 from games.primitive.rule.base import ExecutorRule
+from games.primitive.rule.base import VectorizedRule
 from games.primitive.state.base import State
 from games.primitive.state.discrete import ChoiceState
 
 
-class RandomChoiceRule(ExecutorRule):
+class RandomChoiceRule(ExecutorRule, VectorizedRule, Stochastic):
     """A rule that randomly selects a valid choice from the state's options."""
 
     def accepts(self, action: Action, state: State) -> bool:
         """Check if the rule can handle this action and state."""
         return isinstance(action, RandomChoiceAction) and isinstance(state, ChoiceState)
 
-    def bind_executor(self, action: Action, state: State) -> Callable[[State], None]:
+    # the executor reads the rule's stream on every call, so one suffices
+    reuse_executors = True
+
+    def bind_executor(self, action: Action, state: State) -> Executor:
         """Return an executor that randomly chooses from state's values."""
+        return self._choose
+
+    def _choose(self, state: State) -> None:
+        """Executor for randomly choosing from available state values."""
+        choice_state = cast(ChoiceState, state)
+        choice_state.set_code(choice_state.sample_code(self.rng.randbelow))
+
+    def bind_batch_executor(self, action: Action, state: State) -> BatchExecutor:
+        """Return a batch executor drawing uniformly from state's values."""
+        choices = cast(ChoiceState, state).values_array
 
-        def executor(state: State) -> None:
-            """Executor for randomly choosing from available state values."""
-            state.value = random.choice(list(state.available_values))
+        def batch_executor(rng: np.random.Generator, n: int) -> NDArray[Any]:
+            """Draw ``n`` values uniformly from the state's choices."""
+            return choices[rng.integers(len(choices), size=n)]
 
-        return executor
+        return batch_executor
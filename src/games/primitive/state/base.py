@@ -29,6 +29,14 @@ class State(ABC):
         """Update the value of the state."""
         pass
 
+    def snapshot(self) -> Any:
+        """Return a compact token of the current value, for :meth:`restore`."""
+        return self._value
+
+    def restore(self, snapshot: Any) -> None:
+        """Put back the value a :meth:`snapshot` token was taken of."""
+        self._value = snapshot
+
     @property
     def value(self) -> Any:
         """Return the current value of the state."""
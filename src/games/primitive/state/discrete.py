@@ -1,13 +1,57 @@
 """Module defining atomic state classes for discrete choices."""
 
+import random
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
 from typing import Set
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import NDArray
 
 from games.primitive.state.base import State
+from games.primitive.state.zobrist import ZobristHash
+from games.primitive.state.zobrist import zobrist_keys
+
+
+# Code of a ChoiceState that holds no value
+NO_CHOICE: int = -1
+
+
+def _ordered(choices: Set[Any]) -> Tuple[Any, ...]:
+    """Return the choices in a stable order (sorted whenever comparable)."""
+    try:
+        return tuple(sorted(choices))
+    except TypeError:
+        return tuple(choices)
+
+
+def _as_array(values: Tuple[Any, ...]) -> NDArray[Any]:
+    """Return a read-only array of values, native dtype when homogeneous."""
+    array: NDArray[Any] = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+
+    # keep native dtypes for homogeneous scalar choices (e.g. all ints)
+    if len({type(value) for value in values}) == 1:
+        native = np.asarray(values)
+        if native.shape == array.shape and native.dtype != object:
+            array = native
+
+    array.flags.writeable = False
+    return array
 
 
 class ChoiceState(State):
-    """A state representing a single choice from a predefined set of options."""
+    """A state representing a single choice from a predefined set of options.
+
+    The choices are indexed once at construction: the current value is stored
+    as an integer code into an immutable, ordered tuple of choices, so that
+    sampling draws an index instead of materializing the choice set.
+    """
 
     def __init__(self, choices: Set[Any]) -> None:
         """Initialize the state with a predefined set of valid choices."""
@@ -17,24 +61,117 @@ class ChoiceState(State):
             )
         super().__init__()
         self._choices = choices
+        self._values: Tuple[Any, ...] = _ordered(choices)
+        self._index: Dict[Any, int] = {
+            value: code for code, value in enumerate(self._values)
+        }
+        self._array: NDArray[Any] = _as_array(self._values)
+        self._code: int = NO_CHOICE
+
+        # Zobrist keys by code + 1 and the hash they are folded into, if any
+        self._keys: Optional[List[int]] = None
+        self._hasher: Optional[ZobristHash] = None
+
+    def bind_hash(self, hasher: ZobristHash, position: int) -> None:
+        """Fold the current value into a hash, and every later change too.
+
+        The keys of the state's choices depend only on its ``position`` and
+        are drawn once, then shared with every copy of the state.
+        """
+        if self._keys is None:
+            self._keys = zobrist_keys(position, len(self._values))
+
+        self._hasher = hasher
+        hasher.value ^= self._keys[self._code + 1]
+
+    def _rehash(self, code: int) -> None:
+        """Swap the key of the current code for that of a new one."""
+        assert self._hasher is not None and self._keys is not None
+        self._hasher.value ^= self._keys[self._code + 1] ^ self._keys[code + 1]
 
     def reset(self) -> None:
         """Reset the state to an initial value (None)."""
-        self._value = None
+        if self._hasher is not None:
+            self._rehash(NO_CHOICE)
+        self._code = NO_CHOICE
 
     def is_valid(self) -> bool:
         """Check if the current state value is a valid choice."""
-        return self._value in self._choices
+        return self._code != NO_CHOICE
 
     def update(self, new_value: Any) -> None:
         """Update the value of the state, ensuring it's a valid choice."""
-        if new_value not in self._choices:
+        code = self._index.get(new_value)
+        if code is None:
             raise ValueError(
                 f"Invalid choice: {new_value}. Allowed values: {self._choices}"
             )
-        self._value = new_value
+        if self._hasher is not None:
+            self._rehash(code)
+        self._code = code
+
+    def snapshot(self) -> int:
+        """Return the code of the current value, as a compact snapshot."""
+        return self._code
+
+    def restore(self, snapshot: int) -> None:
+        """Put back the value of a code snapshot (``NO_CHOICE`` included)."""
+        if self._hasher is not None:
+            self._rehash(snapshot)
+        self._code = snapshot
+
+    @property
+    def value(self) -> Any:
+        """Return the current value of the state."""
+        return None if self._code == NO_CHOICE else self._values[self._code]
+
+    @value.setter
+    def value(self, new_value: Any) -> None:
+        """Set the value of the state."""
+        self.update(new_value)
 
     @property
     def available_values(self) -> Set[Any]:
         """Return the available choices for this state."""
         return self._choices
+
+    @property
+    def values(self) -> Tuple[Any, ...]:
+        """Return the choices in code order."""
+        return self._values
+
+    @property
+    def values_array(self) -> NDArray[Any]:
+        """Return a read-only array of the choices in code order."""
+        return self._array
+
+    @property
+    def size(self) -> int:
+        """Return the number of choices."""
+        return len(self._values)
+
+    @property
+    def code(self) -> int:
+        """Return the code of the current value, or ``NO_CHOICE``."""
+        return self._code
+
+    def set_code(self, code: int) -> None:
+        """Update the state by code, ensuring it indexes a valid choice."""
+        if not 0 <= code < len(self._values):
+            raise ValueError(
+                f"Invalid choice code: {code}. Allowed codes: 0..{self.size - 1}"
+            )
+        if self._hasher is not None:
+            self._rehash(code)
+        self._code = code
+
+    def index(self, value: Any) -> int:
+        """Return the code of a choice."""
+        try:
+            return self._index[value]
+        except KeyError:
+            raise ValueError(f"Not a choice: {value}") from None
+
+    def sample_code(self, randbelow: Callable[[int], int] = random.randrange) -> int:
+        """Draw a uniformly random choice code without building any sequence."""
+        return randbelow(len(self._values))
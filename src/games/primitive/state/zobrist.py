@@ -0,0 +1,34 @@
+"""Module defining Zobrist keys and running hashes of choice states."""
+
+from typing import List
+
+import numpy as np
+
+
+# Seed of the key tables, fixed so that equal positions always hash alike
+ZOBRIST_SEED: int = 0x5EED
+
+
+def zobrist_keys(position: int, size: int) -> List[int]:
+    """Return the 64-bit keys of the codes of the state at a position.
+
+    The first key belongs to ``NO_CHOICE`` and is zero, so unset states add
+    nothing to a hash; the others are random, one per choice code.
+    """
+    rng = np.random.default_rng([ZOBRIST_SEED, position])
+    keys: List[int] = rng.integers(0, 2**64, size=size, dtype=np.uint64).tolist()
+    return [0, *keys]
+
+
+class ZobristHash:
+    """Running XOR of the keys of the current values of a set of states."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int = 0) -> None:
+        """Initialize the hash, empty by default."""
+        self.value = value
+
+    def __repr__(self) -> str:
+        """Return a string representation of the hash."""
+        return f"<{self.__class__.__name__}: {self.value:#018x}>"
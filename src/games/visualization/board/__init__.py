@@ -1 +1,15 @@
 """Board-based visualization layer for game state representations."""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_exports
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .parallel import render_many
+
+
+__all__ = ["render_many"]
+
+# matplotlib is only imported once something is rendered
+__getattr__, __dir__ = lazy_exports(__name__, {"render_many": ".parallel"})
@@ -1,15 +1,28 @@
 """Adapter for converting python-chess game state into visualization grids."""
 
+from typing import Iterator
 from typing import Optional
 
 import chess
 import numpy as np
 
 from ..cells.chess import ChessPiece
+from ..diff import GridDiff
+from ..diff import diff_positions
 from ..protocol import BoardProtocol
+from ..types import Codebook
+from ..types import EncodedGrid
 from ..types import Grid
 
 
+# Pieces by code: white pawn to king are 1-6, black pawn to king are 7-12
+CHESS_CODEBOOK: Codebook = (None,) + tuple(
+    ChessPiece.of(chess.Piece(piece_type, color))
+    for color in (chess.WHITE, chess.BLACK)
+    for piece_type in chess.PIECE_TYPES
+)
+
+
 class ChessBoardWrapper:
     """Wraps a python-chess board into a BoardProtocol-compatible interface."""
 
@@ -37,6 +50,52 @@ def chess_board_to_grid(board: BoardProtocol) -> Grid:
             piece = board.get(r, c)
 
             if piece is not None:
-                grid[r, c] = ChessPiece(piece)
+                grid[r, c] = ChessPiece.of(piece)
 
     return grid
+
+
+def chess_board_to_codes(board: chess.Board) -> EncodedGrid:
+    """Encode a chess board as a grid of CHESS_CODEBOOK codes.
+
+    The grid is built from the board's piece bitboards, without visiting
+    squares one by one.
+    """
+    masks = np.array(
+        [
+            board.pieces_mask(piece_type, color)
+            for color in (chess.WHITE, chess.BLACK)
+            for piece_type in chess.PIECE_TYPES
+        ],
+        dtype="<u8",
+    )
+
+    # one row of 64 square bits per bitboard, square a1 first
+    bits = np.unpackbits(masks.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    codes = np.arange(1, len(masks) + 1, dtype=np.int8) @ bits
+
+    return codes.astype(np.int8).reshape(8, 8)
+
+
+def chess_positions(board: chess.Board) -> Iterator[chess.Board]:
+    """Yield every position of a board's move stack, starting from its root.
+
+    A single replay board is advanced and yielded each time, so every
+    position should be consumed (e.g. converted to a grid) before the next.
+    """
+    replay = board.root()
+    yield replay
+
+    for move in board.move_stack:
+        replay.push(move)
+        yield replay
+
+
+def chess_diffs(board: chess.Board) -> Iterator[GridDiff]:
+    """Yield the encoded difference made by every move of a board's move stack.
+
+    Together with the encoded root position, the diffs replay the whole game
+    (see :func:`~games.visualization.board.diff.replay`) while holding only
+    the squares each move touched.
+    """
+    return diff_positions(chess_board_to_codes(b) for b in chess_positions(board))
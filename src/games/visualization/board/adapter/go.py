@@ -1,15 +1,29 @@
 """Adapter for converting sgfmill game state into visualization grids."""
 
+from typing import Iterator
 from typing import Optional
 
 import numpy as np
 from sgfmill import boards
+from sgfmill import sgf
+from sgfmill import sgf_moves
 
 from ..cells.go import GoStone
+from ..diff import GridDiff
+from ..diff import diff_positions
 from ..protocol import BoardProtocol
+from ..types import Codebook
+from ..types import EncodedGrid
 from ..types import Grid
 
 
+# Stones by code: 1 is black, 2 is white
+GO_CODEBOOK: Codebook = (None, GoStone.of("black"), GoStone.of("white"))
+
+# codes of sgfmill's point colours
+_GO_CODES = {None: 0, "b": 1, "w": 2}
+
+
 class GoBoardWrapper:
     """Wraps sgfmill Go board state into a BoardProtocol-compatible interface."""
 
@@ -42,8 +56,45 @@ def go_board_to_grid(board: BoardProtocol) -> Grid:
             color = board.get(r, c)
 
             if color == "b":
-                grid[r, c] = GoStone("black")
+                grid[r, c] = GoStone.of("black")
             elif color == "w":
-                grid[r, c] = GoStone("white")
+                grid[r, c] = GoStone.of("white")
 
     return grid
+
+
+def go_board_to_codes(board: boards.Board) -> EncodedGrid:
+    """Encode a Go board as a grid of GO_CODEBOOK codes."""
+    side = int(board.side)
+
+    # sgfmill keeps its points as nested lists, so read them in one flat pass
+    points = (_GO_CODES[colour] for row in board.board for colour in row)
+    codes: EncodedGrid = np.fromiter(points, dtype=np.int8, count=side * side)
+
+    return codes.reshape(side, side)
+
+
+def go_positions(game: sgf.Sgf_game) -> Iterator[boards.Board]:
+    """Yield the setup position of an SGF game and the position after each move.
+
+    A single board is advanced and yielded each time, so every position should
+    be consumed (e.g. converted to a grid) before the next. Passes repeat the
+    previous position.
+    """
+    board, plays = sgf_moves.get_setup_and_moves(game)
+    yield board
+
+    for colour, move in plays:
+        if move is not None:
+            row, col = move
+            board.play(row, col, colour)
+        yield board
+
+
+def go_diffs(game: sgf.Sgf_game) -> Iterator[GridDiff]:
+    """Yield the encoded difference made by every move of an SGF game.
+
+    Captures show up as removed stones. Passes yield empty diffs, so there
+    is still one diff per move.
+    """
+    return diff_positions(go_board_to_codes(b) for b in go_positions(game))
@@ -1,12 +1,30 @@
 """Background rendering strategies for board visualization."""
 
-from .base import Background
-from .checkerboard import CheckerboardBackground
-from .solid import SolidBackground
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_exports
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .base import Background
+    from .cache import BackgroundCache
+    from .checkerboard import CheckerboardBackground
+    from .solid import SolidBackground
 
 
 __all__ = [
     "Background",
+    "BackgroundCache",
     "CheckerboardBackground",
     "SolidBackground",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Background": ".base",
+        "BackgroundCache": ".cache",
+        "CheckerboardBackground": ".checkerboard",
+        "SolidBackground": ".solid",
+    },
+)
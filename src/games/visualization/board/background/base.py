@@ -3,6 +3,8 @@
 from abc import ABC
 from abc import abstractmethod
 from typing import Any
+from typing import Hashable
+from typing import Optional
 
 
 class Background(ABC):
@@ -12,3 +14,11 @@ class Background(ABC):
     def draw(self, ax: Any, size: int) -> None:
         """Draw the board background."""
         ...
+
+    def cache_key(self) -> Optional[Hashable]:
+        """Return what identifies the background's look, or None if uncacheable.
+
+        Backgrounds with equal keys must draw identically, so that a
+        rasterized copy of one can stand in for the other.
+        """
+        return None
@@ -0,0 +1,235 @@
+"""LRU cache of rasterized board backgrounds."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from matplotlib.ticker import FixedLocator
+from numpy.typing import NDArray
+
+from .base import Background
+
+
+def _subplot_layout() -> Tuple[float, float, float, float]:
+    """Return the subplot margins deciding where (and how large) axes end up."""
+    rc = mpl.rcParams
+    return (
+        rc["figure.subplot.left"],
+        rc["figure.subplot.right"],
+        rc["figure.subplot.bottom"],
+        rc["figure.subplot.top"],
+    )
+
+
+def _fixed_ticks(axis: Any) -> Optional[NDArray[Any]]:
+    """Return the ticks of an axis if they were set explicitly."""
+    if isinstance(axis.get_major_locator(), FixedLocator):
+        return np.asarray(axis.get_majorticklocs())
+    return None
+
+
+class _LayerImage(AxesImage):
+    """Raster covering its axes, copied pixel for pixel whenever it fits.
+
+    Resampling a full-axes image costs about as much as drawing most
+    backgrounds, so when the axes still show the raster's extent at its
+    size, the pixels are handed to the renderer as they are.
+    """
+
+    def __init__(self, ax: Any, pixels: NDArray[np.uint8], **kwargs: Any) -> None:
+        """Initialize with the top-down RGBA pixels of the background."""
+        super().__init__(ax, interpolation="nearest", **kwargs)
+        self.set_data(pixels)
+
+        # renderers expect the bottom row first
+        self._bottom_up = np.ascontiguousarray(pixels[::-1])
+
+    def draw(self, renderer: Any) -> None:
+        """Copy the raster into place, or resample it if it does not fit."""
+        ax = self.axes
+        height, width = self._bottom_up.shape[:2]
+        x0, y0 = int(round(ax.bbox.x0)), int(round(ax.bbox.y0))
+
+        fits = (
+            self.get_visible()
+            and not renderer.option_scale_image()
+            and (int(round(ax.bbox.width)), int(round(ax.bbox.height)))
+            == (width, height)
+            and np.allclose(self.get_extent(), (*ax.get_xlim(), *ax.get_ylim()))
+        )
+
+        if not fits:
+            super().draw(renderer)
+            return
+
+        gc = renderer.new_gc()
+        gc.set_clip_rectangle(ax.bbox)
+        renderer.draw_image(gc, x0, y0, self._bottom_up)
+        gc.restore()
+        self.stale = False
+
+
+@dataclass(frozen=True)
+class BackgroundLayer:
+    """A background rasterized once, with the axes state it set up."""
+
+    image: NDArray[np.uint8]
+    xlim: Tuple[float, float]
+    ylim: Tuple[float, float]
+    autoscale: Tuple[bool, bool]
+    aspect: Any
+    xticks: Optional[NDArray[Any]] = None
+    yticks: Optional[NDArray[Any]] = None
+    facecolor: Optional[Any] = None
+
+    def apply(self, ax: Any) -> None:
+        """Draw the layer onto an axes, as the background itself would."""
+        if self.facecolor is not None:
+            ax.set_facecolor(self.facecolor)
+
+        image = _LayerImage(ax, self.image, zorder=0)
+        ax.add_image(image)
+        image.set_extent((*self.xlim, *self.ylim))
+
+        # only ticks the background fixed are replayed, which may widen limits
+        if self.xticks is not None:
+            ax.set_xticks(self.xticks)
+        if self.yticks is not None:
+            ax.set_yticks(self.yticks)
+
+        ax.set_xlim(self.xlim)
+        ax.set_ylim(self.ylim)
+        ax.set_autoscalex_on(self.autoscale[0])
+        ax.set_autoscaley_on(self.autoscale[1])
+        ax.set_aspect(self.aspect)
+
+
+def rasterize(
+    background: Background,
+    size: int,
+    *,
+    figsize: Tuple[float, float],
+    dpi: float,
+) -> BackgroundLayer:
+    """Draw a background alone on an offscreen figure and keep its pixels.
+
+    The figure is laid out like a renderer's, so the raster matches the
+    pixel size of the axes it will be drawn into.
+    """
+    figure = Figure(figsize=figsize, dpi=dpi)
+    canvas: Any = FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+
+    facecolor = ax.get_facecolor()
+    background.draw(ax, size)
+    drawn_facecolor = ax.get_facecolor()
+
+    # the axes state is read before axis("off") below touches it
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    autoscale = (ax.get_autoscalex_on(), ax.get_autoscaley_on())
+    xticks, yticks = _fixed_ticks(ax.xaxis), _fixed_ticks(ax.yaxis)
+
+    # keep only what the background drew
+    figure.patch.set_visible(False)
+    ax.patch.set_visible(False)
+    ax.axis("off")
+    canvas.draw()
+
+    pixels = np.asarray(canvas.buffer_rgba())
+    height = pixels.shape[0]
+    x0, y0, x1, y1 = (int(round(v)) for v in ax.get_window_extent().extents)
+
+    return BackgroundLayer(
+        image=pixels[height - y1 : height - y0, x0:x1].copy(),
+        xlim=xlim,
+        ylim=ylim,
+        autoscale=autoscale,
+        aspect=ax.get_aspect(),
+        xticks=xticks,
+        yticks=yticks,
+        facecolor=drawn_facecolor if drawn_facecolor != facecolor else None,
+    )
+
+
+class BackgroundCache:
+    """Keeps the most recently used rasterized backgrounds.
+
+    Each distinct configuration (background look, board size, figure size,
+    dpi and subplot layout) is rasterized once; later renders paint the
+    stored image instead of redrawing the background. The least recently
+    used layers are evicted beyond ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        """Initialize an empty cache holding at most ``maxsize`` layers."""
+        if maxsize < 1:
+            raise ValueError("Cache must hold at least one layer.")
+
+        self.maxsize = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._layers: "OrderedDict[Hashable, BackgroundLayer]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached layers."""
+        return len(self._layers)
+
+    def layer(
+        self,
+        background: Background,
+        size: int,
+        *,
+        figsize: Tuple[float, float],
+        dpi: float,
+    ) -> Optional[BackgroundLayer]:
+        """Return the layer of a configuration, or None if it is uncacheable."""
+        identity = background.cache_key()
+        if identity is None:
+            return None
+
+        key = (identity, size, tuple(figsize), dpi, _subplot_layout())
+
+        layer = self._layers.get(key)
+        if layer is not None:
+            self.hits += 1
+            self._layers.move_to_end(key)
+            return layer
+
+        self.misses += 1
+        layer = self._layers[key] = rasterize(
+            background, size, figsize=figsize, dpi=dpi
+        )
+
+        if len(self._layers) > self.maxsize:
+            self._layers.popitem(last=False)
+
+        return layer
+
+    def draw(
+        self,
+        background: Background,
+        ax: Any,
+        size: int,
+        *,
+        figsize: Tuple[float, float],
+        dpi: float,
+    ) -> None:
+        """Draw a background from its cached layer, or directly if uncacheable."""
+        layer = self.layer(background, size, figsize=figsize, dpi=dpi)
+
+        if layer is None:
+            background.draw(ax, size)
+        else:
+            layer.apply(ax)
+
+    def clear(self) -> None:
+        """Drop every cached layer."""
+        self._layers.clear()
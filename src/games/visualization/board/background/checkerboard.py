@@ -1,6 +1,8 @@
 """Checkerboard background implementation for grid-based boards."""
 
 from typing import Any
+from typing import Hashable
+from typing import Optional
 
 import numpy as np
 
@@ -18,12 +20,15 @@ class CheckerboardBackground(Background):
         self.light = light
         self.dark = dark
 
+    def cache_key(self) -> Optional[Hashable]:
+        """Identify the checkerboard by its colors."""
+        return (type(self), tuple(self.light), tuple(self.dark))
+
     def draw(self, ax: Any, size: int) -> None:
         """Draw checkerboard background."""
-        board = np.zeros((size, size, 3))
+        rows, cols = np.indices((size, size))
+        light = ((rows + cols) % 2 == 0)[..., np.newaxis]
 
-        for r in range(size):
-            for c in range(size):
-                board[r, c] = self.light if (r + c) % 2 == 0 else self.dark
+        board = np.where(light, np.asarray(self.light), np.asarray(self.dark))
 
         ax.imshow(board, extent=[0, size, 0, size])
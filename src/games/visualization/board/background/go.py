@@ -2,10 +2,13 @@
 
 from typing import Any
 from typing import Dict
+from typing import Hashable
 from typing import List
+from typing import Optional
 from typing import Tuple
 
-from matplotlib.patches import Circle
+from matplotlib.collections import EllipseCollection
+from matplotlib.collections import LineCollection
 from matplotlib.patches import Rectangle
 
 from .base import Background
@@ -34,6 +37,10 @@ _STAR_POINTS: Dict[int, Tuple[Tuple[int, int], ...]] = {
 }
 
 
+# star point radius in board units
+STAR_RADIUS: float = 0.12
+
+
 def default_star_points(size: int) -> List[Tuple[int, int]]:
     """Return deduplicated star-point coordinates for a Go board size."""
     return list(dict.fromkeys(_STAR_POINTS.get(size, ())))
@@ -46,6 +53,10 @@ class GoBackground(Background):
         """Initialize Go board background."""
         self.color = color
 
+    def cache_key(self) -> Optional[Hashable]:
+        """Identify the background by its color."""
+        return (type(self), self.color)
+
     def draw(self, ax: Any, size: int) -> None:
         """Render the Go board background onto a matplotlib axis."""
         self._configure_axes(ax, size)
@@ -77,31 +88,41 @@ class GoBackground(Background):
         ax.add_patch(rect)
 
     def _draw_grid(self, ax: Any, size: int) -> None:
-        """Draw Go grid lines."""
-        for i in range(size):
-            ax.plot(
-                [0, size - 1],
-                [i, i],
-                color="black",
-                linewidth=1,
+        """Draw Go grid lines as a single collection."""
+        last = size - 1
+
+        # one segment per horizontal line, then one per vertical line
+        segments = [((0, i), (last, i)) for i in range(size)]
+        segments += [((i, 0), (i, last)) for i in range(size)]
+
+        ax.add_collection(
+            LineCollection(
+                segments,
+                colors="black",
+                linewidths=1,
                 zorder=1,
-            )
-            ax.plot(
-                [i, i],
-                [0, size - 1],
-                color="black",
-                linewidth=1,
-                zorder=1,
-            )
+            ),
+            autolim=False,
+        )
 
     def _draw_star_points(self, ax: Any, size: int) -> None:
-        """Draw star points (hoshi)."""
-        for r, c in default_star_points(size):
-            ax.add_patch(
-                Circle(
-                    (c, r),
-                    0.12,
-                    color="black",
-                    zorder=2,
-                )
-            )
+        """Draw star points (hoshi) as a single collection."""
+        points = default_star_points(size)
+
+        if not points:
+            return
+
+        ax.add_collection(
+            EllipseCollection(
+                widths=2 * STAR_RADIUS,
+                heights=2 * STAR_RADIUS,
+                angles=0.0,
+                units="xy",
+                offsets=[(c, r) for r, c in points],
+                offset_transform=ax.transData,
+                facecolors="black",
+                edgecolors="black",
+                zorder=2,
+            ),
+            autolim=False,
+        )
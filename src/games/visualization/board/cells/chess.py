@@ -1,9 +1,21 @@
 """Chess-specific renderable cell definitions."""
 
+from functools import lru_cache
 from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Sequence
+from typing import Tuple
 
 import chess
 import matplotlib.patheffects as pe
+from matplotlib.collections import PathCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
+
+from ..types import PlacedCell
 
 
 _piece_unicode = {
@@ -22,24 +34,70 @@ _piece_unicode = {
 }
 
 
+@lru_cache(maxsize=None)
+def _glyph_path(symbol: str, fontsize: float) -> Path:
+    """Return a glyph outline in points, centered on the origin."""
+    path = TextPath((0, 0), symbol, size=fontsize, prop=FontProperties("DejaVu Sans"))
+    extents = path.get_extents()
+
+    return path.transformed(
+        Affine2D().translate(
+            -(extents.x0 + extents.x1) / 2, -(extents.y0 + extents.y1) / 2
+        )
+    )
+
+
 class ChessPiece:
-    """Renderable representation of a chess piece for visualization."""
+    """Renderable representation of a chess piece for visualization.
+
+    Pieces hold no position, so one shared instance per piece kind is enough;
+    :meth:`of` returns it. Glyph, colours and outline are computed once.
+    """
+
+    __slots__ = ("piece", "_symbol", "_side", "_color", "_outline", "_effects")
+
+    _instances: ClassVar[Dict[str, "ChessPiece"]] = {}
 
     def __init__(self, piece: chess.Piece) -> None:
         """Initialize a renderable wrapper around a python-chess Piece."""
         self.piece = piece
 
+        self._symbol = _piece_unicode[piece.symbol()]
+        self._side = "white" if piece.color == chess.WHITE else "black"
+        self._color = "#e8e6df" if self._side == "white" else "#111111"
+        self._outline = "#111111" if self._side == "white" else "#f5f5f5"
+        self._effects = [pe.withStroke(linewidth=0.8, foreground=self._outline)]
+
+    @classmethod
+    def of(cls, piece: chess.Piece) -> "ChessPiece":
+        """Return the shared instance for a kind of piece."""
+        key = piece.symbol()
+        instance = cls._instances.get(key)
+
+        if instance is None:
+            instance = cls._instances[key] = cls(piece)
+
+        return instance
+
+    def __reduce__(self) -> Tuple[Any, Tuple[chess.Piece]]:
+        """Unpickle to the shared instance of the piece kind."""
+        return (type(self).of, (self.piece,))
+
     def render_symbol(self) -> str:
         """Return glyph based directly on python-chess symbol."""
-        return _piece_unicode[self.piece.symbol()]
+        return self._symbol
 
     def piece_color(self) -> str:
         """Return logical side."""
-        return "white" if self.piece.color == chess.WHITE else "black"
+        return self._side
 
     def render_color(self) -> str:
         """Return display color for the piece."""
-        return "#e8e6df" if self.piece_color() == "white" else "#111111"
+        return self._color
+
+    def outline_color(self) -> str:
+        """Return the color of the outline contrasting with the piece."""
+        return self._outline
 
     def draw(
         self,
@@ -51,21 +109,39 @@ class ChessPiece:
         """Draw chess piece scaled to board size."""
         fontsize = 280 / board_size
 
-        color = self.render_color()
-        outline = "#111111" if self.piece_color() == "white" else "#f5f5f5"
-
         text = ax.text(
             x,
             y,
-            self.render_symbol(),
+            self._symbol,
             ha="center",
             va="center",
-            color=color,
+            color=self._color,
             fontsize=fontsize,
             fontfamily="DejaVu Sans",
             zorder=3,
         )
 
-        text.set_path_effects([pe.withStroke(linewidth=0.8, foreground=outline)])
+        text.set_path_effects(self._effects)
+
+        return True
+
+    @classmethod
+    def draw_many(cls, ax: Any, pieces: Sequence[PlacedCell], board_size: int) -> bool:
+        """Draw all pieces as a single collection of glyph outlines."""
+        fontsize = 280 / board_size
+
+        # glyphs are sized in points, whatever the data scale
+        collection = PathCollection(
+            [_glyph_path(piece.render_symbol(), fontsize) for _, _, piece in pieces],
+            offsets=[(x, y) for x, y, _ in pieces],
+            offset_transform=ax.transData,
+            transform=Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans,
+            facecolors=[piece.render_color() for _, _, piece in pieces],
+            edgecolors=[piece.outline_color() for _, _, piece in pieces],
+            linewidths=0.8,
+            zorder=3,
+        )
+
+        ax.add_collection(collection, autolim=False)
 
         return True
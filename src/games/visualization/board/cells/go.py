@@ -1,9 +1,21 @@
 """Go stone cell rendering primitives."""
 
 from typing import Any
+from typing import ClassVar
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
 
+from matplotlib.collections import EllipseCollection
 from matplotlib.patches import Circle
 
+from ..types import PlacedCell
+
+
+# stone radius in board units (the grid spacing is one)
+STONE_RADIUS: float = 0.42
+
 
 class StoneCircle(Circle):
     """Matplotlib Circle patch representing a Go stone."""
@@ -12,12 +24,37 @@ class StoneCircle(Circle):
 
 
 class GoStone:
-    """Renderable Go stone."""
+    """Renderable Go stone.
+
+    Stones hold no position, so one shared instance per colour is enough;
+    :meth:`of` returns it.
+    """
+
+    __slots__ = ("color", "_render_color", "_edgecolor")
+
+    _instances: ClassVar[Dict[str, "GoStone"]] = {}
 
     def __init__(self, color: str) -> None:
         """Initialize Go stone with color ('black' or 'white')."""
         self.color = color
 
+        self._render_color = "#f4f2ec" if color == "white" else "#111111"
+        self._edgecolor = "#111111" if color == "white" else None
+
+    @classmethod
+    def of(cls, color: str) -> "GoStone":
+        """Return the shared stone of a color."""
+        instance = cls._instances.get(color)
+
+        if instance is None:
+            instance = cls._instances[color] = cls(color)
+
+        return instance
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        """Unpickle to the shared stone of the color."""
+        return (type(self).of, (self.color,))
+
     def render_symbol(self) -> str:
         """Return stone symbol."""
         return "●"
@@ -28,9 +65,11 @@ class GoStone:
 
     def render_color(self) -> str:
         """Return display color."""
-        if self.piece_color() == "white":
-            return "#f4f2ec"
-        return "#111111"
+        return self._render_color
+
+    def edge_color(self) -> Optional[str]:
+        """Return the outline color, if the stone has one."""
+        return self._edgecolor
 
     def draw(
         self,
@@ -40,15 +79,13 @@ class GoStone:
         board_size: int,
     ) -> bool:
         """Draw stone scaled to board size."""
-        radius: float = 0.42
-
-        edgecolor = "#111111" if self.piece_color() == "white" else None
+        radius: float = STONE_RADIUS
 
         circle = StoneCircle(
             (x, y),
             radius,
-            facecolor=self.render_color(),
-            edgecolor=edgecolor,
+            facecolor=self._render_color,
+            edgecolor=self.edge_color(),
             linewidth=1.0,
             zorder=3,
         )
@@ -58,3 +95,26 @@ class GoStone:
         ax.add_patch(circle)
 
         return True
+
+    @classmethod
+    def draw_many(cls, ax: Any, stones: Sequence[PlacedCell], board_size: int) -> bool:
+        """Draw all stones as a single ellipse collection."""
+        # black stones are drawn without an outline, as in draw()
+        edgecolors = [stone.edge_color() or "none" for _, _, stone in stones]
+
+        collection = EllipseCollection(
+            widths=2 * STONE_RADIUS,
+            heights=2 * STONE_RADIUS,
+            angles=0.0,
+            units="xy",
+            offsets=[(x, y) for x, y, _ in stones],
+            offset_transform=ax.transData,
+            facecolors=[stone.render_color() for _, _, stone in stones],
+            edgecolors=edgecolors,
+            linewidths=1.0,
+            zorder=3,
+        )
+
+        ax.add_collection(collection, autolim=False)
+
+        return True
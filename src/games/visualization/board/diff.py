@@ -0,0 +1,135 @@
+"""Cell-level differences between board positions."""
+
+from dataclasses import dataclass
+from typing import Any
+from typing import Callable
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .encoding import is_encoded
+from .protocol import BoardProtocol
+from .protocol import CellValue
+from .types import Grid
+
+
+def cell_key(value: Optional[CellValue]) -> Optional[Hashable]:
+    """Return what a cell looks like, so equal-looking cells compare equal."""
+    if value is None:
+        return None
+    return (type(value), value.render_symbol(), value.render_color())
+
+
+def _is_empty(values: NDArray[Any]) -> NDArray[np.bool_]:
+    """Return which of a flat array of cell values (or codes) are empty."""
+    if is_encoded(values):
+        return np.asarray(values == 0)
+    return np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+
+
+@dataclass(frozen=True)
+class GridDiff:
+    """The cells that differ between two grids, with their old and new values.
+
+    Cells are ``(row, column)`` rows of ``cells``, and ``before``/``after``
+    hold their values (or codes, for encoded grids) in the same order.
+    """
+
+    cells: NDArray[np.intp]
+    before: NDArray[Any]
+    after: NDArray[Any]
+
+    def __len__(self) -> int:
+        """Return the number of differing cells."""
+        return len(self.cells)
+
+    @property
+    def added(self) -> NDArray[np.intp]:
+        """Return the cells that were empty and are now occupied."""
+        return self.cells[_is_empty(self.before) & ~_is_empty(self.after)]
+
+    @property
+    def removed(self) -> NDArray[np.intp]:
+        """Return the cells that were occupied and are now empty."""
+        return self.cells[~_is_empty(self.before) & _is_empty(self.after)]
+
+    @property
+    def changed(self) -> NDArray[np.intp]:
+        """Return the cells that stayed occupied by something else."""
+        return self.cells[~_is_empty(self.before) & ~_is_empty(self.after)]
+
+    def apply(self, grid: Grid) -> None:
+        """Turn a grid matching ``before`` into one matching ``after``, in place."""
+        grid[self.cells[:, 0], self.cells[:, 1]] = self.after
+
+    def revert(self, grid: Grid) -> None:
+        """Turn a grid matching ``after`` back into ``before``, in place."""
+        grid[self.cells[:, 0], self.cells[:, 1]] = self.before
+
+
+def diff_grids(before: Grid, after: Grid) -> GridDiff:
+    """Return the cells whose contents differ between two grids.
+
+    Encoded grids are compared code by code. Cell values are compared as
+    objects first, and cells holding distinct values that look alike (see
+    :func:`cell_key`) are not reported.
+    """
+    if before.shape != after.shape:
+        raise ValueError(
+            f"Cannot compare grids of shapes {before.shape} and {after.shape}."
+        )
+    if is_encoded(before) != is_encoded(after):
+        raise ValueError("Cannot compare an encoded grid with a decoded one.")
+
+    cells = np.argwhere(before != after)
+    old, new = before[cells[:, 0], cells[:, 1]], after[cells[:, 0], cells[:, 1]]
+
+    if not is_encoded(before) and len(cells):
+        alike = np.fromiter(
+            (cell_key(a) == cell_key(b) for a, b in zip(old, new)),  # noqa: B905
+            dtype=bool,
+            count=len(cells),
+        )
+        cells, old, new = cells[~alike], old[~alike], new[~alike]
+
+    return GridDiff(cells=cells, before=old, after=new)
+
+
+def diff_boards(
+    before: BoardProtocol,
+    after: BoardProtocol,
+    to_grid: Callable[[BoardProtocol], Grid],
+) -> GridDiff:
+    """Return the cells that differ between two boards, read with ``to_grid``."""
+    return diff_grids(to_grid(before), to_grid(after))
+
+
+def diff_positions(grids: Iterable[Grid]) -> Iterator[GridDiff]:
+    """Yield the differences between consecutive grids of a sequence.
+
+    Only the previous grid is kept, so the sequence may reuse one buffer.
+    """
+    previous: Optional[Grid] = None
+
+    for grid in grids:
+        if previous is not None:
+            yield diff_grids(previous, grid)
+        previous = grid.copy()
+
+
+def replay(initial: Grid, diffs: Iterable[GridDiff]) -> Iterator[Grid]:
+    """Yield the initial grid and the grid after applying each diff in turn.
+
+    A single copy of the initial grid is updated and yielded each time, so
+    every grid should be consumed before the next.
+    """
+    grid = initial.copy()
+    yield grid
+
+    for diff in diffs:
+        diff.apply(grid)
+        yield grid
@@ -0,0 +1,34 @@
+"""Decoding of compact integer grids into grids of shared cell values."""
+
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .types import Codebook
+from .types import Grid
+
+
+def is_encoded(grid: Grid) -> bool:
+    """Return whether a grid holds integer cell codes."""
+    return grid.dtype.kind in "iu"
+
+
+@lru_cache(maxsize=None)
+def _lookup_table(codebook: Codebook) -> NDArray[Any]:
+    """Return a codebook as an object array to index with codes."""
+    table = np.empty(len(codebook), dtype=object)
+    for code, value in enumerate(codebook):
+        table[code] = value
+    return table
+
+
+def decode_grid(codes: Grid, codebook: Codebook) -> Grid:
+    """Map every code to its cell value, sharing one value per code."""
+    table = _lookup_table(codebook)
+
+    if codes.size and (codes.min() < 0 or codes.max() >= len(table)):
+        raise ValueError("Grid holds codes missing from the codebook.")
+
+    return table[codes]
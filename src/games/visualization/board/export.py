@@ -0,0 +1,245 @@
+"""Headless export of board frames to PNG sequences, GIFs and MP4s."""
+
+import shutil
+import subprocess
+from abc import ABC
+from abc import abstractmethod
+from pathlib import Path
+from typing import IO
+from typing import Any
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+import matplotlib as mpl
+import numpy as np
+from numpy.typing import NDArray
+from PIL import GifImagePlugin
+from PIL import Image
+
+from .renderer import MatplotlibBoardRenderer
+from .renderer import RenderSpec
+from .renderer import RenderTheme
+from .session import RenderSession
+from .types import Grid
+
+
+PathLike = Union[str, Path]
+
+
+class FrameSink(ABC):
+    """Consumes RGBA frames one at a time, without keeping them around."""
+
+    @abstractmethod
+    def write(self, frame: NDArray[np.uint8]) -> None:
+        """Write one ``(height, width, 4)`` RGBA frame."""
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the output."""
+        pass
+
+    def __enter__(self) -> "FrameSink":
+        """Return the sink for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the sink."""
+        self.close()
+
+
+class PngSequenceSink(FrameSink):
+    """Writes each frame to its own numbered PNG file."""
+
+    def __init__(self, directory: PathLike, prefix: str = "frame") -> None:
+        """Initialize with the output directory and file name prefix."""
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.count: int = 0
+
+    def path(self, index: int) -> Path:
+        """Return the file name of a frame."""
+        return self.directory / f"{self.prefix}_{index:05d}.png"
+
+    def write(self, frame: NDArray[np.uint8]) -> None:
+        """Save a frame as the next numbered PNG."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(frame).save(self.path(self.count))
+        self.count += 1
+
+    def close(self) -> None:
+        """Nothing to finish, every frame is already on disk."""
+        pass
+
+
+class GifSink(FrameSink):
+    """Streams frames into an animated GIF as they arrive.
+
+    Frames share the palette of the first frame, so each one is quantized and
+    written immediately instead of being collected until the end.
+    """
+
+    def __init__(self, path: PathLike, fps: float = 2.0, loop: int = 0) -> None:
+        """Initialize with the output path, frame rate and loop count."""
+        self.path = Path(path)
+        self.duration = int(round(1000 / fps))
+        self.loop = loop
+        self._palette: Optional[Image.Image] = None
+        self._file: Optional[IO[bytes]] = None
+
+    def write(self, frame: NDArray[np.uint8]) -> None:
+        """Quantize a frame and append it to the GIF."""
+        image = Image.fromarray(np.ascontiguousarray(frame[..., :3]))
+
+        if self._palette is None or self._file is None:
+            indexed = image.quantize(colors=256, dither=Image.Dither.NONE)
+            header, _ = GifImagePlugin.getheader(
+                indexed, info={"loop": self.loop, "duration": self.duration}
+            )
+            self._palette = indexed
+            self._file = self.path.open("wb")
+            self._file.write(b"".join(header))
+        else:
+            indexed = image.quantize(palette=self._palette, dither=Image.Dither.NONE)
+
+        for chunk in GifImagePlugin.getdata(indexed, duration=self.duration):
+            self._file.write(chunk)
+
+    def close(self) -> None:
+        """Write the GIF trailer."""
+        if self._file is not None:
+            self._file.write(b";")
+            self._file.close()
+            self._file = None
+
+
+class Mp4Sink(FrameSink):
+    """Pipes raw frames into an ``ffmpeg`` process encoding an MP4."""
+
+    def __init__(
+        self, path: PathLike, fps: float = 2.0, codec: str = "libx264"
+    ) -> None:
+        """Initialize with the output path, frame rate and video codec."""
+        self.path = Path(path)
+        self.fps = fps
+        self.codec = codec
+        self._process: Optional["subprocess.Popen[bytes]"] = None
+
+    @staticmethod
+    def ffmpeg() -> Optional[str]:
+        """Return the ffmpeg executable matplotlib is configured with, if any."""
+        return shutil.which(str(mpl.rcParams["animation.ffmpeg_path"]))
+
+    def _start(self, width: int, height: int) -> "subprocess.Popen[bytes]":
+        """Launch ffmpeg for frames of the given size."""
+        ffmpeg = self.ffmpeg()
+        if ffmpeg is None:
+            raise RuntimeError("MP4 export requires ffmpeg on the PATH.")
+
+        # yuv420p needs even dimensions, so pad by a pixel when necessary
+        command = [
+            ffmpeg,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "rgba",
+            "-s",
+            f"{width}x{height}",
+            "-r",
+            str(self.fps),
+            "-i",
+            "-",
+            "-vf",
+            "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-vcodec",
+            self.codec,
+            "-pix_fmt",
+            "yuv420p",
+            str(self.path),
+        ]
+        return subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, frame: NDArray[np.uint8]) -> None:
+        """Send a frame to the encoder."""
+        if self._process is None:
+            self._process = self._start(frame.shape[1], frame.shape[0])
+
+        assert self._process.stdin is not None  # for mypy
+        self._process.stdin.write(np.ascontiguousarray(frame).tobytes())
+
+    def close(self) -> None:
+        """Flush the encoder and wait for it to finish."""
+        if self._process is None:
+            return
+
+        assert self._process.stdin is not None  # for mypy
+        self._process.stdin.close()
+        code = self._process.wait()
+        self._process = None
+
+        if code != 0:
+            raise RuntimeError(f"ffmpeg exited with status {code}.")
+
+
+def sink_for(path: PathLike, fps: float = 2.0) -> FrameSink:
+    """Choose a sink from the file extension (``.png``, ``.gif`` or ``.mp4``).
+
+    For ``.png`` the path's stem is used as the prefix of numbered files in
+    the path's directory, e.g. ``out/move.png`` writes ``out/move_00000.png``.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".png":
+        return PngSequenceSink(path.parent, prefix=path.stem)
+    if suffix == ".gif":
+        return GifSink(path, fps=fps)
+    if suffix == ".mp4":
+        return Mp4Sink(path, fps=fps)
+
+    raise ValueError(f"Unsupported export format: {path.suffix!r}")
+
+
+def export_grids(
+    renderer: MatplotlibBoardRenderer,
+    grids: Iterable[Grid],
+    sink: Union[FrameSink, PathLike],
+    *,
+    fps: float = 2.0,
+    spec: Optional[RenderSpec] = None,
+    theme: Optional[RenderTheme] = None,
+    title: str = "",
+) -> int:
+    """Render grids into a sink through one headless session.
+
+    Grids are consumed lazily and every frame is handed to the sink as soon as
+    it is drawn, so memory stays flat however many grids there are. Returns
+    the number of frames written.
+    """
+    if not isinstance(sink, FrameSink):
+        sink = sink_for(sink, fps=fps)
+
+    session: Optional[RenderSession] = None
+    count = 0
+
+    try:
+        for grid in grids:
+            if session is None:
+                session = RenderSession(
+                    renderer, grid, spec=spec, theme=theme, title=title, headless=True
+                )
+            else:
+                session.update(grid)
+
+            sink.write(session.frame())
+            count += 1
+    finally:
+        if session is not None:
+            session.close()
+        sink.close()
+
+    return count
@@ -0,0 +1,120 @@
+"""Offscreen figures reused across renders, kept out of pyplot's registry."""
+
+from contextlib import contextmanager
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+import matplotlib as mpl
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+# figure size and dpi of interchangeable figures
+_FigureKind = Tuple[Tuple[float, float], float]
+
+
+def pyplot_figure_count() -> int:
+    """Return the number of figures currently open in pyplot."""
+    import matplotlib.pyplot as plt
+
+    return len(plt.get_fignums())
+
+
+class FigurePool:
+    """Hands out offscreen Agg figures and takes them back for reuse.
+
+    Figures are plain :class:`~matplotlib.figure.Figure` objects on Agg
+    canvases. pyplot never sees them, so nothing piles up in its global
+    state however many renders run. Released figures are cleared and up to
+    ``maxsize`` of each size and dpi are kept for the next :meth:`acquire`;
+    the rest are left to the garbage collector.
+    """
+
+    def __init__(self, maxsize: int = 4) -> None:
+        """Initialize an empty pool keeping at most ``maxsize`` idle figures."""
+        if maxsize < 0:
+            raise ValueError("Pool size cannot be negative.")
+
+        self.maxsize = maxsize
+        self.created: int = 0
+        self._idle: Dict[_FigureKind, List[Figure]] = {}
+        self._in_use: Set[Figure] = set()
+
+    def __contains__(self, figure: Any) -> bool:
+        """Return whether a figure is currently on loan from this pool."""
+        return figure in self._in_use
+
+    @property
+    def in_use(self) -> int:
+        """Return the number of figures acquired and not yet released."""
+        return len(self._in_use)
+
+    @property
+    def idle(self) -> int:
+        """Return the number of cleared figures waiting for reuse."""
+        return sum(len(figures) for figures in self._idle.values())
+
+    @property
+    def live(self) -> int:
+        """Return the number of figures the pool holds, in use or idle."""
+        return self.in_use + self.idle
+
+    def acquire(
+        self,
+        figsize: Tuple[float, float],
+        dpi: float,
+        facecolor: Optional[Any] = None,
+    ) -> Figure:
+        """Return an empty figure, reusing an idle one of the same size."""
+        width, height = figsize
+        idle = self._idle.get(((width, height), dpi))
+
+        if idle:
+            figure = idle.pop()
+        else:
+            figure = Figure(figsize=figsize, dpi=dpi)
+            FigureCanvasAgg(figure)
+            self.created += 1
+
+        # reused figures keep their old colors unless told otherwise
+        figure.set_facecolor(facecolor or mpl.rcParams["figure.facecolor"])
+        figure.set_edgecolor(mpl.rcParams["figure.edgecolor"])
+
+        self._in_use.add(figure)
+        return figure
+
+    def release(self, figure: Figure) -> None:
+        """Clear a figure and keep it for reuse, if there is room."""
+        if figure not in self._in_use:
+            raise ValueError("Figure is not on loan from this pool.")
+
+        self._in_use.remove(figure)
+        figure.clear()
+
+        width, height = figure.get_size_inches()
+        idle = self._idle.setdefault(((float(width), float(height)), figure.dpi), [])
+        if len(idle) < self.maxsize:
+            idle.append(figure)
+
+    @contextmanager
+    def figure(
+        self,
+        figsize: Tuple[float, float],
+        dpi: float,
+        facecolor: Optional[Any] = None,
+    ) -> Iterator[Figure]:
+        """Lend a figure for the duration of a ``with`` block."""
+        figure = self.acquire(figsize, dpi, facecolor)
+        try:
+            yield figure
+        finally:
+            self.release(figure)
+
+    def clear(self) -> None:
+        """Drop every idle figure."""
+        self._idle.clear()
@@ -0,0 +1,169 @@
+"""Render many boards in parallel over a process pool."""
+
+import io
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+from typing import overload
+
+from PIL import Image
+
+from .export import PathLike
+from .scene.base import Scene
+from .session import RenderSession
+
+
+# A scene and the board to render with it
+RenderJob = Tuple[Scene, Any]
+
+# warm sessions of the current process, one per kind of scene and renderer,
+# least recently used first
+_SESSIONS: "OrderedDict[Hashable, RenderSession]" = OrderedDict()
+
+# most warm sessions a process keeps open
+MAX_SESSIONS: int = 8
+
+
+def _init_worker() -> None:
+    """Render on Agg in worker processes, whatever the parent's backend."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _close_sessions() -> None:
+    """Close the warm sessions of the current process."""
+    for session in _SESSIONS.values():
+        session.close()
+    _SESSIONS.clear()
+
+
+def _session_key(scene: Scene) -> Hashable:
+    """Return the key of the warm session a scene can share."""
+    return (type(scene), scene.spec, scene.renderer.session_key())
+
+
+def _render_job(scene: Scene, board: Any, image_format: str) -> bytes:
+    """Render one board through a warm session and encode the image."""
+    grid = scene.board_to_grid(board)
+    key = _session_key(scene)
+
+    session = _SESSIONS.get(key)
+    if session is None or session.size != grid.shape[0]:
+        if session is not None:
+            session.close()
+        session = _SESSIONS[key] = RenderSession(
+            scene.renderer, grid, spec=scene.spec, headless=True
+        )
+        if len(_SESSIONS) > MAX_SESSIONS:
+            _SESSIONS.popitem(last=False)[1].close()
+    else:
+        session.update(grid)
+
+    _SESSIONS.move_to_end(key)
+
+    buffer = io.BytesIO()
+    Image.fromarray(session.frame()).convert("RGB").save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def _render_chunk(
+    jobs: Sequence[Tuple[Scene, Any, Optional[str]]], image_format: str
+) -> List[Union[bytes, str]]:
+    """Render a chunk of jobs, writing to disk where a path is given."""
+    results: List[Union[bytes, str]] = []
+
+    for scene, board, path in jobs:
+        data = _render_job(scene, board, image_format)
+        if path is None:
+            results.append(data)
+        else:
+            Path(path).write_bytes(data)
+            results.append(path)
+
+    return results
+
+
+def _chunk(items: List[Any], size: int) -> List[List[Any]]:
+    """Split items into consecutive chunks of at most ``size``."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+@overload
+def render_many(
+    jobs: Iterable[RenderJob],
+    paths: None = None,
+    *,
+    image_format: str = "PNG",
+    max_workers: Optional[int] = None,
+    chunk_size: int = 32,
+) -> List[bytes]:
+    pass
+
+
+@overload
+def render_many(
+    jobs: Iterable[RenderJob],
+    paths: Sequence[PathLike],
+    *,
+    image_format: str = "PNG",
+    max_workers: Optional[int] = None,
+    chunk_size: int = 32,
+) -> List[Path]:
+    pass
+
+
+def render_many(
+    jobs: Iterable[RenderJob],
+    paths: Optional[Sequence[PathLike]] = None,
+    *,
+    image_format: str = "PNG",
+    max_workers: Optional[int] = None,
+    chunk_size: int = 32,
+) -> Union[List[bytes], List[Path]]:
+    """Render ``(scene, board)`` jobs in worker processes.
+
+    Each worker keeps one warm, headless :class:`RenderSession` per kind of
+    scene (scene type and spec), so backgrounds are drawn once per worker and
+    every job only redraws the cells that differ from the previous board.
+    Images are written to ``paths`` when given (returning the paths), or
+    returned as encoded bytes, in job order. Jobs are sent in chunks of
+    ``chunk_size`` to keep inter-process traffic low; ``max_workers=1``
+    renders in the calling process.
+    """
+    job_list = list(jobs)
+    if paths is not None and len(paths) != len(job_list):
+        raise ValueError("Need exactly one output path per job.")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least one.")
+
+    targets = [None] * len(job_list) if paths is None else [str(p) for p in paths]
+    tasks = [(scene, board, targets[i]) for i, (scene, board) in enumerate(job_list)]
+    chunks = _chunk(tasks, chunk_size)
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1:
+        try:
+            results = [_render_chunk(chunk, image_format) for chunk in chunks]
+        finally:
+            _close_sessions()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [
+                pool.submit(_render_chunk, chunk, image_format) for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+
+    flat = [item for chunk in results for item in chunk]
+    if paths is None:
+        return [item for item in flat if isinstance(item, bytes)]
+    return [Path(item) for item in flat if isinstance(item, str)]
@@ -17,7 +17,12 @@ class BoardProtocol(Protocol):
 
 
 class CellValue(Protocol):
-    """Renderable object that can be displayed in a grid cell."""
+    """Renderable object that can be displayed in a grid cell.
+
+    Cell types may also offer a ``draw_many(ax, cells, board_size)``
+    classmethod drawing a sequence of ``(x, y, cell)`` at once, which
+    renderers use when drawing cells in batches.
+    """
 
     def render_symbol(self) -> str:
         """Return glyph used to represent the object."""
@@ -0,0 +1,332 @@
+"""Pure-NumPy board rasterizer for high-volume rendering without matplotlib."""
+
+from functools import lru_cache
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import matplotlib.patheffects as pe
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgb
+from matplotlib.figure import Figure
+from numpy.typing import NDArray
+
+from .background.base import Background
+from .background.checkerboard import CheckerboardBackground
+from .background.go import STAR_RADIUS
+from .background.go import GoBackground
+from .background.go import default_star_points
+from .background.solid import SolidBackground
+from .cells.go import STONE_RADIUS
+from .cells.go import GoStone
+from .diff import cell_key
+from .geometry.base import Geometry
+from .protocol import CellValue
+from .renderer import DEFAULT_THEME
+from .renderer import BoardRenderer
+from .renderer import RenderSpec
+from .renderer import RenderTheme
+from .types import Codebook
+from .types import Grid
+from .types import Overlay
+
+
+# RGBA floats with the color premultiplied by alpha, in the 0-255 range
+Sprite = NDArray[np.float32]
+
+# (x0, x1, y0, y1) board extent in plot coordinates
+Extent = Tuple[float, float, float, float]
+
+# glyph font size as a fraction of the cell, matching the matplotlib renderer
+_GLYPH_SCALE = 0.84
+
+# width of grid lines and outlines as a fraction of the cell
+_LINE_SCALE = 0.05
+
+
+def _rgb(color: Any) -> NDArray[np.float32]:
+    """Return a matplotlib color as RGB floats in the 0-255 range."""
+    return np.asarray(to_rgb(color), dtype=np.float32) * 255
+
+
+def disc_sprite(
+    radius: float,
+    fill: Any,
+    edge: Optional[Any] = None,
+    edge_width: float = 0.0,
+) -> Sprite:
+    """Return an antialiased disc of ``radius`` pixels, with optional outline."""
+    half = int(np.ceil(radius)) + 1
+    offsets = np.arange(-half, half + 1, dtype=np.float32)
+    distance = np.hypot(offsets[:, np.newaxis], offsets[np.newaxis, :])
+
+    alpha = np.clip(radius + 0.5 - distance, 0, 1)[..., np.newaxis]
+    color: NDArray[Any] = np.broadcast_to(_rgb(fill), alpha.shape[:2] + (3,))
+
+    if edge is not None and edge_width > 0:
+        inside = np.clip(radius - edge_width + 0.5 - distance, 0, 1)[..., np.newaxis]
+        color = inside * _rgb(fill) + (1 - inside) * _rgb(edge)
+
+    return np.concatenate([color * alpha, alpha], axis=2).astype(np.float32)
+
+
+@lru_cache(maxsize=256)
+def glyph_sprite(symbol: str, color: str, outline: Optional[str], size: int) -> Sprite:
+    """Pre-render a glyph, centered in a ``size`` pixel square, with Agg."""
+    figure = Figure(figsize=(size / 72, size / 72), dpi=72)
+    canvas: Any = FigureCanvasAgg(figure)
+    figure.patch.set_alpha(0)
+
+    text = figure.text(
+        0.5,
+        0.5,
+        symbol,
+        ha="center",
+        va="center",
+        color=color,
+        fontsize=size * _GLYPH_SCALE,
+        fontfamily="DejaVu Sans",
+    )
+
+    if outline is not None:
+        width = max(0.8, size * _LINE_SCALE / 2)
+        text.set_path_effects([pe.withStroke(linewidth=width, foreground=outline)])
+
+    canvas.draw()
+    rgba = np.asarray(canvas.buffer_rgba(), dtype=np.float32)
+    alpha = rgba[..., 3:] / 255
+
+    return _trim(np.concatenate([rgba[..., :3] * alpha, alpha], axis=2))
+
+
+def _trim(sprite: Sprite) -> Sprite:
+    """Crop transparent margins evenly from opposite sides, keeping the center."""
+    rows, cols = np.nonzero(sprite[..., 3])
+    if rows.size == 0:
+        return sprite[:0, :0]
+
+    height, width = sprite.shape[:2]
+    dy = min(rows.min(), height - 1 - rows.max())
+    dx = min(cols.min(), width - 1 - cols.max())
+
+    return np.ascontiguousarray(sprite[dy : height - dy, dx : width - dx])
+
+
+def blit(image: NDArray[np.uint8], sprite: Sprite, x: float, y: float) -> None:
+    """Blend a sprite into an image, centered on pixel coordinates (x, y)."""
+    height, width = sprite.shape[:2]
+    top, left = int(round(y - height / 2)), int(round(x - width / 2))
+
+    y0, x0 = max(top, 0), max(left, 0)
+    y1, x1 = min(top + height, image.shape[0]), min(left + width, image.shape[1])
+    if y0 >= y1 or x0 >= x1:
+        return
+
+    patch = sprite[y0 - top : y1 - top, x0 - left : x1 - left]
+    region = image[y0:y1, x0:x1]
+
+    blended = region * (1 - patch[..., 3:]) + patch[..., :3]
+    region[...] = blended + 0.5
+
+
+class NumpyBoardRenderer(BoardRenderer):
+    """Rasterizes boards straight into NumPy arrays, bypassing matplotlib.
+
+    Checkerboard, Go and solid backgrounds are rasterized once per board
+    size and image size. Go stones are drawn as antialiased discs and other
+    cells as glyph sprites pre-rendered once per look and size. Geometries
+    must place neighbouring cells one unit apart, as the built-in ones do.
+    """
+
+    def __init__(
+        self,
+        background: Background,
+        geometry: Geometry,
+        codebook: Optional[Codebook] = None,
+    ) -> None:
+        """Initialize renderer with board background and geometry."""
+        self.background = background
+        self.geometry = geometry
+        self.codebook = codebook
+
+        self._backgrounds: Dict[Tuple[int, int], NDArray[np.uint8]] = {}
+        self._sprites: Dict[Tuple[Hashable, int], Sprite] = {}
+
+    def render(
+        self,
+        grid: Grid,
+        *,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+        overlays: Optional[Sequence[Overlay]] = None,
+        return_ax: bool = False,
+    ) -> Any:
+        """Show the rasterized board on matplotlib axes in plot coordinates."""
+        spec = spec or RenderSpec()
+        theme = theme or DEFAULT_THEME
+        pixels = self.render_array(grid, spec=spec)
+
+        import matplotlib.pyplot as plt
+
+        with theme.context():
+            fig, ax = plt.subplots(
+                figsize=spec.figsize, dpi=spec.dpi, **theme.subplot_kwargs()
+            )
+            theme.apply_axes(ax)
+            ax.imshow(pixels, extent=self.extent(grid.shape[0]))
+
+            for overlay in overlays or ():
+                overlay(ax)
+
+            if title:
+                ax.set_title(title)
+
+            if spec.subtitle:
+                fig.suptitle(
+                    spec.subtitle, y=spec.subtitle_y, fontsize=spec.subtitle_fontsize
+                )
+
+            if not spec.show_axes:
+                ax.axis("off")
+
+            if return_ax:
+                return ax
+
+            plt.show()
+
+            if not plt.isinteractive():
+                plt.close(fig)
+
+    def render_array(
+        self,
+        grid: Grid,
+        *,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+        overlays: Optional[Sequence[Overlay]] = None,
+    ) -> NDArray[np.uint8]:
+        """Rasterize a grid into a square RGB array.
+
+        The board fills the image, whose side is the shorter side of the
+        spec's figure in pixels. Themes and titles do not apply to bare
+        arrays, and overlays need matplotlib axes (see :meth:`render`).
+        """
+        if overlays:
+            raise ValueError("Overlays draw on matplotlib axes; use render().")
+
+        cells = self.decode(grid)
+        spec = spec or RenderSpec()
+        size = grid.shape[0]
+        side = int(round(min(spec.figsize) * spec.dpi))
+
+        x0, _, _, y1 = self.extent(size)
+        scale = side / size
+        image = self._background(size, side).copy()
+
+        for r in range(size):
+            for c in range(size):
+                if cells[r, c] is None:
+                    continue
+
+                x, y = self.geometry.cell_position(r, c)
+                sprite = self._sprite(cells[r, c], scale)
+                blit(image, sprite, (x - x0) * scale, (y1 - y) * scale)
+
+        return image
+
+    def extent(self, size: int) -> Extent:
+        """Return the board extent in plot coordinates, half a cell around."""
+        first = self.geometry.cell_position(0, 0)
+        last = self.geometry.cell_position(size - 1, size - 1)
+
+        return first[0] - 0.5, last[0] + 0.5, first[1] - 0.5, last[1] + 0.5
+
+    def _sprite(self, value: CellValue, scale: float) -> Sprite:
+        """Return the sprite of a cell value at a scale, building it once."""
+        key = (cell_key(value), int(round(scale)))
+        sprite = self._sprites.get(key)
+
+        if sprite is None:
+            if isinstance(value, GoStone):
+                sprite = disc_sprite(
+                    STONE_RADIUS * scale,
+                    value.render_color(),
+                    value.edge_color(),
+                    max(1.0, scale * _LINE_SCALE),
+                )
+            else:
+                outline = getattr(value, "outline_color", None)
+                sprite = glyph_sprite(
+                    value.render_symbol(),
+                    value.render_color(),
+                    outline() if callable(outline) else None,
+                    key[1],
+                )
+            self._sprites[key] = sprite
+
+        return sprite
+
+    def _background(self, size: int, side: int) -> NDArray[np.uint8]:
+        """Return the rasterized background, building it once per size."""
+        image = self._backgrounds.get((size, side))
+
+        if image is None:
+            image = self._backgrounds[(size, side)] = self._rasterize_background(
+                size, side
+            )
+
+        return image
+
+    def _rasterize_background(self, size: int, side: int) -> NDArray[np.uint8]:
+        """Rasterize the background of a board of ``size`` into ``side`` pixels."""
+        background = self.background
+        x0, _, _, y1 = self.extent(size)
+        scale = side / size
+
+        # plot coordinates of the pixel centers
+        centers = (np.arange(side) + 0.5) / scale
+        xs, ys = x0 + centers, y1 - centers
+
+        if isinstance(background, CheckerboardBackground):
+            # rows count from the top, as in the checkerboard's image
+            rows = size - 1 - np.floor(ys).astype(int)
+            cols = np.floor(xs).astype(int)
+            light = ((rows[:, np.newaxis] + cols[np.newaxis, :]) % 2 == 0)[..., None]
+
+            colors = np.where(light, _rgb(background.light), _rgb(background.dark))
+            return (colors + 0.5).astype(np.uint8)
+
+        if isinstance(background, SolidBackground):
+            return np.full((side, side, 3), _rgb(background.color) + 0.5, np.uint8)
+
+        if isinstance(background, GoBackground):
+            image = np.full((side, side, 3), _rgb(background.color) + 0.5, np.uint8)
+            self._rasterize_go_lines(image, size, scale)
+            return image
+
+        raise TypeError(f"Cannot rasterize {type(background).__name__} backgrounds.")
+
+    def _rasterize_go_lines(
+        self, image: NDArray[np.uint8], size: int, scale: float
+    ) -> None:
+        """Draw Go grid lines and star points onto a background image."""
+        x0, _, _, y1 = self.extent(size)
+        width = max(1, int(round(scale * _LINE_SCALE)))
+
+        # pixel offsets of the lines, along both axes
+        cols = [int((i - x0) * scale) - width // 2 for i in range(size)]
+        rows = [int((y1 - i) * scale) - width // 2 for i in range(size)]
+
+        for i in range(size):
+            image[rows[i] : rows[i] + width, cols[0] : cols[-1] + width] = 0
+            image[rows[-1] : rows[0] + width, cols[i] : cols[i] + width] = 0
+
+        star = disc_sprite(STAR_RADIUS * scale, "black")
+        for r, c in default_star_points(size):
+            blit(image, star, (c - x0) * scale, (y1 - r) * scale)
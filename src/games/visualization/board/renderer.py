@@ -2,21 +2,45 @@
 
 from abc import ABC
 from abc import abstractmethod
+from contextlib import contextmanager
 from contextlib import nullcontext
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import ContextManager
 from typing import Dict
+from typing import Generator
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Sequence
 from typing import Tuple
+from typing import Union
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
+import matplotlib.style
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from numpy.typing import NDArray
 
 from .background.base import Background
+from .background.cache import BackgroundCache
+from .encoding import decode_grid
+from .encoding import is_encoded
+from .figures import FigurePool
 from .geometry.base import Geometry
 from .protocol import CellValue
+from .types import Codebook
 from .types import Grid
 from .types import Overlay
+from .types import PlacedCell
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .export import FrameSink
+    from .export import PathLike
 
 
 @dataclass(frozen=True)
@@ -28,6 +52,12 @@ class RenderTheme:
     axes_facecolor: Optional[str] = None
     axes_edgecolor: Optional[str] = None
 
+    def context(self) -> ContextManager[Any]:
+        """Return a context applying the theme's matplotlib style, if any."""
+        if self.style is None:
+            return nullcontext()
+        return mpl.style.context(self.style)
+
     def subplot_kwargs(self) -> Dict[str, Any]:
         """Return kwargs for plt.subplots()."""
         kwargs: Dict[str, Any] = {}
@@ -73,6 +103,19 @@ class RenderSpec:
 class BoardRenderer(ABC):
     """Abstract base class for board renderers."""
 
+    # shared cell values of encoded grids, by code
+    codebook: Optional[Codebook] = None
+
+    def decode(self, grid: Grid) -> Grid:
+        """Return the cell values of a grid, decoding it if encoded."""
+        if not is_encoded(grid):
+            return grid
+
+        if self.codebook is None:
+            raise ValueError("Rendering an encoded grid requires a codebook.")
+
+        return decode_grid(grid, self.codebook)
+
     @abstractmethod
     def render(
         self,
@@ -87,6 +130,99 @@ class BoardRenderer(ABC):
         """Render a grid state."""
         raise NotImplementedError
 
+    @abstractmethod
+    def render_array(
+        self,
+        grid: Grid,
+        *,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+        overlays: Optional[Sequence[Overlay]] = None,
+    ) -> NDArray[np.uint8]:
+        """Render a grid state into a ``(height, width, 3)`` RGB array."""
+        raise NotImplementedError
+
+    @contextmanager
+    def rendering(
+        self,
+        grid: Grid,
+        *,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+        overlays: Optional[Sequence[Overlay]] = None,
+    ) -> Iterator[Any]:
+        """Render a grid onto axes that are closed when the block exits."""
+        ax = self.render(
+            grid,
+            spec=spec,
+            theme=theme,
+            title=title,
+            overlays=overlays,
+            return_ax=True,
+        )
+        try:
+            yield ax
+        finally:
+            self.close_figure(ax.figure)
+
+    def close_figure(self, figure: Any) -> None:
+        """Close a figure returned by this renderer."""
+        import matplotlib.pyplot as plt
+
+        plt.close(figure)
+
+    def render_arrays(
+        self,
+        grids: Iterable[Grid],
+        *,
+        out: Optional[NDArray[np.uint8]] = None,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+    ) -> NDArray[np.uint8]:
+        """Render grids into one ``(n, height, width, 3)`` RGB array.
+
+        Frames are written into ``out`` when given, which must have room for
+        exactly one frame per grid; otherwise the array is allocated once,
+        after the first frame.
+        """
+        grid_list = list(grids)
+        if out is not None and len(out) != len(grid_list):
+            raise ValueError("Need exactly one output frame per grid.")
+
+        frames = self._frames(grid_list, spec=spec, theme=theme, title=title)
+        try:
+            for index, frame in enumerate(frames):
+                if out is None:
+                    out = np.empty((len(grid_list), *frame.shape), dtype=np.uint8)
+                elif out.shape[1:] != frame.shape:
+                    raise ValueError(
+                        f"Frames of shape {frame.shape} do not fit {out.shape}."
+                    )
+
+                out[index] = frame
+        finally:
+            frames.close()
+
+        if out is None:
+            return np.empty((0, 0, 0, 3), dtype=np.uint8)
+
+        return out
+
+    def _frames(
+        self,
+        grids: Sequence[Grid],
+        *,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+    ) -> Generator[NDArray[np.uint8], None, None]:
+        """Yield the RGB frame of every grid, valid until the next one."""
+        for grid in grids:
+            yield self.render_array(grid, spec=spec, theme=theme, title=title)
+
 
 class MatplotlibBoardRenderer(BoardRenderer):
     """Matplotlib-based implementation of board rendering."""
@@ -96,11 +232,50 @@ class MatplotlibBoardRenderer(BoardRenderer):
         background: Background,
         geometry: Geometry,
         show_grid: bool = False,
+        batch_cells: bool = False,
+        codebook: Optional[Codebook] = None,
+        background_cache: Optional[BackgroundCache] = None,
+        figure_pool: Optional[FigurePool] = None,
     ) -> None:
-        """Initialize renderer with board background and geometry."""
+        """Initialize renderer with board background and geometry.
+
+        With ``batch_cells``, cell types providing ``draw_many`` draw all of
+        their cells as one collection instead of one artist per cell. A
+        ``codebook`` lets the renderer draw encoded (integer) grids, looking
+        up the shared cell value of every code. With a ``background_cache``,
+        the background is rasterized once per configuration and reused.
+        With a ``figure_pool``, offscreen renders (arrays, returned axes and
+        headless sessions) draw on pooled figures that pyplot never tracks;
+        :meth:`close_figure` (or :meth:`rendering`) hands them back.
+        """
         self.background = background
         self.geometry = geometry
         self.show_grid = show_grid
+        self.batch_cells = batch_cells
+        self.codebook = codebook
+        self.background_cache = background_cache
+        self.figure_pool = figure_pool
+
+    def session_key(self) -> Hashable:
+        """Return what identifies how the renderer draws a grid.
+
+        Renderers with equal keys draw every grid identically, so they can
+        share a warm session. A renderer whose background has no
+        :meth:`~.background.base.Background.cache_key`, or whose geometry
+        holds state, is only ever equal to itself.
+        """
+        background = self.background.cache_key()
+        if background is None or vars(self.geometry):
+            return self
+
+        return (
+            type(self),
+            background,
+            type(self.geometry),
+            self.show_grid,
+            self.batch_cells,
+            self.codebook,
+        )
 
     def render(
         self,
@@ -113,54 +288,204 @@ class MatplotlibBoardRenderer(BoardRenderer):
         return_ax: bool = False,
     ) -> Any:
         """Render a board grid using matplotlib."""
-        size: int = grid.shape[0]
+        cells = self.decode(grid)
+        spec = spec or RenderSpec()
+        theme = theme or DEFAULT_THEME
+
+        with theme.context():
+            figure, ax = self._new_figure(
+                grid.shape[0], spec=spec, theme=theme, offscreen=return_ax
+            )
+            self._draw_cells(ax, cells)
+            self._finish_figure(
+                figure, ax, grid.shape[0], spec=spec, title=title, overlays=overlays
+            )
+
+            if return_ax:
+                return ax
+
+            import matplotlib.pyplot as plt
+
+            plt.show()
+
+            # non-interactive backends would otherwise keep the figure forever
+            if not plt.isinteractive():
+                plt.close(figure)
+
+    def render_array(
+        self,
+        grid: Grid,
+        *,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+        overlays: Optional[Sequence[Overlay]] = None,
+    ) -> NDArray[np.uint8]:
+        """Render a grid on an Agg canvas and return its RGB pixels.
 
+        The result is a view of the canvas buffer rather than a copy, unless
+        the figure goes back to a pool for reuse.
+        """
+        cells = self.decode(grid)
         spec = spec or RenderSpec()
         theme = theme or DEFAULT_THEME
 
-        style_ctx = (
-            plt.style.context(theme.style) if theme.style is not None else nullcontext()
+        with theme.context():
+            figure, ax = self._new_figure(
+                grid.shape[0], spec=spec, theme=theme, offscreen=True
+            )
+
+        pooled = self.figure_pool is not None and figure in self.figure_pool
+        canvas: Any = figure.canvas if pooled else FigureCanvasAgg(figure)
+        try:
+            with theme.context():
+                self._draw_cells(ax, cells)
+                self._finish_figure(
+                    figure,
+                    ax,
+                    grid.shape[0],
+                    spec=spec,
+                    title=title,
+                    overlays=overlays,
+                )
+            canvas.draw()
+            pixels: NDArray[np.uint8] = np.array(canvas.buffer_rgba(), copy=pooled)
+        finally:
+            self.close_figure(figure)
+
+        # the array keeps the buffer alive after the figure is gone
+        return pixels[..., :3]
+
+    def _frames(
+        self,
+        grids: Sequence[Grid],
+        *,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+    ) -> Generator[NDArray[np.uint8], None, None]:
+        """Yield frames from one headless session, redrawing only changes."""
+        from .session import RenderSession
+
+        if not grids:
+            return
+
+        with RenderSession(
+            self, grids[0], spec=spec, theme=theme, title=title, headless=True
+        ) as session:
+            for index, grid in enumerate(grids):
+                if index:
+                    session.update(grid)
+                yield session.frame()[..., :3]
+
+    def export(
+        self,
+        grids: Iterable[Grid],
+        sink: Union["FrameSink", "PathLike"],
+        *,
+        fps: float = 2.0,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+    ) -> int:
+        """Write one frame per grid to PNGs, a GIF or an MP4, headlessly."""
+        from .export import export_grids
+
+        return export_grids(
+            self, grids, sink, fps=fps, spec=spec, theme=theme, title=title
         )
 
-        with style_ctx:
+    def close_figure(self, figure: Any) -> None:
+        """Close a figure, handing it back to the pool if it came from there."""
+        if self.figure_pool is not None and figure in self.figure_pool:
+            self.figure_pool.release(figure)
+        else:
+            super().close_figure(figure)
+
+    def _new_figure(
+        self,
+        size: int,
+        *,
+        spec: RenderSpec,
+        theme: RenderTheme,
+        offscreen: bool = False,
+    ) -> Tuple[Any, Any]:
+        """Create a figure with the themed axes and the board background.
+
+        Offscreen figures come from the figure pool, when there is one.
+        """
+        if offscreen and self.figure_pool is not None:
+            fig = self.figure_pool.acquire(
+                spec.figsize, spec.dpi, facecolor=theme.facecolor
+            )
+            ax = fig.add_subplot()
+        else:
+            import matplotlib.pyplot as plt
+
             fig, ax = plt.subplots(
                 figsize=spec.figsize,
                 dpi=spec.dpi,
                 **theme.subplot_kwargs(),
             )
 
-            theme.apply_axes(ax)
+        theme.apply_axes(ax)
 
+        if self.background_cache is None:
             self.background.draw(ax, size)
-            self._draw_cells(ax, grid)
-            self._draw_grid(ax, size)
+        else:
+            self.background_cache.draw(
+                self.background, ax, size, figsize=spec.figsize, dpi=spec.dpi
+            )
 
-            if overlays:
-                for overlay in overlays:
-                    overlay(ax)
+        return fig, ax
 
-            if title:
-                ax.set_title(title)
+    def _finish_figure(
+        self,
+        fig: Any,
+        ax: Any,
+        size: int,
+        *,
+        spec: RenderSpec,
+        title: str = "",
+        overlays: Optional[Sequence[Overlay]] = None,
+    ) -> None:
+        """Draw the grid lines, overlays and titles over whatever is drawn."""
+        self._draw_grid(ax, size)
 
-            if spec.subtitle:
-                fig.suptitle(
-                    spec.subtitle,
-                    y=spec.subtitle_y,
-                    fontsize=spec.subtitle_fontsize,
-                )
+        if overlays:
+            for overlay in overlays:
+                overlay(ax)
 
-            if not spec.show_axes:
-                ax.axis("off")
+        if title:
+            ax.set_title(title)
 
-            if return_ax:
-                return ax
+        if spec.subtitle:
+            fig.suptitle(
+                spec.subtitle,
+                y=spec.subtitle_y,
+                fontsize=spec.subtitle_fontsize,
+            )
 
-            plt.show()
+        if not spec.show_axes:
+            ax.axis("off")
 
     def _draw_cells(self, ax: Any, grid: Grid) -> None:
         """Render all non-empty grid cells."""
         size: int = grid.shape[0]
 
+        if self.batch_cells:
+            self._draw_cells_batched(ax, grid)
+            return
+
+        for r in range(size):
+            for c in range(size):
+                self._draw_cell(ax, r, c, grid[r, c], size)
+
+    def _draw_cells_batched(self, ax: Any, grid: Grid) -> None:
+        """Render cells by type, letting each type draw all its cells at once."""
+        size: int = grid.shape[0]
+        groups: Dict[type, List[PlacedCell]] = {}
+
         for r in range(size):
             for c in range(size):
                 value: Optional[CellValue] = grid[r, c]
@@ -169,22 +494,46 @@ class MatplotlibBoardRenderer(BoardRenderer):
                     continue
 
                 x, y = self.geometry.cell_position(r, c)
+                groups.setdefault(type(value), []).append((x, y, value))
 
-                draw_fn = getattr(value, "draw", None)
+        for cell_type, placed in groups.items():
+            draw_many = getattr(cell_type, "draw_many", None)
 
-                if callable(draw_fn) and draw_fn(ax, x, y, size):
-                    continue
+            if callable(draw_many) and draw_many(ax, placed, size):
+                continue
 
-                ax.text(
-                    x,
-                    y,
-                    value.render_symbol(),
-                    ha="center",
-                    va="center",
-                    color=value.render_color(),
-                    fontsize=max(10, int(240 / size)),
-                    zorder=3,
-                )
+            for x, y, value in placed:
+                self._draw_at(ax, x, y, value, size)
+
+    def _draw_cell(
+        self, ax: Any, r: int, c: int, value: Optional[CellValue], size: int
+    ) -> None:
+        """Render a single grid cell, if it is not empty."""
+        if value is None:
+            return
+
+        x, y = self.geometry.cell_position(r, c)
+        self._draw_at(ax, x, y, value, size)
+
+    def _draw_at(
+        self, ax: Any, x: float, y: float, value: CellValue, size: int
+    ) -> None:
+        """Render a cell value at plot coordinates."""
+        draw_fn = getattr(value, "draw", None)
+
+        if callable(draw_fn) and draw_fn(ax, x, y, size):
+            return
+
+        ax.text(
+            x,
+            y,
+            value.render_symbol(),
+            ha="center",
+            va="center",
+            color=value.render_color(),
+            fontsize=max(10, int(240 / size)),
+            zorder=3,
+        )
 
     def _draw_grid(self, ax: Any, size: int) -> None:
         """Draw optional renderer-level grid lines."""
@@ -1,7 +1,18 @@
 """High-Level rendering API for board visualization."""
 
-from .chess import ChessScene
-from .go import GoScene
+from typing import TYPE_CHECKING
+
+from ...lazy import lazy_exports
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .chess import ChessScene
+    from .go import GoScene
 
 
 __all__ = ["ChessScene", "GoScene"]
+
+# each scene imports only its own game library, on first use
+__getattr__, __dir__ = lazy_exports(
+    __name__, {"ChessScene": ".chess", "GoScene": ".go"}
+)
@@ -2,16 +2,30 @@
 
 from abc import ABC
 from abc import abstractmethod
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
+from typing import Union
 
+from games.visualization.board.renderer import MatplotlibBoardRenderer
 from games.visualization.board.renderer import RenderSpec
 from games.visualization.board.renderer import RenderTheme
+from games.visualization.board.types import Grid
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from games.visualization.board.export import FrameSink
+    from games.visualization.board.export import PathLike
 
 
 class Scene(ABC):
     """High-level rendering unit that produces complete board visualization."""
 
+    renderer: MatplotlibBoardRenderer
+
     def __init__(self, spec: Optional[RenderSpec] = None) -> None:
         """Initialize Scene with rendering configuration."""
         self.spec: RenderSpec = spec or RenderSpec()
@@ -22,3 +36,36 @@ class Scene(ABC):
     ) -> Any:
         """Render the scene."""
         raise NotImplementedError
+
+    @contextmanager
+    def rendering(self, *, theme: Optional[RenderTheme] = None) -> Iterator[Any]:
+        """Render the scene onto axes that are closed when the block exits."""
+        ax = self.render(return_ax=True, theme=theme)
+        try:
+            yield ax
+        finally:
+            self.renderer.close_figure(ax.figure)
+
+    @abstractmethod
+    def board_to_grid(self, board: Any) -> Grid:
+        """Convert a game board of this scene's kind into a grid."""
+        raise NotImplementedError
+
+    def export(
+        self,
+        boards: Iterable[Any],
+        sink: Union["FrameSink", "PathLike"],
+        *,
+        fps: float = 2.0,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+    ) -> int:
+        """Write one frame per board to PNGs, a GIF or an MP4, headlessly."""
+        return self.renderer.export(
+            (self.board_to_grid(board) for board in boards),
+            sink,
+            fps=fps,
+            spec=self.spec,
+            theme=theme,
+            title=title,
+        )
@@ -5,13 +5,17 @@ from typing import Optional
 
 import chess
 
+from games.visualization.board.adapter.chess import CHESS_CODEBOOK
 from games.visualization.board.adapter.chess import ChessBoardWrapper
+from games.visualization.board.adapter.chess import chess_board_to_codes
 from games.visualization.board.adapter.chess import chess_board_to_grid
 from games.visualization.board.background.chess import ChessBackground
+from games.visualization.board.figures import FigurePool
 from games.visualization.board.geometry.chess import ChessGeometry
 from games.visualization.board.renderer import MatplotlibBoardRenderer
 from games.visualization.board.renderer import RenderSpec
 from games.visualization.board.renderer import RenderTheme
+from games.visualization.board.types import Grid
 
 from .base import Scene
 
@@ -19,26 +23,42 @@ from .base import Scene
 class ChessScene(Scene):
     """High-level chess rendering orchestration."""
 
-    def __init__(self, board: chess.Board, spec: Optional[RenderSpec] = None) -> None:
-        """Initialize chess scene."""
+    def __init__(
+        self,
+        board: chess.Board,
+        spec: Optional[RenderSpec] = None,
+        encoded: bool = False,
+        figure_pool: Optional[FigurePool] = None,
+    ) -> None:
+        """Initialize chess scene, optionally converting boards to encoded grids.
+
+        Offscreen renders draw on figures from ``figure_pool``, when given.
+        """
         super().__init__(spec=spec)
 
         self.board = board
+        self.encoded = encoded
 
         self.renderer = MatplotlibBoardRenderer(
             background=ChessBackground(),
             geometry=ChessGeometry(),
+            codebook=CHESS_CODEBOOK,
+            figure_pool=figure_pool,
         )
 
+    def board_to_grid(self, board: chess.Board) -> Grid:
+        """Convert a board into a grid of renderable cells (or their codes)."""
+        if self.encoded:
+            return chess_board_to_codes(board)
+
+        return chess_board_to_grid(ChessBoardWrapper(board))
+
     def render(
         self, *, return_ax: bool = False, theme: Optional[RenderTheme] = None
     ) -> Any:
         """Render chess board state."""
-        wrapper = ChessBoardWrapper(self.board)
-        grid = chess_board_to_grid(wrapper)
-
         return self.renderer.render(
-            grid,
+            self.board_to_grid(self.board),
             spec=self.spec,
             theme=theme,
             return_ax=return_ax,
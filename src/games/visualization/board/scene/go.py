@@ -5,13 +5,17 @@ from typing import Optional
 
 from sgfmill import boards
 
+from games.visualization.board.adapter.go import GO_CODEBOOK
 from games.visualization.board.adapter.go import GoBoardWrapper
+from games.visualization.board.adapter.go import go_board_to_codes
 from games.visualization.board.adapter.go import go_board_to_grid
 from games.visualization.board.background.go import GoBackground
+from games.visualization.board.figures import FigurePool
 from games.visualization.board.geometry.go import GoGeometry
 from games.visualization.board.renderer import MatplotlibBoardRenderer
 from games.visualization.board.renderer import RenderSpec
 from games.visualization.board.renderer import RenderTheme
+from games.visualization.board.types import Grid
 
 from .base import Scene
 
@@ -19,26 +23,42 @@ from .base import Scene
 class GoScene(Scene):
     """High-level Go rendering orchestration."""
 
-    def __init__(self, board: boards.Board, spec: Optional[RenderSpec] = None) -> None:
-        """Initialize Go scene."""
+    def __init__(
+        self,
+        board: boards.Board,
+        spec: Optional[RenderSpec] = None,
+        encoded: bool = False,
+        figure_pool: Optional[FigurePool] = None,
+    ) -> None:
+        """Initialize Go scene, optionally converting boards to encoded grids.
+
+        Offscreen renders draw on figures from ``figure_pool``, when given.
+        """
         super().__init__(spec=spec)
 
         self.board = board
+        self.encoded = encoded
 
         self.renderer = MatplotlibBoardRenderer(
             background=GoBackground(),
             geometry=GoGeometry(),
+            codebook=GO_CODEBOOK,
+            figure_pool=figure_pool,
         )
 
+    def board_to_grid(self, board: boards.Board) -> Grid:
+        """Convert a board into a grid of renderable cells (or their codes)."""
+        if self.encoded:
+            return go_board_to_codes(board)
+
+        return go_board_to_grid(GoBoardWrapper(board))
+
     def render(
         self, *, return_ax: bool = False, theme: Optional[RenderTheme] = None
     ) -> Any:
         """Render Go board state."""
-        wrapper = GoBoardWrapper(self.board)
-        grid = go_board_to_grid(wrapper)
-
         return self.renderer.render(
-            grid,
+            self.board_to_grid(self.board),
             spec=self.spec,
             theme=theme,
             return_ax=return_ax,
@@ -0,0 +1,273 @@
+"""Persistent, incrementally redrawn board rendering sessions."""
+
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.transforms import Bbox
+from numpy.typing import NDArray
+
+from .diff import cell_key
+from .diff import diff_grids
+from .encoding import is_encoded
+from .protocol import CellValue
+from .renderer import DEFAULT_THEME
+from .renderer import MatplotlibBoardRenderer
+from .renderer import RenderSpec
+from .renderer import RenderTheme
+from .types import Grid
+from .types import Overlay
+
+
+# (row, column) of a grid cell
+Cell = Tuple[int, int]
+
+# artist containers of an axes that cells may add to
+_ARTIST_LISTS = ("texts", "patches", "lines", "collections", "images")
+
+# pixels added around artist extents to cover strokes and antialiasing
+_EXTENT_PADDING = 3
+
+# beyond this many damaged regions, repainting everything is cheaper
+_MAX_DAMAGE_REGIONS = 8
+
+
+class RenderSession:
+    """Keeps one figure alive and redraws only the cells that changed.
+
+    The background, grid lines and overlays are drawn once and cached as a
+    bitmap. Every cell's artists are tracked, and :meth:`update` replaces only
+    the artists of cells whose contents differ from the previous grid. Only
+    the screen regions those artists covered are then restored from the
+    bitmap and repainted, together with any neighbours spilling into them.
+
+    Unlike :meth:`~.renderer.MatplotlibBoardRenderer.render`, overlays run
+    before any cell is drawn, so they cannot see the cells, and they end up
+    in the cached bitmap beneath them.
+    """
+
+    def __init__(
+        self,
+        renderer: MatplotlibBoardRenderer,
+        grid: Grid,
+        *,
+        spec: Optional[RenderSpec] = None,
+        theme: Optional[RenderTheme] = None,
+        title: str = "",
+        overlays: Optional[Sequence[Overlay]] = None,
+        headless: bool = False,
+    ) -> None:
+        """Create the figure, cache its background and draw the first grid.
+
+        A ``headless`` session renders on an Agg canvas whatever the pyplot
+        backend, so its frames can be read back with :meth:`frame`.
+        """
+        self.renderer = renderer
+        self.spec = spec or RenderSpec()
+        self.theme = theme or DEFAULT_THEME
+        self.size: int = grid.shape[0]
+
+        with self.theme.context():
+            self.figure, self.ax = renderer._new_figure(
+                self.size, spec=self.spec, theme=self.theme, offscreen=headless
+            )
+            renderer._finish_figure(
+                self.figure,
+                self.ax,
+                self.size,
+                spec=self.spec,
+                title=title,
+                overlays=overlays,
+            )
+
+        self.cell_artists: Dict[Cell, List[Any]] = {}
+        self._keys: Dict[Cell, Hashable] = {}
+        self._extents: Dict[Cell, Bbox] = {}
+        self._background: Any = None
+        self._codes: Optional[Grid] = None
+
+        # backends without blitting (e.g. vector ones) fall back to full redraws
+        if headless:
+            FigureCanvasAgg(self.figure)
+
+        self.blitting: bool = bool(self.figure.canvas.supports_blit)
+
+        # recapture the background whenever the whole figure is redrawn
+        self._draw_cid = self.figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+        self.figure.canvas.draw()
+        self.update(grid)
+
+    @property
+    def canvas(self) -> Any:
+        """Return the canvas of the session's figure."""
+        return self.figure.canvas
+
+    def frame(self) -> NDArray[np.uint8]:
+        """Return the current RGBA pixels (a view, valid until the next update)."""
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def update(self, grid: Grid) -> List[Cell]:
+        """Redraw the cells that changed since the last grid and return them."""
+        if grid.shape != (self.size, self.size):
+            raise ValueError(
+                f"Grid shape {grid.shape} does not match session size {self.size}."
+            )
+
+        values = self.renderer.decode(grid)
+
+        changed: List[Cell] = []
+        damage: List[Bbox] = []
+        for r, c in self._candidates(grid):
+            key = cell_key(values[r, c])
+            if self._keys.get((r, c)) != key:
+                damage.extend(self._replace_cell(r, c, values[r, c]))
+                self._keys[(r, c)] = key
+                changed.append((r, c))
+
+        if changed:
+            self._blit(damage)
+
+        return changed
+
+    def _candidates(self, grid: Grid) -> List[Cell]:
+        """Return the cells that may differ from the previous grid."""
+        previous, self._codes = self._codes, grid.copy() if is_encoded(grid) else None
+
+        # consecutive encoded grids can be compared code by code
+        if previous is not None and self._codes is not None:
+            return [(r, c) for r, c in diff_grids(previous, grid).cells.tolist()]
+
+        return [(r, c) for r in range(self.size) for c in range(self.size)]
+
+    def _replace_cell(self, r: int, c: int, value: Optional[CellValue]) -> List[Bbox]:
+        """Swap a cell's artists and return the screen regions it touched."""
+        damage: List[Bbox] = []
+
+        if (r, c) in self.cell_artists and self._background is not None:
+            damage.append(self._cell_extent((r, c)))
+
+        self._extents.pop((r, c), None)
+        for artist in self.cell_artists.pop((r, c), []):
+            artist.remove()
+
+        marks = [len(getattr(self.ax, name)) for name in _ARTIST_LISTS]
+        self.renderer._draw_cell(self.ax, r, c, value, self.size)
+
+        # the cell's artists are whatever it appended to the axes
+        artists: List[Any] = []
+        for i, name in enumerate(_ARTIST_LISTS):
+            artists.extend(getattr(self.ax, name)[marks[i] :])
+
+        for artist in artists:
+            artist.set_animated(self.blitting)
+
+        if artists:
+            self.cell_artists[(r, c)] = artists
+            if self._background is not None:
+                damage.append(self._cell_extent((r, c)))
+
+        return damage
+
+    def _cell_extent(self, cell: Cell) -> Bbox:
+        """Return the padded, pixel-aligned screen extent of a cell's artists."""
+        extent = self._extents.get(cell)
+        if extent is None:
+            renderer = self.canvas.get_renderer()
+            bbox = Bbox.union(
+                [
+                    artist.get_window_extent(renderer)
+                    for artist in self.cell_artists[cell]
+                ]
+            )
+            extent = self._extents[cell] = Bbox.from_extents(
+                np.floor(bbox.x0) - _EXTENT_PADDING,
+                np.floor(bbox.y0) - _EXTENT_PADDING,
+                np.ceil(bbox.x1) + _EXTENT_PADDING,
+                np.ceil(bbox.y1) + _EXTENT_PADDING,
+            )
+        return extent
+
+    def _draw_cells(self, region: Optional[Bbox] = None) -> None:
+        """Draw the cell artists, or only those overlapping a region."""
+        # glyphs may spill into neighbours, so keep the full render's order
+        for cell in sorted(self.cell_artists):
+            if region is not None and not self._cell_extent(cell).overlaps(region):
+                continue
+
+            for artist in self.cell_artists[cell]:
+                if region is None:
+                    self.ax.draw_artist(artist)
+                    continue
+
+                self._draw_clipped(artist, region)
+
+    def _draw_clipped(self, artist: Any, region: Bbox) -> None:
+        """Draw an artist inside a region only, so nothing is blended twice."""
+        clip = (artist.get_clip_on(), artist.get_clip_box(), artist.get_clip_path())
+
+        artist.set_clip_on(True)
+        artist.set_clip_box(region)
+        artist.set_clip_path(None)
+        self.ax.draw_artist(artist)
+
+        clip_on, clip_box, clip_path = clip
+        artist.set_clip_on(clip_on)
+        artist.set_clip_box(clip_box)
+        artist.set_clip_path(clip_path)
+
+    def _blit(self, damage: Sequence[Bbox] = ()) -> None:
+        """Repaint the damaged regions (or everything) over the background."""
+        canvas = self.canvas
+        if not self.blitting or self._background is None:
+            canvas.draw()
+            return
+
+        if not damage or len(damage) > _MAX_DAMAGE_REGIONS:
+            canvas.restore_region(self._background)
+            self._draw_cells()
+            canvas.blit(self.figure.bbox)
+        else:
+            height = self.figure.bbox.height
+            for region in damage:
+                # saved regions are addressed from the top-left corner and
+                # restored inclusive of their far edges
+                x0, y0, x1, y1 = region.extents
+                canvas.restore_region(
+                    self._background,
+                    bbox=(x0, height - y1, x1 - 1, height - y0 - 1),
+                    xy=(0, 0),
+                )
+                self._draw_cells(region)
+                canvas.blit(region)
+
+        canvas.flush_events()
+
+    def _on_draw(self, event: Any) -> None:
+        """Cache the freshly drawn background and put the cells back."""
+        if not self.blitting:
+            return
+
+        # a full redraw may follow a resize, which moves every cell
+        self._extents.clear()
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_cells()
+
+    def close(self) -> None:
+        """Disconnect from and close the session's figure."""
+        self.canvas.mpl_disconnect(self._draw_cid)
+        self.renderer.close_figure(self.figure)
+
+    def __enter__(self) -> "RenderSession":
+        """Return the session for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the session."""
+        self.close()
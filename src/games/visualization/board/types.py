@@ -4,6 +4,7 @@ from typing import Any
 from typing import Callable
 from typing import Tuple
 
+import numpy as np
 from numpy.typing import NDArray
 
 
@@ -15,3 +16,12 @@ Overlay = Callable[[Any], None]
 
 # RGB color tuple (matplotlib-compatible)
 CellColor = Tuple[float, float, float]
+
+# Cell value placed at (x, y) plot coordinates
+PlacedCell = Tuple[float, float, Any]
+
+# Grid of small integer cell codes, 0 meaning empty
+EncodedGrid = NDArray[np.int8]
+
+# Shared cell values indexed by code (index 0 is the empty cell, None)
+Codebook = Tuple[Any, ...]
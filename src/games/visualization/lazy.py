@@ -0,0 +1,36 @@
+"""Deferred imports of package exports (PEP 562)."""
+
+from importlib import import_module
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return a package's ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    ``exports`` maps each public name to the submodule defining it, relative
+    to the package. A submodule is imported the first time one of its names
+    is looked up, and the name is then cached in the package namespace.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        """Import an exported name from its submodule on first access."""
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        """List the package's attributes, including exports not yet loaded."""
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
@@ -5,6 +5,7 @@ import inspect
 import pytest
 
 from games.catalog.simulation.base import Simulation
+from games.catalog.simulation.batch import BatchPlan
 from games.primitive.action.base import Action
 from games.primitive.actor.base import Actor
 from games.primitive.rule.base import Rule
@@ -72,3 +73,50 @@ def test_simulation_step_raises_on_unresolved_action(
 
     with pytest.raises(RuntimeError, match="No rule could resolve action"):
         sim.step()
+
+
+@pytest.mark.simulation
+def test_run_batch_falls_back_to_object_path(
+    dummy_actor: Actor, mock_state: State, accepting_rule: Rule
+) -> None:
+    """Test non-vectorized rules are resolved per step through the object path."""
+    sim = DummySimulation(
+        actor=dummy_actor,
+        state=mock_state,
+        rules=[accepting_rule],
+    )
+
+    outcomes = sim.run_batch(3)
+
+    assert not BatchPlan(sim).is_vectorized
+    assert outcomes.shape == (3, 1)
+    assert outcomes.dtype == object
+
+
+@pytest.mark.simulation
+def test_run_batch_raises_on_unresolved_action(
+    dummy_actor: Actor, mock_state: State, rejecting_rule: Rule
+) -> None:
+    """Test run_batch surfaces unresolved actions like step() does."""
+    sim = DummySimulation(
+        actor=dummy_actor,
+        state=mock_state,
+        rules=[rejecting_rule],
+    )
+
+    with pytest.raises(RuntimeError, match="No rule could resolve action"):
+        sim.run_batch(1)
+
+
+@pytest.mark.simulation
+def test_run_stops_when_done(
+    dummy_actor: Actor, mock_state: State, accepting_rule: Rule
+) -> None:
+    """Test run() yields nothing for a simulation that is already done."""
+    sim = DummySimulation(
+        actor=dummy_actor,
+        state=mock_state,
+        rules=[accepting_rule],
+    )
+
+    assert list(sim.run(max_steps=5)) == []
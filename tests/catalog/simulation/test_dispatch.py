@@ -0,0 +1,106 @@
+"""Tests for module games.catalog.simulation.dispatch."""
+
+from typing import List
+
+import pytest
+
+from games.catalog.simulation.dispatch import DispatchCache
+from games.catalog.simulation.dispatch import RuleList
+from games.catalog.simulation.stochastic import DiceRoll
+from games.primitive.action.base import Action
+from games.primitive.rule.base import Rule
+from games.primitive.state.base import State
+
+
+@pytest.mark.simulation
+def test_dispatch_cache_counts_hits_and_misses(
+    mock_action: Action, mock_state: State, accepting_rule: Rule
+) -> None:
+    """Test the first lookup misses and subsequent lookups hit."""
+    cache = DispatchCache()
+
+    for _ in range(3):
+        assert cache.lookup(mock_action, mock_state, [accepting_rule]) is (
+            accepting_rule
+        )
+
+    assert cache.misses == 1
+    assert cache.hits == 2
+    assert cache.hit_rate == pytest.approx(2 / 3)
+    assert len(cache) == 1
+
+
+@pytest.mark.simulation
+def test_dispatch_cache_picks_first_accepting_rule(
+    mock_action: Action,
+    mock_state: State,
+    accepting_rule: Rule,
+    rejecting_rule: Rule,
+) -> None:
+    """Test the memoized winner follows the rule order."""
+    cache = DispatchCache()
+    rules = [rejecting_rule, accepting_rule]
+
+    assert cache.lookup(mock_action, mock_state, rules) is accepting_rule
+
+
+@pytest.mark.simulation
+def test_dispatch_cache_memoizes_missing_rule(
+    mock_action: Action, mock_state: State, rejecting_rule: Rule
+) -> None:
+    """Test pairs without an accepting rule are also memoized."""
+    cache = DispatchCache()
+
+    assert cache.lookup(mock_action, mock_state, [rejecting_rule]) is None
+    assert cache.lookup(mock_action, mock_state, [rejecting_rule]) is None
+    assert cache.hits == 1
+
+
+@pytest.mark.simulation
+def test_rule_list_reports_mutations(accepting_rule: Rule) -> None:
+    """Test every in-place mutation triggers the change callback."""
+    changes: List[int] = []
+    rules = RuleList([], on_change=lambda: changes.append(1))
+
+    rules.append(accepting_rule)
+    rules.extend([accepting_rule])
+    rules.insert(0, accepting_rule)
+    rules[0] = accepting_rule
+    rules += [accepting_rule]
+    rules.pop()
+    rules.remove(accepting_rule)
+    del rules[0]
+    rules.reverse()
+    rules.clear()
+
+    assert len(changes) == 10
+
+
+@pytest.mark.simulation
+def test_simulation_steady_state_hits_cache() -> None:
+    """Test repeated steps resolve rules from the cache."""
+    sim = DiceRoll(num_dice=3, num_sides=6)
+
+    for _ in range(10):
+        sim.step()
+
+    assert sim.dispatch_cache.misses == 1
+    assert sim.dispatch_cache.hits == 29
+
+
+@pytest.mark.simulation
+def test_simulation_rule_mutation_invalidates_cache(rejecting_rule: Rule) -> None:
+    """Test mutating or replacing rules clears memoized winners."""
+    sim = DiceRoll()
+    sim.step()
+    assert len(sim.dispatch_cache) == 1
+
+    sim.rules.insert(0, rejecting_rule)
+    assert len(sim.dispatch_cache) == 0
+
+    sim.step()
+    sim.rules = [rejecting_rule]
+    assert len(sim.dispatch_cache) == 0
+
+    with pytest.raises(RuntimeError, match="No rule could resolve action"):
+        sim.step()
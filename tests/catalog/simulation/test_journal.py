@@ -0,0 +1,141 @@
+"""Tests for module games.catalog.simulation.journal."""
+
+from typing import List
+
+import pytest
+
+from games.catalog.simulation.base import Simulation
+from games.catalog.simulation.journal import UndoJournal
+from games.catalog.simulation.stochastic import CoinFlip
+from games.catalog.simulation.stochastic import DiceRoll
+from games.primitive.rng.stream import PythonRandomStream
+from games.primitive.state.discrete import ChoiceState
+
+
+def _values(sim: Simulation) -> List[int]:
+    """Return the values of a simulation's states."""
+    return [state.value for state in sim.states]
+
+
+@pytest.mark.simulation
+def test_journal_records_only_changes() -> None:
+    """Test unchanged states leave no entry behind."""
+    journal = UndoJournal()
+    state = ChoiceState({1, 2, 3})
+    state.value = 1
+
+    journal.begin_step()
+    journal.record(state, state.snapshot())
+    snapshot = state.snapshot()
+    state.value = 2
+    journal.record(state, snapshot)
+
+    assert (len(journal), journal.changes) == (1, 1)
+
+    journal.undo()
+    assert state.value == 1
+    assert (len(journal), journal.changes) == (0, 0)
+
+
+@pytest.mark.simulation
+def test_journal_rejects_bad_positions() -> None:
+    """Test unknown savepoints and too many undos raise ValueError."""
+    journal = UndoJournal()
+    journal.begin_step()
+
+    with pytest.raises(ValueError):
+        journal.undo(2)
+    with pytest.raises(ValueError):
+        journal.rollback(2)
+
+
+@pytest.mark.simulation
+def test_simulation_undo_restores_earlier_steps() -> None:
+    """Test undoing steps walks back through the visited positions."""
+    sim = DiceRoll(num_dice=3, rng=PythonRandomStream(2))
+    sim.enable_journal()
+    history = [_values(sim)]
+
+    for _ in range(5):
+        sim.step()
+        history.append(_values(sim))
+
+    sim.undo()
+    assert _values(sim) == history[4]
+
+    sim.undo(3)
+    assert _values(sim) == history[1]
+
+    sim.undo()
+    assert _values(sim) == [None, None, None]
+    assert sim.journal is not None and len(sim.journal) == 0
+
+
+@pytest.mark.simulation
+def test_simulation_undoes_steps_that_change_nothing() -> None:
+    """Test steps repeating the previous value are undone one at a time."""
+    sim = CoinFlip(rng=PythonRandomStream(0))
+    sim.enable_journal()
+    history = [_values(sim)]
+
+    for _ in range(12):
+        sim.step()
+        history.append(_values(sim))
+
+    # a coin flipped twelve times lands the same way twice in a row somewhere
+    assert any(history[i] == history[i + 1] for i in range(1, len(history) - 1))
+    assert sim.journal is not None
+
+    for remaining in range(11, -1, -1):
+        sim.undo()
+        assert len(sim.journal) == remaining
+        assert _values(sim) == history[remaining]
+
+
+@pytest.mark.simulation
+def test_simulation_rollback_explores_variations() -> None:
+    """Test a savepoint can be returned to after every variation."""
+    sim = DiceRoll(num_dice=2, rng=PythonRandomStream(8))
+    sim.enable_journal()
+    sim.step()
+    root = _values(sim)
+    savepoint = sim.savepoint()
+
+    for _ in range(3):
+        for _ in range(4):
+            sim.step()
+        sim.rollback(savepoint)
+        assert _values(sim) == root
+
+    # steps taken before the savepoint can still be undone
+    assert sim.journal is not None and len(sim.journal) == 1
+
+
+@pytest.mark.simulation
+def test_simulation_undoes_batches_as_one_step() -> None:
+    """Test a whole batch is rolled back by a single undo."""
+    sim = DiceRoll(num_dice=2, rng=PythonRandomStream(3))
+    sim.step()
+    before = _values(sim)
+
+    sim.enable_journal()
+    sim.run_batch(50)
+    sim.undo()
+
+    assert _values(sim) == before
+
+
+@pytest.mark.simulation
+def test_simulation_undo_requires_journal() -> None:
+    """Test undoing without a journal raises, and forks start without one."""
+    sim = DiceRoll()
+
+    with pytest.raises(RuntimeError):
+        sim.undo()
+
+    sim.enable_journal()
+    assert sim.fork().journal is None
+
+    sim.disable_journal()
+    with pytest.raises(RuntimeError):
+        sim.savepoint()
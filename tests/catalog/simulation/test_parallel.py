@@ -0,0 +1,97 @@
+"""Tests for module games.catalog.simulation.parallel."""
+
+from functools import partial
+
+import numpy as np
+import pytest
+
+from games.catalog.simulation.parallel import ReplicaResult
+from games.catalog.simulation.parallel import run_replicas
+from games.catalog.simulation.stats import ChoiceCounter
+from games.catalog.simulation.stats import histograms
+from games.catalog.simulation.stochastic import CoinFlip
+from games.catalog.simulation.stochastic import DiceRoll
+
+
+@pytest.mark.simulation
+def test_histograms_count_each_state_column() -> None:
+    """Test per-state histograms for native and object outcome arrays."""
+    numeric = np.array([[1, 2], [1, 3], [2, 3]])
+    mixed = np.array([["a"], [1], ["a"]], dtype=object)
+
+    assert histograms(numeric) == [{1: 2, 2: 1}, {2: 1, 3: 2}]
+    assert histograms(mixed) == [{"a": 2, 1: 1}]
+
+
+@pytest.mark.simulation
+def test_replica_result_merge_adds_counts() -> None:
+    """Test merging sums replicas and histogram counts."""
+    result = ReplicaResult(1, 5, [{"H": 3, "T": 2}])
+    result.merge(ReplicaResult(2, 5, [{"H": 4, "T": 6}]))
+
+    assert result.n_replicas == 3
+    assert result.histograms == [{"H": 7, "T": 8}]
+    assert result.frequencies(0) == {"H": 7 / 15, "T": 8 / 15}
+
+
+@pytest.mark.simulation
+def test_replica_result_merge_rejects_different_budgets() -> None:
+    """Test results with different step budgets cannot be merged."""
+    with pytest.raises(ValueError):
+        ReplicaResult(1, 5, [{}]).merge(ReplicaResult(1, 6, [{}]))
+
+
+@pytest.mark.simulation
+def test_run_replicas_counts_every_draw() -> None:
+    """Test all replicas and steps end up in the merged histograms."""
+    result = run_replicas(
+        partial(DiceRoll, num_dice=2, num_sides=4),
+        n_replicas=10,
+        n_steps=50,
+        seed=0,
+        max_workers=2,
+    )
+
+    assert result.n_replicas == 10
+    assert len(result.histograms) == 2
+    assert all(sum(h.values()) == 500 for h in result.histograms)
+    assert all(set(h) <= {1, 2, 3, 4} for h in result.histograms)
+
+
+@pytest.mark.simulation
+def test_run_replicas_is_reproducible_across_worker_counts() -> None:
+    """Test a seeded run does not depend on how replicas are distributed."""
+    one = run_replicas(CoinFlip, n_replicas=6, n_steps=20, seed=7, max_workers=1)
+    two = run_replicas(CoinFlip, n_replicas=6, n_steps=20, seed=7, max_workers=2)
+
+    assert one.histograms == two.histograms
+
+
+@pytest.mark.simulation
+def test_run_replicas_rejects_empty_workloads() -> None:
+    """Test zero replicas, steps or chunks per worker raise ValueError."""
+    with pytest.raises(ValueError):
+        run_replicas(CoinFlip, n_replicas=0, n_steps=1)
+    with pytest.raises(ValueError):
+        run_replicas(CoinFlip, n_replicas=1, n_steps=0)
+    with pytest.raises(ValueError):
+        run_replicas(CoinFlip, n_replicas=1, n_steps=1, chunks_per_worker=0)
+    with pytest.raises(ValueError):
+        run_replicas(CoinFlip, n_replicas=1, n_steps=1, chunks_per_worker=-1)
+
+
+@pytest.mark.simulation
+def test_run_replicas_merges_accumulators() -> None:
+    """Test accumulators from every chunk are merged into the result."""
+    result = run_replicas(
+        CoinFlip,
+        n_replicas=8,
+        n_steps=25,
+        seed=0,
+        max_workers=2,
+        accumulators=[ChoiceCounter],
+    )
+
+    (counter,) = result.accumulators
+    assert isinstance(counter, ChoiceCounter)
+    assert counter.counts == result.histograms
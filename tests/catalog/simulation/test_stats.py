@@ -0,0 +1,112 @@
+"""Tests for module games.catalog.simulation.stats."""
+
+import numpy as np
+import pytest
+
+from games.catalog.simulation.stats import ChoiceCounter
+from games.catalog.simulation.stats import DiceSumDistribution
+from games.catalog.simulation.stats import RunningMoments
+from games.catalog.simulation.stats import chi_square_uniform
+from games.catalog.simulation.stochastic import DiceRoll
+from games.primitive.rng.stream import NumpyRandomStream
+
+
+@pytest.mark.simulation
+def test_chi_square_uniform_counts_unseen_choices() -> None:
+    """Test the statistic against a uniform expectation."""
+    assert chi_square_uniform({"H": 5, "T": 5}) == 0.0
+    assert chi_square_uniform({"H": 10}, choices=["H", "T"]) == pytest.approx(10.0)
+
+    with pytest.raises(ValueError):
+        chi_square_uniform({})
+    with pytest.raises(ValueError):
+        chi_square_uniform({}, choices=["H"])
+
+
+@pytest.mark.simulation
+def test_choice_counter_step_and_batch_agree() -> None:
+    """Test per-step and per-batch counting give the same histograms."""
+    outcomes = np.array([[1, 2], [1, 3], [2, 3]])
+    stepwise, batched = ChoiceCounter(), ChoiceCounter()
+
+    for row in outcomes.tolist():
+        stepwise.update(row)
+    batched.update_batch(outcomes)
+
+    assert stepwise.counts == batched.counts == [{1: 2, 2: 1}, {2: 1, 3: 2}]
+    assert stepwise.chi_square(0, choices=[1, 2, 3]) == pytest.approx(2.0)
+
+
+@pytest.mark.simulation
+def test_choice_counter_merge() -> None:
+    """Test merging adds the histograms of both counters."""
+    first, second = ChoiceCounter(), ChoiceCounter()
+    first.update(["H"])
+    second.update_batch(np.array([["H"], ["T"]]))
+
+    first.merge(second)
+
+    assert first.counts == [{"H": 2, "T": 1}]
+
+
+@pytest.mark.simulation
+def test_running_moments_match_numpy() -> None:
+    """Test step, batch and merged moments all match a direct computation."""
+    data = np.random.default_rng(0).normal(size=(200, 3))
+    stepwise, batched, merged = RunningMoments(), RunningMoments(), RunningMoments()
+
+    for row in data.tolist():
+        stepwise.update(row)
+    batched.update_batch(data[:120])
+    batched.update_batch(data[120:])
+    merged.merge(batched)
+
+    for moments in (stepwise, batched, merged):
+        assert moments.count == 200
+        np.testing.assert_allclose(moments.mean, data.mean(axis=0))
+        np.testing.assert_allclose(moments.variance(ddof=1), data.var(axis=0, ddof=1))
+        np.testing.assert_allclose(moments.std(), data.std(axis=0))
+
+
+@pytest.mark.simulation
+def test_running_moments_require_observations() -> None:
+    """Test variance needs more observations than degrees of freedom."""
+    moments = RunningMoments()
+    moments.update_batch(np.empty((0, 2)))
+
+    with pytest.raises(ValueError):
+        moments.variance()
+
+
+@pytest.mark.simulation
+def test_dice_sum_distribution() -> None:
+    """Test totals are counted per step and per batch."""
+    dist = DiceSumDistribution()
+    dist.update([1, 2])
+    dist.update_batch(np.array([[1, 2], [3, 3]]))
+    dist.update_batch(np.empty((0, 2)))
+
+    other = DiceSumDistribution()
+    other.update([6, 6])
+    dist.merge(other)
+
+    assert dist.count == 4
+    assert dist.pmf() == {3: 0.5, 6: 0.25, 12: 0.25}
+
+
+@pytest.mark.simulation
+def test_accumulators_attach_to_simulation() -> None:
+    """Test attached accumulators see every step and every batch."""
+    sim = DiceRoll(num_dice=2, num_sides=6, rng=NumpyRandomStream(0))
+    dist = DiceSumDistribution()
+    sim.attach(dist)
+
+    for _ in range(10):
+        sim.step()
+    sim.run_batch(90)
+    assert dist.count == 100
+    assert set(dist.counts) <= set(range(2, 13))
+
+    sim.detach(dist)
+    sim.step()
+    assert dist.count == 100
@@ -1,10 +1,18 @@
 """Test suite for 'games.catalog.simulation.stochastic' module."""
 
+from typing import Type
+
+import numpy as np
 import pytest
 
+from games.catalog.simulation.batch import BatchPlan
+from games.catalog.simulation.stats import ChoiceCounter
 from games.catalog.simulation.stochastic import CardDraw
 from games.catalog.simulation.stochastic import CoinFlip
 from games.catalog.simulation.stochastic import DiceRoll
+from games.primitive.rng.base import RandomStream
+from games.primitive.rng.stream import NumpyRandomStream
+from games.primitive.rng.stream import PythonRandomStream
 
 
 @pytest.mark.simulation
@@ -69,3 +77,235 @@ def test_carddraw_deck_completeness() -> None:
     sim = CardDraw()
     assert len(sim.states[0].available_values) == 52
     assert len(set(sim.states[0].available_values)) == 52
+
+
+@pytest.mark.simulation
+def test_coinflip_run_batch_shape_and_values() -> None:
+    """Test run_batch returns one row of valid outcomes per step."""
+    sim = CoinFlip()
+    outcomes = sim.run_batch(100, rng=np.random.default_rng(0))
+
+    assert outcomes.shape == (100, 1)
+    assert set(outcomes[:, 0].tolist()) <= {"Heads", "Tails"}
+
+
+@pytest.mark.simulation
+def test_diceroll_run_batch_is_vectorized_and_numeric() -> None:
+    """Test DiceRoll compiles to a fully vectorized plan with integer output."""
+    sim = DiceRoll(num_dice=4, num_sides=8)
+
+    assert BatchPlan(sim).is_vectorized
+
+    outcomes = sim.run_batch(1_000, rng=np.random.default_rng(1))
+
+    assert outcomes.shape == (1_000, 4)
+    assert outcomes.dtype.kind == "i"
+    assert outcomes.min() >= 1
+    assert outcomes.max() <= 8
+
+
+@pytest.mark.simulation
+def test_run_batch_leaves_states_at_final_outcome() -> None:
+    """Test states hold the last row of outcomes after a batch."""
+    sim = DiceRoll(num_dice=3, num_sides=6)
+    outcomes = sim.run_batch(10, rng=np.random.default_rng(2))
+
+    assert [state.value for state in sim.states] == outcomes[-1].tolist()
+
+
+@pytest.mark.simulation
+def test_run_batch_is_reproducible_with_seeded_generator() -> None:
+    """Test identical generators yield identical outcome arrays."""
+    first = CardDraw().run_batch(50, rng=np.random.default_rng(3))
+    second = CardDraw().run_batch(50, rng=np.random.default_rng(3))
+
+    assert (first == second).all()
+
+
+@pytest.mark.simulation
+def test_run_batch_rejects_negative_steps() -> None:
+    """Test run_batch raises ValueError for a negative step count."""
+    with pytest.raises(ValueError):
+        CoinFlip().run_batch(-1)
+
+
+@pytest.mark.simulation
+@pytest.mark.parametrize("stream_type", [PythonRandomStream, NumpyRandomStream])
+def test_seeded_simulations_are_reproducible(
+    stream_type: Type[RandomStream],
+) -> None:
+    """Test simulations seeded alike step through identical outcomes."""
+    first = DiceRoll(num_dice=2, rng=stream_type(11))
+    second = DiceRoll(num_dice=2, rng=stream_type(11))
+
+    for _ in range(20):
+        first.step()
+        second.step()
+        assert [s.value for s in first.states] == [s.value for s in second.states]
+
+
+@pytest.mark.simulation
+def test_simulation_binds_its_stream_to_rules() -> None:
+    """Test stochastic rules draw from the owning simulation's stream."""
+    sim = CoinFlip()
+    stream = NumpyRandomStream(0)
+
+    sim.rng = stream
+    assert sim.rules[0].rng is stream  # type: ignore[attr-defined]
+
+    sim.seed(1)
+    assert sim.rules[0].rng is sim.rng  # type: ignore[attr-defined]
+    assert isinstance(sim.rng, NumpyRandomStream)
+
+
+@pytest.mark.simulation
+def test_run_batch_draws_from_simulation_stream() -> None:
+    """Test run_batch is reproducible through the simulation's own seed."""
+    first = CardDraw(rng=NumpyRandomStream(9)).run_batch(30)
+    second = CardDraw(rng=NumpyRandomStream(9)).run_batch(30)
+
+    assert (first == second).all()
+
+
+@pytest.mark.simulation
+def test_run_yields_bounded_chunks() -> None:
+    """Test run() honours the step budget and chunk size."""
+    sim = DiceRoll(num_dice=3, num_sides=6)
+
+    chunks = list(sim.run(max_steps=10, batch_size=4))
+
+    assert [chunk.shape for chunk in chunks] == [(4, 3), (4, 3), (2, 3)]
+    assert all(chunk.dtype.kind == "i" for chunk in chunks)
+    assert chunks[-1][-1].tolist() == [state.value for state in sim.states]
+
+
+@pytest.mark.simulation
+def test_run_is_lazy_without_budget() -> None:
+    """Test run() without a budget can be consumed chunk by chunk."""
+    chunk = next(CardDraw().run(batch_size=5))
+
+    assert chunk.shape == (5, 1)
+    assert set(chunk[:, 0].tolist()) <= CardDraw().states[0].available_values
+
+
+@pytest.mark.simulation
+def test_run_rejects_bad_arguments() -> None:
+    """Test run() validates its budget and batch size."""
+    with pytest.raises(ValueError):
+        next(CoinFlip().run(batch_size=0))
+    with pytest.raises(ValueError):
+        next(CoinFlip().run(max_steps=-1))
+
+
+@pytest.mark.simulation
+def test_fork_copies_only_state_values() -> None:
+    """Test a fork steps on its own while sharing choice sets and rules."""
+    sim = DiceRoll(num_dice=3, rng=PythonRandomStream(4))
+    sim.step()
+    before = [s.value for s in sim.states]
+
+    fork = sim.fork()
+    for _ in range(5):
+        fork.step()
+
+    assert [s.value for s in sim.states] == before
+    assert fork.states[0] is not sim.states[0]
+    assert fork.states[0].values is sim.states[0].values  # type: ignore[attr-defined]
+    assert fork.rules[0] is sim.rules[0]
+    assert fork.rng is sim.rng
+
+
+@pytest.mark.simulation
+def test_fork_with_own_stream_rebinds_stochastic_components() -> None:
+    """Test a fork given a stream draws from it, leaving the parent bound."""
+    sim = CoinFlip(rng=PythonRandomStream(0))
+    sim.step()
+    stream = NumpyRandomStream(5)
+
+    fork = sim.fork(stream)
+    fork.step()
+
+    assert fork.rules[0] is not sim.rules[0]
+    assert fork.rules[0].rng is stream  # type: ignore[attr-defined]
+    assert sim.rules[0].rng is sim.rng  # type: ignore[attr-defined]
+
+    # forks seeded alike replay the same outcomes
+    first, second = sim.fork(NumpyRandomStream(7)), sim.fork(NumpyRandomStream(7))
+    for _ in range(10):
+        first.step()
+        second.step()
+        assert first.states[0].value == second.states[0].value
+
+
+@pytest.mark.simulation
+def test_fork_leaves_accumulators_and_rules_behind() -> None:
+    """Test a fork has no accumulators and edits to its rules stay its own."""
+    sim = CardDraw()
+    sim.attach(ChoiceCounter())
+
+    fork = sim.fork()
+    fork.rules.clear()
+
+    assert fork.accumulators == []
+    assert len(sim.accumulators) == 1
+    assert len(sim.rules) == 1
+
+
+def _rehashed(sim: DiceRoll) -> int:
+    """Return the hash of a simulation's dice computed from scratch."""
+    fresh = DiceRoll(num_dice=sim.num_dice, num_sides=sim.num_sides)
+    for state, source in zip(fresh.states, sim.states):  # noqa: B905
+        state.restore(source.snapshot())
+    return fresh.state_hash
+
+
+@pytest.mark.simulation
+def test_state_hash_follows_every_change() -> None:
+    """Test the running hash always matches one computed from scratch."""
+    sim = DiceRoll(num_dice=4, rng=PythonRandomStream(6))
+    empty = sim.state_hash
+
+    for _ in range(10):
+        sim.step()
+        assert sim.state_hash == _rehashed(sim)
+
+    sim.run_batch(25)
+    assert sim.state_hash == _rehashed(sim)
+
+    for state in sim.states:
+        state.reset()
+    assert sim.state_hash == empty
+
+
+@pytest.mark.simulation
+def test_state_hash_tells_positions_apart() -> None:
+    """Test equal dice hash alike, and the same values on other dice do not."""
+    first, second = DiceRoll(num_dice=2), DiceRoll(num_dice=2)
+    first.states[0].value, first.states[1].value = 1, 2
+    second.states[0].value, second.states[1].value = 2, 1
+
+    assert first.state_hash != second.state_hash
+
+    second.states[0].value, second.states[1].value = 1, 2
+    assert first.state_hash == second.state_hash
+
+
+@pytest.mark.simulation
+def test_state_hash_of_forks_and_undos() -> None:
+    """Test forks keep their own hash and undoing restores the old one."""
+    sim = DiceRoll(num_dice=3, rng=PythonRandomStream(1))
+    sim.step()
+    sim.enable_journal()
+    before = sim.state_hash
+
+    fork = sim.fork(PythonRandomStream(2))
+    assert fork.state_hash == before
+
+    for _ in range(5):
+        fork.step()
+    assert sim.state_hash == before
+    assert fork.state_hash == _rehashed(fork)
+
+    sim.step()
+    sim.undo()
+    assert sim.state_hash == before
@@ -6,6 +6,7 @@ from typing import Callable
 import pytest
 
 from games.primitive.action.base import Action
+from games.primitive.action.random import RandomChoiceAction
 from games.primitive.state.base import State
 
 
@@ -77,3 +78,28 @@ def test_repr_output(mock_action: Action) -> None:
         "Mock action for testing" in output
         or "desc='Mock action for testing'" in output
     )
+
+
+@pytest.mark.action
+def test_reset_restores_initial_state(
+    mock_action: Action, dummy_executor: Callable[[State], None]
+) -> None:
+    """Test reset() clears the executor and both validation flags."""
+    mock_action.executor = dummy_executor
+    mock_action.invalidate()
+
+    mock_action.reset()
+    mock_action.validate()
+
+    assert mock_action.is_valid
+    assert mock_action.executor is None
+
+
+@pytest.mark.action
+def test_slotted_actions_have_no_instance_dict() -> None:
+    """Test concrete library actions use the slotted layout."""
+    action = RandomChoiceAction()
+
+    assert not hasattr(action, "__dict__")
+    with pytest.raises(AttributeError):
+        action.value = 1  # type: ignore[attr-defined]
@@ -0,0 +1,72 @@
+"""Tests for module games.primitive.action.pool."""
+
+import pytest
+
+from games.catalog.simulation.stochastic import DiceRoll
+from games.primitive.action.pool import ActionPool
+from games.primitive.action.random import RandomChoiceAction
+
+
+@pytest.mark.action
+def test_pool_reuses_released_actions() -> None:
+    """Test a released action is reset and handed out again."""
+    pool = ActionPool()
+    action = pool.acquire(RandomChoiceAction)
+    action.validate()
+
+    pool.release(action)
+    again = pool.acquire(RandomChoiceAction)
+
+    assert again is action
+    assert not again.is_valid
+    assert (pool.created, pool.reused) == (1, 1)
+
+
+@pytest.mark.action
+def test_pool_ignores_duplicates_and_overflow() -> None:
+    """Test the pool never stores an action twice nor beyond its size."""
+    pool = ActionPool(max_size=1)
+    first, second = RandomChoiceAction(), RandomChoiceAction()
+
+    pool.release(first)
+    pool.release(first)
+    pool.release(second)
+
+    assert len(pool) == 1
+
+
+@pytest.mark.action
+def test_pool_rejects_non_positive_size() -> None:
+    """Test a pool must be able to hold at least one action."""
+    with pytest.raises(ValueError):
+        ActionPool(max_size=0)
+
+
+@pytest.mark.action
+def test_simulation_recycles_actions_through_pool() -> None:
+    """Test a pooled simulation allocates actions only once."""
+    sim = DiceRoll(num_dice=3)
+    sim.action_pool = ActionPool()
+
+    for _ in range(50):
+        sim.step()
+
+    assert sim.action_pool.created == 1
+    assert sim.action_pool.reused == 149
+    assert all(state.is_valid() for state in sim.states)
+
+    sim.action_pool = None
+    assert all(actor.pool is None for actor in sim.actors)
+
+
+@pytest.mark.action
+def test_batch_planning_returns_probe_actions_to_pool() -> None:
+    """Test compiling batch plans does not drain the pool."""
+    sim = DiceRoll(num_dice=3)
+    sim.action_pool = ActionPool()
+
+    for _ in range(20):
+        sim.run_batch(5)
+
+    assert sim.action_pool.created == 1
+    assert len(sim.action_pool) == 1
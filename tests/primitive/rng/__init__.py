@@ -0,0 +1 @@
+"""RNG subpackage within the 'tests/primitive' package."""
@@ -0,0 +1,14 @@
+"""Tests for module games.primitive.rng.base."""
+
+import inspect
+
+import pytest
+
+from games.primitive.rng.base import RandomStream
+
+
+@pytest.mark.abc
+@pytest.mark.rng
+def test_random_stream_abc_is_abstract() -> None:
+    """Test RandomStream is abstract."""
+    assert inspect.isabstract(RandomStream)
@@ -0,0 +1,24 @@
+"""Tests for module games.primitive.rng.stochastic."""
+
+import pytest
+
+from games.primitive.rng.stochastic import Stochastic
+from games.primitive.rng.stochastic import default_stream
+from games.primitive.rng.stream import NumpyRandomStream
+
+
+@pytest.mark.rng
+def test_unbound_component_uses_default_stream() -> None:
+    """Test components without a bound stream share the default one."""
+    assert Stochastic().rng is default_stream()
+
+
+@pytest.mark.rng
+def test_bound_stream_is_used() -> None:
+    """Test binding a stream overrides the default."""
+    component = Stochastic()
+    stream = NumpyRandomStream(0)
+
+    component.rng = stream
+
+    assert component.rng is stream
@@ -0,0 +1,83 @@
+"""Tests for module games.primitive.rng.stream."""
+
+from typing import Type
+
+import numpy as np
+import pytest
+
+from games.primitive.rng.base import RandomStream
+from games.primitive.rng.stream import NumpyRandomStream
+from games.primitive.rng.stream import PythonRandomStream
+
+
+@pytest.fixture(params=[PythonRandomStream, NumpyRandomStream])
+def stream_type(request: pytest.FixtureRequest) -> Type[RandomStream]:
+    """Provide each concrete stream implementation."""
+    stream: Type[RandomStream] = request.param
+    return stream
+
+
+@pytest.mark.rng
+def test_stream_draws_are_in_range(stream_type: Type[RandomStream]) -> None:
+    """Test scalar and bulk draws stay within their bounds."""
+    stream = stream_type(0)
+
+    assert all(0 <= stream.randbelow(6) < 6 for _ in range(1_000))
+    assert all(0.0 <= stream.random() < 1.0 for _ in range(1_000))
+    assert stream.choice("abc") in "abc"
+
+    draws = stream.integers(6, size=1_000)
+    assert draws.shape == (1_000,)
+    assert draws.min() >= 0 and draws.max() < 6
+
+
+@pytest.mark.rng
+def test_stream_is_reproducible(stream_type: Type[RandomStream]) -> None:
+    """Test equal seeds yield equal sequences."""
+    first, second = stream_type(42), stream_type(42)
+
+    assert [first.randbelow(100) for _ in range(50)] == [
+        second.randbelow(100) for _ in range(50)
+    ]
+    assert (first.integers(100, 50) == second.integers(100, 50)).all()
+
+
+@pytest.mark.rng
+def test_stream_spawns_independent_children(stream_type: Type[RandomStream]) -> None:
+    """Test spawned children are reproducible and differ from each other."""
+    children = stream_type(1).spawn(2)
+    again = stream_type(1).spawn(2)
+
+    assert all(isinstance(child, stream_type) for child in children)
+
+    draws = [[child.randbelow(1 << 30) for _ in range(5)] for child in children]
+    assert draws[0] != draws[1]
+    assert draws[0] == [again[0].randbelow(1 << 30) for _ in range(5)]
+
+
+@pytest.mark.rng
+def test_stream_accepts_seed_sequence(stream_type: Type[RandomStream]) -> None:
+    """Test a SeedSequence is used as-is."""
+    seed = np.random.SeedSequence(5)
+
+    assert stream_type(seed).seed_sequence is seed
+    assert "entropy=5" in repr(stream_type(seed))
+
+
+@pytest.mark.rng
+def test_numpy_stream_refills_blocks() -> None:
+    """Test scalar draws continue seamlessly across block boundaries."""
+    stream = NumpyRandomStream(3, block_size=4)
+    reference = np.random.default_rng(np.random.SeedSequence(3))
+
+    expected = np.concatenate([reference.random(4), reference.random(4)])
+    assert [stream.random() for _ in range(8)] == expected.tolist()
+
+
+@pytest.mark.rng
+def test_numpy_stream_rejects_bad_arguments() -> None:
+    """Test invalid block sizes and bounds raise ValueError."""
+    with pytest.raises(ValueError):
+        NumpyRandomStream(block_size=0)
+    with pytest.raises(ValueError):
+        NumpyRandomStream().randbelow(0)
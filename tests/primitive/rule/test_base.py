@@ -78,6 +78,36 @@ def test_executor_rule_sets_executor_and_validates(
     assert mock_action.is_valid
 
 
+@pytest.mark.rule
+def test_executor_rule_reuses_bound_executor(
+    mock_action: Action, mock_state: State, dummy_executor: Callable[[State], None]
+) -> None:
+    """Test reusable executors are bound once per action/state type pair."""
+    calls: List[Action] = []
+
+    class MyExecutorRule(ExecutorRule):
+        reuse_executors = True
+
+        def accepts(self, action: Action, state: State) -> bool:
+            return True
+
+        def bind_executor(
+            self, action: Action, state: State
+        ) -> Callable[[State], None]:
+            calls.append(action)
+            return lambda state: None
+
+    rule = MyExecutorRule()
+    first = rule.executor_for(mock_action, mock_state)
+    rule.apply(mock_action, mock_state)
+    assert mock_action.executor is first
+    assert len(calls) == 1
+
+    rule.clear_executors()
+    assert rule.executor_for(mock_action, mock_state) is not first
+    assert len(calls) == 2
+
+
 @pytest.mark.rule
 def test_compound_rule_applies_all_rules(
     mock_action: Action, mock_state: State
@@ -1,5 +1,6 @@
 """Test suite for 'games.primitive.rule.random' module."""
 
+import numpy as np
 import pytest
 
 from games.primitive.action.random import RandomChoiceAction
@@ -25,3 +26,42 @@ def test_random_choice_applies_value() -> None:
     # Execute the action's effect on the state
     action.apply(state)
     assert state.value in state.available_values
+
+
+@pytest.mark.rule
+def test_random_choice_reuses_one_executor() -> None:
+    """Test RandomChoiceRule hands the same executor to every action."""
+    state = ChoiceState(choices={10, 20, 30})
+    rule = RandomChoiceRule()
+    first, second = RandomChoiceAction(), RandomChoiceAction()
+
+    rule.apply(first, state)
+    rule.apply(second, state)
+
+    assert first.executor is second.executor
+    assert first.executor is not None
+
+
+@pytest.mark.rule
+def test_random_choice_batch_executor_draws_valid_values() -> None:
+    """Test RandomChoiceRule's batch executor draws only available choices."""
+    state = ChoiceState(choices={10, 20, 30})
+    action = RandomChoiceAction()
+    rule = RandomChoiceRule()
+
+    draws = rule.bind_batch_executor(action, state)(np.random.default_rng(0), 500)
+
+    assert draws.shape == (500,)
+    assert set(draws.tolist()) == {10, 20, 30}
+
+
+@pytest.mark.rule
+def test_random_choice_batch_executor_handles_mixed_types() -> None:
+    """Test heterogeneous choices are kept as Python objects."""
+    state = ChoiceState(choices={1, "one", (1, 1)})
+    executor = RandomChoiceRule().bind_batch_executor(RandomChoiceAction(), state)
+
+    draws = executor(np.random.default_rng(0), 200)
+
+    assert draws.dtype == object
+    assert set(draws.tolist()) == {1, "one", (1, 1)}
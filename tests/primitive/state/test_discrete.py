@@ -1,7 +1,10 @@
 """Test suite for games.primitive.state.discrete module."""
 
+import copy
+
 import pytest
 
+from games.primitive.state.discrete import NO_CHOICE
 from games.primitive.state.discrete import ChoiceState
 
 
@@ -51,3 +54,101 @@ def test_empty_choices_raises() -> None:
     """Test ChoiceState raises ValueError when no choices available."""
     with pytest.raises(ValueError):
         ChoiceState(choices=set())
+
+
+@pytest.mark.state
+def test_choices_are_indexed_in_sorted_order() -> None:
+    """Test comparable choices get stable, sorted codes."""
+    state = ChoiceState(choices={"c", "a", "b"})
+
+    assert state.values == ("a", "b", "c")
+    assert state.size == 3
+    assert state.index("b") == 1
+    assert state.values_array.tolist() == ["a", "b", "c"]
+
+
+@pytest.mark.state
+def test_values_array_is_read_only() -> None:
+    """Test the array view of the choices cannot be mutated."""
+    state = ChoiceState(choices={1, 2, 3})
+
+    assert state.values_array.dtype.kind == "i"
+    with pytest.raises(ValueError):
+        state.values_array[0] = 5
+
+
+@pytest.mark.state
+def test_value_is_stored_as_code() -> None:
+    """Test setting a value or a code keeps both views consistent."""
+    state = ChoiceState(choices={10, 20, 30})
+    assert state.code == NO_CHOICE
+
+    state.value = 30
+    assert state.code == 2
+
+    state.set_code(0)
+    assert state.value == 10
+
+    state.reset()
+    assert state.code == NO_CHOICE
+    assert not state.is_valid()
+
+
+@pytest.mark.state
+def test_invalid_code_and_index_raise() -> None:
+    """Test out-of-range codes and unknown values raise ValueError."""
+    state = ChoiceState(choices={"x", "y"})
+
+    with pytest.raises(ValueError):
+        state.set_code(2)
+    with pytest.raises(ValueError):
+        state.index("z")
+
+
+@pytest.mark.state
+def test_mixed_choices_fall_back_to_object_array() -> None:
+    """Test unorderable choices are still indexed and kept as objects."""
+    choices = {1, "one", (1, 1)}
+    state = ChoiceState(choices=choices)
+
+    assert set(state.values) == choices
+    assert state.values_array.dtype == object
+    assert all(state.index(value) == i for i, value in enumerate(state.values))
+
+
+@pytest.mark.state
+def test_sample_code_uses_given_source() -> None:
+    """Test sampling draws an index below the number of choices."""
+    state = ChoiceState(choices={"a", "b", "c", "d"})
+
+    assert state.sample_code(lambda n: n - 1) == 3
+    assert all(0 <= state.sample_code() < 4 for _ in range(50))
+
+
+@pytest.mark.state
+def test_snapshot_is_the_code() -> None:
+    """Test snapshots are codes and restore unset values too."""
+    state = ChoiceState(choices={"a", "b"})
+    empty = state.snapshot()
+    state.value = "b"
+
+    assert state.snapshot() == 1
+
+    state.restore(empty)
+    assert state.value is None
+    state.restore(0)
+    assert state.value == "a"
+
+
+@pytest.mark.state
+def test_copy_shares_choices_but_not_value() -> None:
+    """Test a copied state keeps its own value over the same choices."""
+    state = ChoiceState(choices={1, 2, 3})
+    state.value = 1
+
+    clone = copy.copy(state)
+    clone.value = 3
+
+    assert state.value == 1
+    assert clone.values is state.values
+    assert clone.values_array is state.values_array
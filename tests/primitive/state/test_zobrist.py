@@ -0,0 +1,42 @@
+"""Test suite for games.primitive.state.zobrist module."""
+
+import pytest
+
+from games.primitive.state.discrete import ChoiceState
+from games.primitive.state.zobrist import ZobristHash
+from games.primitive.state.zobrist import zobrist_keys
+
+
+@pytest.mark.state
+def test_keys_are_fixed_per_position() -> None:
+    """Test key tables are reproducible, distinct per position and 64-bit."""
+    keys = zobrist_keys(0, 6)
+
+    assert keys == zobrist_keys(0, 6)
+    assert keys != zobrist_keys(1, 6)
+    assert keys[0] == 0
+    assert len(set(keys)) == 7
+    assert all(0 <= key < 2**64 for key in keys)
+
+
+@pytest.mark.state
+def test_bound_state_keeps_hash_in_step() -> None:
+    """Test every way of changing a value updates the bound hash."""
+    state = ChoiceState({"a", "b", "c"})
+    hasher = ZobristHash()
+    state.bind_hash(hasher, 0)
+    keys = zobrist_keys(0, 3)
+
+    assert hasher.value == 0
+
+    state.value = "b"
+    assert hasher.value == keys[2]
+
+    state.set_code(2)
+    assert hasher.value == keys[3]
+
+    state.restore(0)
+    assert hasher.value == keys[1]
+
+    state.reset()
+    assert hasher.value == 0
@@ -0,0 +1,77 @@
+"""Tests for the benchmark suite."""
+
+from pathlib import Path
+
+from benchmarks.imports import check_budgets
+from benchmarks.imports import import_time_ms
+from benchmarks.suite import BENCHMARKS
+from benchmarks.suite import Benchmark
+from benchmarks.suite import BenchmarkResult
+from benchmarks.suite import compare
+from benchmarks.suite import load_baseline
+from benchmarks.suite import main
+from benchmarks.suite import measure
+
+
+def test_measure_reports_positive_figures() -> None:
+    """Test measuring a trivial workload yields sane numbers."""
+    result = measure(Benchmark("noop", lambda: lambda: None), min_time=0.01)
+
+    assert result.name == "noop"
+    assert result.latency_us > 0
+    assert result.calls_per_sec > 0
+    assert result.peak_bytes >= 0
+
+
+def test_compare_flags_only_regressions() -> None:
+    """Test latency and memory beyond the threshold are reported."""
+    baseline = {
+        "fast": {"latency_us": 10.0, "peak_bytes": 0},
+        "slow": {"latency_us": 10.0, "peak_bytes": 0},
+        "heavy": {"latency_us": 10.0, "peak_bytes": 1000},
+    }
+    results = [
+        BenchmarkResult("fast", 1e5, 11.0, 0),
+        BenchmarkResult("slow", 1e5, 20.0, 0),
+        BenchmarkResult("heavy", 1e5, 10.0, 10**6),
+        BenchmarkResult("new", 1e5, 99.0, 10**6),
+    ]
+
+    regressions = compare(baseline, results, threshold=0.25)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("slow: latency")
+    assert regressions[1].startswith("heavy: peak memory")
+
+
+def test_main_updates_and_checks_baseline(tmp_path: Path) -> None:
+    """Test a run against its own fresh baseline passes."""
+    baseline = tmp_path / "baseline.json"
+    argv = ["--baseline", str(baseline), "--min-time", "0.01"]
+    only = ["--only", "coin_flip_step", "choice_state_update"]
+
+    assert main([*argv, *only, "--update"]) == 0
+    assert set(load_baseline(baseline)) == {"coin_flip_step", "choice_state_update"}
+    assert main([*argv, *only, "--threshold", "100"]) == 0
+
+
+def test_main_records_missing_baseline(tmp_path: Path) -> None:
+    """Test a first run on a machine records its baseline instead of checking."""
+    baseline = tmp_path / "baseline.json"
+    argv = ["--baseline", str(baseline), "--min-time", "0.01"]
+
+    assert main([*argv, "--only", "coin_flip_step"]) == 0
+    assert set(load_baseline(baseline)) == {"coin_flip_step"}
+
+
+def test_benchmark_names_are_unique() -> None:
+    """Test every benchmark has its own baseline key."""
+    names = [benchmark.name for benchmark in BENCHMARKS]
+    assert len(names) == len(set(names))
+
+
+def test_import_budgets_report_overruns() -> None:
+    """Test modules are timed and only those over budget are reported."""
+    assert import_time_ms("games.catalog", repeat=1) > 0
+    assert check_budgets({"games.catalog": 1e6}, repeat=1) == []
+    assert len(check_budgets({"games.catalog": 0.0}, repeat=1)) == 1
@@ -1,10 +1,15 @@
 """Tests for module games.visualization.board.adapter.chess."""
 
 import chess
+import numpy as np
 import pytest
 
+from games.visualization.board.adapter.chess import CHESS_CODEBOOK
 from games.visualization.board.adapter.chess import ChessBoardWrapper
+from games.visualization.board.adapter.chess import chess_board_to_codes
 from games.visualization.board.adapter.chess import chess_board_to_grid
+from games.visualization.board.adapter.chess import chess_diffs
+from games.visualization.board.adapter.chess import chess_positions
 
 
 @pytest.mark.adapter
@@ -95,3 +100,52 @@ def test_chess_adapter_fen_position() -> None:
     cell = grid[r, c]
     assert cell is not None
     assert cell.piece_color() == "white"
+
+
+@pytest.mark.adapter
+def test_chess_positions_replays_move_stack() -> None:
+    """Positions should run from the root through every move."""
+    board = chess.Board()
+    for san in ("e4", "e5", "Nf3"):
+        board.push_san(san)
+
+    fens = [position.fen() for position in chess_positions(board)]
+
+    assert len(fens) == 4
+    assert fens[0] == chess.STARTING_FEN
+    assert fens[-1] == board.fen()
+
+
+@pytest.mark.adapter
+def test_chess_codes_match_object_grid() -> None:
+    """Encoded grid should decode to the pieces of the object grid."""
+    board = chess.Board("r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w")
+
+    codes = chess_board_to_codes(board)
+    grid = chess_board_to_grid(ChessBoardWrapper(board))
+
+    assert codes.dtype == np.int8
+    assert codes.shape == (8, 8)
+
+    for r in range(8):
+        for c in range(8):
+            piece = CHESS_CODEBOOK[codes[r, c]]
+            if grid[r, c] is None:
+                assert piece is None
+            else:
+                assert piece.render_symbol() == grid[r, c].render_symbol()
+                assert piece.piece_color() == grid[r, c].piece_color()
+
+
+@pytest.mark.adapter
+def test_chess_diffs_follow_move_stack() -> None:
+    """Diffs should hold one entry per move and only the squares it touched."""
+    board = chess.Board()
+    for san in ("e4", "e5", "Nf3", "Nc6", "Bc4", "Nf6", "O-O"):
+        board.push_san(san)
+
+    diffs = list(chess_diffs(board))
+
+    assert len(diffs) == 7
+    assert sorted(diffs[0].cells.tolist()) == [[1, 4], [3, 4]]
+    assert sorted(diffs[-1].cells.tolist()) == [[0, 4], [0, 5], [0, 6], [0, 7]]
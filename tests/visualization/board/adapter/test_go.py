@@ -1,11 +1,17 @@
 """Tests for module games.visualization.board.adapter.go."""
 
+import numpy as np
 import pytest
 from pytest import FixtureRequest
 from sgfmill import boards
+from sgfmill import sgf
 
+from games.visualization.board.adapter.go import GO_CODEBOOK
 from games.visualization.board.adapter.go import GoBoardWrapper
+from games.visualization.board.adapter.go import go_board_to_codes
 from games.visualization.board.adapter.go import go_board_to_grid
+from games.visualization.board.adapter.go import go_diffs
+from games.visualization.board.adapter.go import go_positions
 from games.visualization.board.types import Grid
 
 
@@ -73,3 +79,43 @@ def test_go_adapter_multiple_stones(empty_go_board: boards.Board) -> None:
         assert cell is not None
         assert cell.render_symbol() == "●"
         assert cell.piece_color() == ("black" if color == "b" else "white")
+
+
+@pytest.mark.adapter
+def test_go_positions_replays_sgf_game() -> None:
+    """Positions should start at the setup and follow every move and pass."""
+    game = sgf.Sgf_game.from_bytes(b"(;SZ[9];B[ee];W[cc];B[];W[gg])")
+
+    stones = [len(position.list_occupied_points()) for position in go_positions(game)]
+
+    assert stones == [0, 1, 2, 2, 3]
+
+
+@pytest.mark.adapter
+def test_go_codes_match_object_grid(empty_go_board: boards.Board) -> None:
+    """Verify the encoded grid holds the codes of the stones of the grid."""
+    board = empty_go_board
+    board.play(0, 0, "b")
+    board.play(3, 4, "w")
+    board.play(board.side - 1, 2, "b")
+
+    codes = go_board_to_codes(board)
+
+    assert codes.dtype == np.int8
+    assert codes.shape == (board.side, board.side)
+    assert int(np.count_nonzero(codes)) == 3
+    assert GO_CODEBOOK[codes[0, 0]].piece_color() == "black"
+    assert GO_CODEBOOK[codes[3, 4]].piece_color() == "white"
+    assert GO_CODEBOOK[codes[board.side - 1, 2]].piece_color() == "black"
+
+
+@pytest.mark.adapter
+def test_go_diffs_report_captures() -> None:
+    """Diffs should show captured stones as removed, and passes as empty."""
+    game = sgf.Sgf_game.from_bytes(b"(;SZ[9];B[ba];W[aa];B[ab];W[];B[ii])")
+
+    diffs = list(go_diffs(game))
+
+    assert [len(diff) for diff in diffs] == [1, 1, 2, 0, 1]
+    assert diffs[2].removed.tolist() == [[8, 0]]
+    assert diffs[2].added.tolist() == [[7, 0]]
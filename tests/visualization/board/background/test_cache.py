@@ -0,0 +1,108 @@
+"""Tests for module games.visualization.board.background.cache."""
+
+from typing import Any
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from games.visualization.board.background.cache import BackgroundCache
+from games.visualization.board.background.checkerboard import CheckerboardBackground
+from games.visualization.board.background.go import GoBackground
+from games.visualization.board.background.solid import SolidBackground
+from games.visualization.board.geometry.go import GoGeometry
+from games.visualization.board.renderer import MatplotlibBoardRenderer
+from games.visualization.board.renderer import RenderSpec
+
+
+SPEC = RenderSpec(figsize=(2.0, 2.0), dpi=50)
+
+
+def _pixels(renderer: MatplotlibBoardRenderer, size: int = 9) -> Any:
+    """Render an empty board and return its pixels."""
+    grid = np.full((size, size), None, dtype=object)
+    ax: Any = renderer.render(grid, spec=SPEC, return_ax=True)
+    ax.figure.canvas.draw()
+    pixels = np.asarray(ax.figure.canvas.buffer_rgba()).copy()
+    plt.close(ax.figure)
+    return pixels
+
+
+@pytest.mark.background
+def test_cache_rasterizes_each_configuration_once() -> None:
+    """Equal-looking backgrounds should share one cached layer."""
+    cache = BackgroundCache()
+
+    first = cache.layer(GoBackground(), 9, figsize=(2.0, 2.0), dpi=50)
+    again = cache.layer(GoBackground(), 9, figsize=(2.0, 2.0), dpi=50)
+
+    assert first is not None
+    assert first is again
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.background
+def test_cache_keys_on_size_and_figure() -> None:
+    """Different board sizes, figure sizes or dpis should not share layers."""
+    cache = BackgroundCache()
+    background = CheckerboardBackground()
+
+    cache.layer(background, 8, figsize=(2.0, 2.0), dpi=50)
+    cache.layer(background, 9, figsize=(2.0, 2.0), dpi=50)
+    cache.layer(background, 8, figsize=(3.0, 2.0), dpi=50)
+    cache.layer(background, 8, figsize=(2.0, 2.0), dpi=60)
+
+    assert len(cache) == 4
+    assert cache.hits == 0
+
+
+@pytest.mark.background
+def test_cache_evicts_least_recently_used() -> None:
+    """The cache should drop the least recently used layer when full."""
+    cache = BackgroundCache(maxsize=2)
+    background = GoBackground()
+
+    cache.layer(background, 9, figsize=(2.0, 2.0), dpi=50)
+    cache.layer(background, 13, figsize=(2.0, 2.0), dpi=50)
+    cache.layer(background, 9, figsize=(2.0, 2.0), dpi=50)
+    cache.layer(background, 19, figsize=(2.0, 2.0), dpi=50)
+
+    assert len(cache) == 2
+
+    cache.layer(background, 9, figsize=(2.0, 2.0), dpi=50)
+    assert cache.misses == 3
+
+    cache.layer(background, 13, figsize=(2.0, 2.0), dpi=50)
+    assert cache.misses == 4
+
+
+@pytest.mark.background
+def test_cache_skips_uncacheable_backgrounds() -> None:
+    """Backgrounds without a cache key should be drawn directly."""
+    cache = BackgroundCache()
+
+    assert cache.layer(SolidBackground("white"), 9, figsize=(2, 2), dpi=50) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.background
+def test_cache_rejects_empty_capacity() -> None:
+    """The cache should hold at least one layer."""
+    with pytest.raises(ValueError):
+        BackgroundCache(maxsize=0)
+
+
+@pytest.mark.background
+def test_cached_background_matches_direct_drawing() -> None:
+    """Rendering from the cache should produce the same pixels."""
+    cache = BackgroundCache()
+    direct = MatplotlibBoardRenderer(background=GoBackground(), geometry=GoGeometry())
+    cached = MatplotlibBoardRenderer(
+        background=GoBackground(), geometry=GoGeometry(), background_cache=cache
+    )
+
+    expected = _pixels(direct)
+    _pixels(cached)
+
+    assert np.array_equal(_pixels(cached), expected)
+    assert cache.hits == 1
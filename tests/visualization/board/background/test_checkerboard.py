@@ -38,3 +38,27 @@ def test_checkerboard_draw_calls_imshow() -> None:
 
     assert "board" in called
     assert called["board"].shape == (3, 3, 3)
+
+
+@pytest.mark.background
+def test_checkerboard_draw_alternates_colors() -> None:
+    """Checkerboard should alternate light and dark squares."""
+    light, dark = (1.0, 1.0, 1.0), (0.0, 0.0, 0.0)
+    bg = CheckerboardBackground(light=light, dark=dark)
+
+    ax = SimpleNamespace()
+    called = {}
+
+    def fake_imshow(board: Any, extent: Tuple[float, float, float, float]) -> None:
+        """Spy for Axes.imshow capturing board data."""
+        called["board"] = board
+
+    ax.imshow = fake_imshow
+
+    bg.draw(ax, size=4)
+
+    board = called["board"]
+    assert tuple(board[0, 0]) == light
+    assert tuple(board[0, 1]) == dark
+    assert tuple(board[1, 0]) == dark
+    assert tuple(board[3, 3]) == light
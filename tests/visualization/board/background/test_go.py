@@ -16,6 +16,11 @@ class AxesStub:
         self.facecolor: str | None = None
         self.calls: dict[str, list[Any]] = {}
 
+    @property
+    def transData(self) -> None:  # noqa: N802
+        """Stand in for the data transform of the axes."""
+        return None
+
     def set_facecolor(self, color: str) -> None:
         """Record facecolor applied to the axes."""
         self.facecolor = color
@@ -28,6 +33,10 @@ class AxesStub:
         """No-op stub for patch drawing (e.g. Go star points)."""
         self.calls.setdefault("add_patch", []).append((args, kwargs))
 
+    def add_collection(self, *args: Any, **kwargs: Any) -> None:
+        """No-op stub for collection drawing (e.g. Go grid lines)."""
+        self.calls.setdefault("add_collection", []).append((args, kwargs))
+
     def set_xlim(self, *args: Any, **kwargs: Any) -> None:
         """No-op stub for x-axis limits."""
         self.calls.setdefault("set_xlim", []).append((args, kwargs))
@@ -81,3 +90,19 @@ def test_go_draw_sets_background_color() -> None:
     bg.draw(ax, size=19)
 
     assert ax.facecolor == "#d2b48c"
+
+
+@pytest.mark.background
+def test_go_draw_batches_grid_and_star_points() -> None:
+    """Grid lines and star points should each be drawn as one collection."""
+    bg = GoBackground()
+
+    ax = AxesStub()
+
+    bg.draw(ax, size=19)
+
+    grid, stars = (args[0] for args, _ in ax.calls["add_collection"])
+
+    assert len(grid.get_segments()) == 38
+    assert len(stars.get_offsets()) == 9
+    assert "plot" not in ax.calls
@@ -0,0 +1 @@
+"""Cells subpackage within the 'tests.visualization.cells' directory."""
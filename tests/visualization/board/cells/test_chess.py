@@ -0,0 +1,40 @@
+"""Tests for module games.visualization.board.cells.chess."""
+
+import pickle
+
+import chess
+import pytest
+
+from games.visualization.board.adapter.chess import ChessBoardWrapper
+from games.visualization.board.adapter.chess import chess_board_to_grid
+from games.visualization.board.cells.chess import ChessPiece
+
+
+@pytest.mark.adapter
+def test_chess_piece_of_returns_shared_instance() -> None:
+    """Pieces of the same kind should share one instance."""
+    knight = ChessPiece.of(chess.Piece(chess.KNIGHT, chess.BLACK))
+
+    assert ChessPiece.of(chess.Piece(chess.KNIGHT, chess.BLACK)) is knight
+    assert ChessPiece.of(chess.Piece(chess.KNIGHT, chess.WHITE)) is not knight
+    assert knight.render_symbol() == "♞"
+    assert knight.piece_color() == "black"
+    assert pickle.loads(pickle.dumps(knight)) is knight
+
+
+@pytest.mark.adapter
+def test_chess_piece_has_no_instance_dict() -> None:
+    """Pieces should be slotted."""
+    piece = ChessPiece.of(chess.Piece(chess.PAWN, chess.WHITE))
+
+    assert not hasattr(piece, "__dict__")
+
+
+@pytest.mark.adapter
+def test_chess_grid_reuses_pieces() -> None:
+    """The starting position should hold only twelve distinct pieces."""
+    grid = chess_board_to_grid(ChessBoardWrapper(chess.Board()))
+
+    pieces = {id(cell) for cell in grid.flat if cell is not None}
+
+    assert len(pieces) == 12
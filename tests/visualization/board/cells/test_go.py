@@ -0,0 +1,35 @@
+"""Tests for module games.visualization.board.cells.go."""
+
+import pickle
+
+import pytest
+from sgfmill import boards
+
+from games.visualization.board.adapter.go import GoBoardWrapper
+from games.visualization.board.adapter.go import go_board_to_grid
+from games.visualization.board.cells.go import GoStone
+
+
+@pytest.mark.adapter
+def test_go_stone_of_returns_shared_instance() -> None:
+    """Stones of the same color should share one instance."""
+    black = GoStone.of("black")
+
+    assert GoStone.of("black") is black
+    assert GoStone.of("white") is not black
+    assert not hasattr(black, "__dict__")
+    assert pickle.loads(pickle.dumps(black)) is black
+
+
+@pytest.mark.adapter
+def test_go_grid_reuses_stones() -> None:
+    """A grid should hold one instance per stone color."""
+    board = boards.Board(9)
+    for i in range(9):
+        board.play(i, i, "b" if i % 2 else "w")
+
+    grid = go_board_to_grid(GoBoardWrapper(board))
+
+    stones = {id(cell) for cell in grid.flat if cell is not None}
+
+    assert len(stones) == 2
@@ -3,8 +3,11 @@
 from typing import Any
 
 import chess
+import numpy as np
 import pytest
+from matplotlib.collections import PathCollection
 
+from games.visualization.board.figures import FigurePool
 from games.visualization.board.renderer import RenderSpec
 from games.visualization.board.scene.chess import ChessScene
 
@@ -79,3 +82,45 @@ def test_chess_scene_stores_render_spec() -> None:
     )
 
     assert scene.spec is spec
+
+
+@pytest.mark.scene
+def test_chess_scene_batches_pieces_into_one_collection() -> None:
+    """Batched rendering should draw all pieces as one path collection."""
+    scene = ChessScene(chess.Board())
+    scene.renderer.batch_cells = True
+
+    ax: Any = scene.render(return_ax=True)
+
+    pieces = [c for c in ax.collections if isinstance(c, PathCollection)]
+
+    assert len(ax.texts) == 0
+    assert len(pieces) == 1
+    assert len(pieces[0].get_paths()) == 32
+
+
+@pytest.mark.scene
+def test_chess_scene_renders_encoded_grids() -> None:
+    """Encoded scenes should render the same pieces from codes."""
+    scene = ChessScene(chess.Board(), encoded=True)
+
+    grid = scene.board_to_grid(scene.board)
+    ax: Any = scene.render(return_ax=True)
+
+    assert grid.dtype == np.int8
+    assert len(ax.texts) == 32
+
+
+@pytest.mark.scene
+def test_chess_scene_renders_on_pooled_figures() -> None:
+    """Scenes with a figure pool should borrow and return its figures."""
+    pool = FigurePool()
+    scene = ChessScene(chess.Board(), figure_pool=pool)
+
+    with scene.rendering() as ax:
+        assert ax.figure in pool
+
+    with scene.rendering():
+        pass
+
+    assert (pool.created, pool.in_use, pool.idle) == (1, 0, 1)
@@ -2,7 +2,9 @@
 
 from typing import Any
 
+import numpy as np
 import pytest
+from matplotlib.collections import EllipseCollection
 from sgfmill import boards
 
 from games.visualization.board.cells.go import StoneCircle
@@ -67,3 +69,33 @@ def test_go_scene_stores_render_spec() -> None:
     )
 
     assert scene.spec is spec
+
+
+@pytest.mark.scene
+def test_go_scene_batches_stones_into_one_collection() -> None:
+    """Test batched rendering draws all stones as a single collection."""
+    board = boards.Board(9)
+    board.play(3, 3, "b")
+    board.play(4, 4, "w")
+    board.play(5, 5, "b")
+
+    scene = GoScene(board)
+    scene.renderer.batch_cells = True
+
+    ax: Any = scene.render(return_ax=True)
+
+    stones = [
+        c
+        for c in ax.collections
+        if isinstance(c, EllipseCollection) and c.get_zorder() == 3
+    ]
+
+    assert not [p for p in ax.patches if isinstance(p, StoneCircle)]
+    assert len(stones) == 1
+    offsets = np.asarray(stones[0].get_offsets())
+
+    assert {(x, y) for x, y in offsets.tolist()} == {
+        (3.0, 3.0),
+        (4.0, 4.0),
+        (5.0, 5.0),
+    }
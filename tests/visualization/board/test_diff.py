@@ -0,0 +1,92 @@
+"""Tests for module games.visualization.board.diff."""
+
+import chess
+import numpy as np
+import pytest
+
+from games.visualization.board.adapter.chess import ChessBoardWrapper
+from games.visualization.board.adapter.chess import chess_board_to_codes
+from games.visualization.board.adapter.chess import chess_board_to_grid
+from games.visualization.board.cells.chess import ChessPiece
+from games.visualization.board.diff import diff_boards
+from games.visualization.board.diff import diff_grids
+from games.visualization.board.diff import diff_positions
+from games.visualization.board.diff import replay
+
+
+@pytest.mark.renderer
+def test_diff_grids_classifies_cells() -> None:
+    """Test a capture reports a vacated square and a changed square."""
+    board = chess.Board()
+    for san in ("e4", "d5"):
+        board.push_san(san)
+    before = chess_board_to_codes(board)
+    board.push_san("exd5")
+
+    diff = diff_grids(before, chess_board_to_codes(board))
+
+    assert sorted(diff.cells.tolist()) == [[3, 4], [4, 3]]
+    assert diff.removed.tolist() == [[3, 4]]
+    assert diff.changed.tolist() == [[4, 3]]
+    assert diff.added.tolist() == []
+
+
+@pytest.mark.renderer
+def test_diff_grids_ignores_equal_looking_cells() -> None:
+    """Test distinct cell values that look alike are not reported."""
+    piece = chess.Piece(chess.ROOK, chess.WHITE)
+    before = np.full((2, 2), None, dtype=object)
+    after = before.copy()
+    before[0, 0], after[0, 0] = ChessPiece(piece), ChessPiece(piece)
+    after[1, 1] = ChessPiece(piece)
+
+    diff = diff_grids(before, after)
+
+    assert diff.cells.tolist() == [[1, 1]]
+    assert diff.added.tolist() == [[1, 1]]
+
+
+@pytest.mark.renderer
+def test_diff_grids_rejects_mismatched_grids() -> None:
+    """Test grids of other sizes or encodings cannot be compared."""
+    codes = chess_board_to_codes(chess.Board())
+
+    with pytest.raises(ValueError):
+        diff_grids(codes, codes[:4])
+    with pytest.raises(ValueError):
+        diff_grids(codes, chess_board_to_grid(ChessBoardWrapper(chess.Board())))
+
+
+@pytest.mark.renderer
+def test_diff_boards_reads_wrappers() -> None:
+    """Test board wrappers are compared through their grids."""
+    before = chess.Board()
+    after = before.copy()
+    after.push_san("Nf3")
+
+    diff = diff_boards(
+        ChessBoardWrapper(before), ChessBoardWrapper(after), chess_board_to_grid
+    )
+
+    assert sorted(diff.cells.tolist()) == [[0, 6], [2, 5]]
+
+
+@pytest.mark.renderer
+def test_replay_reproduces_positions() -> None:
+    """Test applying and reverting diffs walks between the positions."""
+    board = chess.Board()
+    grids = [chess_board_to_codes(board)]
+    for san in ("e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Bxc6", "dxc6", "O-O"):
+        board.push_san(san)
+        grids.append(chess_board_to_codes(board))
+
+    diffs = list(diff_positions(grids))
+    replayed = [grid.copy() for grid in replay(grids[0], diffs)]
+
+    assert len(diffs) == 9
+    assert all(np.array_equal(a, b) for a, b in zip(replayed, grids))  # noqa: B905
+
+    last = replayed[-1]
+    for diff in reversed(diffs):
+        diff.revert(last)
+    assert np.array_equal(last, grids[0])
@@ -0,0 +1,54 @@
+"""Tests for module games.visualization.board.encoding."""
+
+import numpy as np
+import pytest
+
+from games.visualization.board.encoding import decode_grid
+from games.visualization.board.encoding import is_encoded
+from games.visualization.board.types import Codebook
+
+
+class Cell:
+    """Minimal cell value."""
+
+    def render_symbol(self) -> str:
+        """Return dummy symbol."""
+        return "X"
+
+    def render_color(self) -> str:
+        """Return dummy color."""
+        return "black"
+
+
+CODEBOOK: Codebook = (None, Cell(), Cell())
+
+
+@pytest.mark.renderer
+def test_is_encoded_tells_codes_from_cells() -> None:
+    """Test integer grids are encoded and object grids are not."""
+    assert is_encoded(np.zeros((3, 3), dtype=np.int8))
+    assert not is_encoded(np.full((3, 3), None, dtype=object))
+
+
+@pytest.mark.renderer
+def test_decode_grid_shares_codebook_values() -> None:
+    """Test every code maps to the one shared value of the codebook."""
+    codes = np.array([[0, 1], [2, 1]], dtype=np.int8)
+
+    grid = decode_grid(codes, CODEBOOK)
+
+    assert grid.dtype == object
+    assert grid[0, 0] is None
+    assert grid[0, 1] is CODEBOOK[1]
+    assert grid[1, 1] is CODEBOOK[1]
+    assert grid[1, 0] is CODEBOOK[2]
+
+
+@pytest.mark.renderer
+def test_decode_grid_rejects_unknown_codes() -> None:
+    """Test codes outside the codebook are refused."""
+    with pytest.raises(ValueError):
+        decode_grid(np.array([[3]], dtype=np.int8), CODEBOOK)
+
+    with pytest.raises(ValueError):
+        decode_grid(np.array([[-1]], dtype=np.int8), CODEBOOK)
@@ -0,0 +1,127 @@
+"""Tests for module games.visualization.board.export."""
+
+from pathlib import Path
+from typing import List
+
+import chess
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+from PIL import Image
+from PIL import ImageSequence
+
+from games.visualization.board.adapter.chess import chess_positions
+from games.visualization.board.export import FrameSink
+from games.visualization.board.export import GifSink
+from games.visualization.board.export import Mp4Sink
+from games.visualization.board.export import PngSequenceSink
+from games.visualization.board.export import sink_for
+from games.visualization.board.renderer import RenderSpec
+from games.visualization.board.scene.chess import ChessScene
+
+
+SPEC = RenderSpec(figsize=(2.0, 2.0), dpi=50)
+
+
+class ListSink(FrameSink):
+    """Sink that keeps copies of its frames for inspection."""
+
+    def __init__(self) -> None:
+        """Initialize with no frames."""
+        self.frames: List[NDArray[np.uint8]] = []
+        self.closed = False
+
+    def write(self, frame: NDArray[np.uint8]) -> None:
+        """Keep a copy of the frame."""
+        self.frames.append(frame.copy())
+
+    def close(self) -> None:
+        """Record that the sink was closed."""
+        self.closed = True
+
+
+def _game() -> chess.Board:
+    """Return a board with a short move stack."""
+    board = chess.Board()
+    for san in ("e4", "e5", "Nf3", "Nc6"):
+        board.push_san(san)
+    return board
+
+
+@pytest.mark.renderer
+def test_scene_export_writes_one_frame_per_position() -> None:
+    """Test every position becomes a distinct RGBA frame."""
+    sink = ListSink()
+
+    count = ChessScene(chess.Board(), spec=SPEC).export(chess_positions(_game()), sink)
+
+    assert count == 5
+    assert sink.closed
+    assert [frame.shape for frame in sink.frames] == [(100, 100, 4)] * 5
+    assert not np.array_equal(sink.frames[0], sink.frames[1])
+
+
+@pytest.mark.renderer
+def test_export_png_sequence(tmp_path: Path) -> None:
+    """Test PNG export writes numbered files."""
+    scene = ChessScene(chess.Board(), spec=SPEC)
+
+    scene.export(chess_positions(_game()), tmp_path / "move.png")
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert names == [f"move_{i:05d}.png" for i in range(5)]
+    assert Image.open(tmp_path / names[0]).size == (100, 100)
+
+
+@pytest.mark.renderer
+def test_export_gif_streams_all_frames(tmp_path: Path) -> None:
+    """Test the streamed GIF holds every frame at the requested rate."""
+    path = tmp_path / "game.gif"
+
+    ChessScene(chess.Board(), spec=SPEC).export(chess_positions(_game()), path, fps=4)
+
+    with Image.open(path) as gif:
+        assert sum(1 for _ in ImageSequence.Iterator(gif)) == 5
+        assert gif.size == (100, 100)
+        assert gif.info["duration"] == 250
+
+
+@pytest.mark.renderer
+def test_gif_sink_keeps_frame_colors(tmp_path: Path) -> None:
+    """Test frames are quantized onto the first frame's palette."""
+    frame = np.zeros((4, 4, 4), dtype=np.uint8)
+    frame[..., 3] = 255
+    frame[:2, :, 0] = 200
+
+    with GifSink(tmp_path / "colors.gif") as sink:
+        sink.write(frame)
+        sink.write(frame[::-1].copy())
+
+    with Image.open(tmp_path / "colors.gif") as gif:
+        gif.seek(1)
+        pixels = np.asarray(gif.convert("RGB"))
+
+    assert pixels[0, 0].tolist() == [0, 0, 0]
+    assert pixels[3, 0].tolist() == [200, 0, 0]
+
+
+@pytest.mark.renderer
+def test_sink_for_picks_format(tmp_path: Path) -> None:
+    """Test sinks are chosen by file extension."""
+    assert isinstance(sink_for(tmp_path / "a.png"), PngSequenceSink)
+    assert isinstance(sink_for(tmp_path / "a.gif"), GifSink)
+    assert isinstance(sink_for(tmp_path / "a.mp4"), Mp4Sink)
+
+    with pytest.raises(ValueError):
+        sink_for(tmp_path / "a.txt")
+
+
+@pytest.mark.renderer
+@pytest.mark.skipif(Mp4Sink.ffmpeg() is None, reason="ffmpeg is not installed")
+def test_export_mp4(tmp_path: Path) -> None:
+    """Test MP4 export produces a file through ffmpeg."""
+    path = tmp_path / "game.mp4"
+
+    ChessScene(chess.Board(), spec=SPEC).export(chess_positions(_game()), path)
+
+    assert path.stat().st_size > 0
@@ -0,0 +1,94 @@
+"""Tests for module games.visualization.board.figures."""
+
+import matplotlib as mpl
+import pytest
+from matplotlib.colors import to_rgba
+
+from games.visualization.board.figures import FigurePool
+from games.visualization.board.figures import pyplot_figure_count
+
+
+@pytest.mark.renderer
+def test_figure_pool_reuses_released_figures() -> None:
+    """Test a released figure is cleared and handed out again."""
+    pool = FigurePool()
+
+    figure = pool.acquire((2.0, 2.0), 50)
+    figure.add_subplot()
+    assert figure in pool
+    assert (pool.in_use, pool.idle, pool.live) == (1, 0, 1)
+
+    pool.release(figure)
+    assert figure not in pool
+    assert (pool.in_use, pool.idle, pool.live) == (0, 1, 1)
+
+    again = pool.acquire((2.0, 2.0), 50)
+    assert again is figure
+    assert not again.axes
+    assert pool.created == 1
+
+
+@pytest.mark.renderer
+def test_figure_pool_keeps_sizes_apart() -> None:
+    """Test figures of another size or dpi are not reused."""
+    pool = FigurePool()
+
+    with pool.figure((2.0, 2.0), 50) as figure:
+        pass
+
+    assert pool.acquire((3.0, 2.0), 50) is not figure
+    assert pool.acquire((2.0, 2.0), 60) is not figure
+    assert pool.created == 3
+
+
+@pytest.mark.renderer
+def test_figure_pool_stays_out_of_pyplot() -> None:
+    """Test pooled figures are never registered with pyplot."""
+    before = pyplot_figure_count()
+    pool = FigurePool()
+
+    with pool.figure((2.0, 2.0), 50) as figure:
+        figure.add_subplot().plot([0, 1], [0, 1])
+        figure.canvas.draw()
+        assert pyplot_figure_count() == before
+
+    assert pool.in_use == 0
+
+
+@pytest.mark.renderer
+def test_figure_pool_resets_facecolor() -> None:
+    """Test a reused figure drops the face color of its last loan."""
+    pool = FigurePool()
+
+    with pool.figure((2.0, 2.0), 50, facecolor="red"):
+        pass
+
+    figure = pool.acquire((2.0, 2.0), 50)
+    assert figure.get_facecolor() == to_rgba(mpl.rcParams["figure.facecolor"])
+
+
+@pytest.mark.renderer
+def test_figure_pool_bounds_idle_figures() -> None:
+    """Test figures beyond the pool size are dropped on release."""
+    pool = FigurePool(maxsize=1)
+    figures = [pool.acquire((2.0, 2.0), 50) for _ in range(3)]
+
+    for figure in figures:
+        pool.release(figure)
+
+    assert pool.idle == 1
+    pool.clear()
+    assert pool.live == 0
+
+
+@pytest.mark.renderer
+def test_figure_pool_rejects_foreign_figures() -> None:
+    """Test only figures on loan can be released."""
+    pool = FigurePool()
+    figure = pool.acquire((2.0, 2.0), 50)
+    pool.release(figure)
+
+    with pytest.raises(ValueError):
+        pool.release(figure)
+    with pytest.raises(ValueError):
+        FigurePool(maxsize=-1)
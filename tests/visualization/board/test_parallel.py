@@ -0,0 +1,136 @@
+"""Tests for module games.visualization.board.parallel."""
+
+import io
+import pickle
+from pathlib import Path
+from typing import Any
+from typing import List
+
+import chess
+import numpy as np
+import pytest
+from PIL import Image
+from sgfmill import boards
+
+from games.visualization.board import parallel
+from games.visualization.board import render_many
+from games.visualization.board.adapter.chess import chess_positions
+from games.visualization.board.background.checkerboard import CheckerboardBackground
+from games.visualization.board.parallel import RenderJob
+from games.visualization.board.renderer import RenderSpec
+from games.visualization.board.scene.chess import ChessScene
+from games.visualization.board.scene.go import GoScene
+
+
+SPEC = RenderSpec(figsize=(2.0, 2.0), dpi=50)
+
+
+def _jobs() -> List[RenderJob]:
+    """Return chess positions of a short game and a Go board."""
+    game = chess.Board()
+    for san in ("e4", "e5", "Nf3"):
+        game.push_san(san)
+
+    chess_scene = ChessScene(chess.Board(), spec=SPEC)
+    jobs: List[RenderJob] = [
+        (chess_scene, position.copy()) for position in chess_positions(game)
+    ]
+
+    go_board = boards.Board(9)
+    go_board.play(4, 4, "b")
+    jobs.append((GoScene(go_board, spec=SPEC), go_board))
+
+    return jobs
+
+
+def _decode(data: bytes) -> Any:
+    """Decode an encoded image into an RGB array."""
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGB")).astype(int)
+
+
+@pytest.mark.renderer
+def test_render_many_returns_encoded_images_in_order() -> None:
+    """Test in-process rendering returns one PNG per job, in job order."""
+    images = render_many(_jobs(), max_workers=1, chunk_size=2)
+
+    assert len(images) == 5
+    assert all(image.startswith(b"\x89PNG") for image in images)
+
+    frames = [_decode(image) for image in images]
+    assert frames[0].shape == (100, 100, 3)
+    assert not np.array_equal(frames[0], frames[1])
+
+
+@pytest.mark.renderer
+def test_render_many_keeps_renderer_setups_apart() -> None:
+    """Test scenes differing only in their renderer do not share a session."""
+    plain = ChessScene(chess.Board(), spec=SPEC)
+    inverted = ChessScene(chess.Board(), spec=SPEC)
+    inverted.renderer.background = CheckerboardBackground(
+        light=(0.0, 0.0, 0.0), dark=(1.0, 1.0, 1.0)
+    )
+
+    first, second, again = render_many(
+        [(plain, chess.Board()), (inverted, chess.Board()), (plain, chess.Board())],
+        max_workers=1,
+    )
+
+    assert not np.array_equal(_decode(first), _decode(second))
+    assert np.array_equal(_decode(first), _decode(again))
+
+
+@pytest.mark.renderer
+def test_pickled_scenes_share_warm_sessions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test chunks unpickled apart reuse one session, and the oldest is closed."""
+    monkeypatch.setattr(parallel, "MAX_SESSIONS", 1)
+    scene = ChessScene(chess.Board(), spec=SPEC)
+
+    try:
+        sessions: List[Any] = []
+        for _ in range(3):
+            copy = pickle.loads(pickle.dumps(scene))
+            parallel._render_job(copy, chess.Board(), "PNG")
+            sessions.extend(parallel._SESSIONS.values())
+
+        first = sessions[0]
+        assert sessions == [first] * 3
+
+        go_board = boards.Board(9)
+        parallel._render_job(GoScene(go_board, spec=SPEC), go_board, "PNG")
+        assert len(parallel._SESSIONS) == 1
+        assert first not in parallel._SESSIONS.values()
+    finally:
+        parallel._close_sessions()
+
+
+@pytest.mark.renderer
+def test_render_many_pool_matches_in_process() -> None:
+    """Test worker processes render the same images as the calling process."""
+    local = render_many(_jobs(), max_workers=1)
+    pooled = render_many(_jobs(), max_workers=2, chunk_size=2)
+
+    for i, image in enumerate(pooled):
+        # warm sessions may differ by an antialiasing level at cell edges
+        assert np.abs(_decode(image) - _decode(local[i])).max() <= 2
+
+
+@pytest.mark.renderer
+def test_render_many_writes_files(tmp_path: Path) -> None:
+    """Test images are written to the given paths."""
+    jobs = _jobs()
+    paths = [tmp_path / f"{i}.png" for i in range(len(jobs))]
+
+    written = render_many(jobs, paths, max_workers=1)
+
+    assert written == paths
+    assert all(Image.open(path).size == (100, 100) for path in paths)
+
+
+@pytest.mark.renderer
+def test_render_many_validates_arguments(tmp_path: Path) -> None:
+    """Test mismatched paths and empty chunks are rejected."""
+    with pytest.raises(ValueError):
+        render_many(_jobs(), [tmp_path / "only.png"], max_workers=1)
+
+    with pytest.raises(ValueError):
+        render_many(_jobs(), max_workers=1, chunk_size=0)
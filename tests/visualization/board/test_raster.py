@@ -0,0 +1,158 @@
+"""Tests for module games.visualization.board.raster."""
+
+from typing import Any
+
+import chess
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from sgfmill import boards
+
+from games.visualization.board.adapter.chess import CHESS_CODEBOOK
+from games.visualization.board.adapter.chess import ChessBoardWrapper
+from games.visualization.board.adapter.chess import chess_board_to_codes
+from games.visualization.board.adapter.chess import chess_board_to_grid
+from games.visualization.board.adapter.go import GoBoardWrapper
+from games.visualization.board.adapter.go import go_board_to_grid
+from games.visualization.board.background.base import Background
+from games.visualization.board.background.checkerboard import CheckerboardBackground
+from games.visualization.board.background.go import GoBackground
+from games.visualization.board.geometry.chess import ChessGeometry
+from games.visualization.board.geometry.go import GoGeometry
+from games.visualization.board.raster import NumpyBoardRenderer
+from games.visualization.board.raster import disc_sprite
+from games.visualization.board.renderer import RenderSpec
+
+
+SPEC = RenderSpec(figsize=(2.0, 2.0), dpi=80)
+
+
+class PlainBackground(Background):
+    """Background the rasterizer knows nothing about."""
+
+    def draw(self, ax: Any, size: int) -> None:
+        """Draw nothing."""
+        pass
+
+
+def _chess_renderer() -> NumpyBoardRenderer:
+    """Return a chess rasterizer with plain black and white squares."""
+    return NumpyBoardRenderer(
+        CheckerboardBackground(light=(1.0, 1.0, 1.0), dark=(0.0, 0.0, 0.0)),
+        ChessGeometry(),
+        codebook=CHESS_CODEBOOK,
+    )
+
+
+@pytest.mark.renderer
+def test_raster_checkerboard_orientation() -> None:
+    """Squares should alternate with a dark a1 in the bottom-left corner."""
+    empty = np.full((8, 8), None, dtype=object)
+
+    pixels = _chess_renderer().render_array(empty, spec=SPEC)
+
+    assert pixels.shape == (160, 160, 3)
+    assert pixels.dtype == np.uint8
+    assert tuple(pixels[-1, 0]) == (0, 0, 0)
+    assert tuple(pixels[0, 0]) == (255, 255, 255)
+    assert tuple(pixels[-1, 25]) == (255, 255, 255)
+
+
+@pytest.mark.renderer
+def test_raster_draws_pieces_on_their_squares() -> None:
+    """Occupied squares should differ from the empty board, and only those."""
+    board = chess.Board()
+    board.clear()
+    board.set_piece_at(chess.E4, chess.Piece(chess.QUEEN, chess.WHITE))
+    renderer = _chess_renderer()
+
+    empty = renderer.render_array(np.full((8, 8), None, dtype=object), spec=SPEC)
+    pixels = renderer.render_array(
+        chess_board_to_grid(ChessBoardWrapper(board)), spec=SPEC
+    )
+
+    changed = np.argwhere(np.any(pixels != empty, axis=2))
+    rows, cols = changed[:, 0] // 20, changed[:, 1] // 20
+
+    # e4 is the fifth file and the fourth rank from the bottom
+    assert set(cols.tolist()) == {4}
+    assert set(rows.tolist()) == {4}
+
+
+@pytest.mark.renderer
+def test_raster_encoded_grid_matches_object_grid() -> None:
+    """Encoded and object grids of a position should rasterize alike."""
+    board = chess.Board()
+    renderer = _chess_renderer()
+
+    encoded = renderer.render_array(chess_board_to_codes(board), spec=SPEC)
+    objects = renderer.render_array(
+        chess_board_to_grid(ChessBoardWrapper(board)), spec=SPEC
+    )
+
+    assert np.array_equal(encoded, objects)
+
+
+@pytest.mark.renderer
+def test_raster_go_stones_and_lines() -> None:
+    """Stones should be filled discs centered on their intersections."""
+    board = boards.Board(9)
+    board.play(4, 4, "b")
+    board.play(2, 6, "w")
+    renderer = NumpyBoardRenderer(GoBackground(), GoGeometry())
+
+    pixels = renderer.render_array(go_board_to_grid(GoBoardWrapper(board)), spec=SPEC)
+
+    # intersection (r, c) sits at pixel (160 - (r + 0.5) * cell, (c + 0.5) * cell)
+    cell = 160 / 9
+    black = pixels[int(160 - 4.5 * cell) + 3, int(4.5 * cell) + 3]
+    white = pixels[int(160 - 2.5 * cell) + 3, int(6.5 * cell) + 3]
+    board_color = pixels[int(160 - 1.0 * cell), int(1.0 * cell)]
+
+    assert tuple(black) == (17, 17, 17)
+    assert tuple(white) == (244, 242, 236)
+    assert tuple(board_color) == (217, 168, 108)
+
+
+@pytest.mark.renderer
+def test_raster_rejects_unknown_backgrounds() -> None:
+    """Backgrounds without a rasterizer should be refused."""
+    renderer = NumpyBoardRenderer(PlainBackground(), ChessGeometry())
+
+    with pytest.raises(TypeError):
+        renderer.render_array(np.full((8, 8), None, dtype=object), spec=SPEC)
+
+
+@pytest.mark.renderer
+def test_raster_render_shows_image_in_plot_coordinates() -> None:
+    """Render should show the raster on axes spanning the board extent."""
+    renderer = _chess_renderer()
+
+    ax: Any = renderer.render(
+        chess_board_to_codes(chess.Board()), spec=SPEC, return_ax=True
+    )
+
+    assert len(ax.images) == 1
+    assert tuple(ax.images[0].get_extent()) == (0.0, 8.0, 0.0, 8.0)
+    plt.close(ax.figure)
+
+
+@pytest.mark.renderer
+def test_raster_array_refuses_overlays() -> None:
+    """Overlays need axes, so bare arrays should refuse them."""
+    with pytest.raises(ValueError):
+        _chess_renderer().render_array(
+            chess_board_to_codes(chess.Board()), overlays=[lambda ax: None]
+        )
+
+
+@pytest.mark.renderer
+def test_disc_sprite_is_opaque_inside_and_clear_outside() -> None:
+    """Disc sprites should be opaque at the center and clear at the corners."""
+    sprite = disc_sprite(5.0, "red")
+
+    center = sprite.shape[0] // 2
+
+    assert sprite[center, center, 3] == 1.0
+    assert sprite[0, 0, 3] == 0.0
+    assert tuple(sprite[center, center, :3]) == (255.0, 0.0, 0.0)
@@ -6,13 +6,21 @@ from typing import List
 from typing import Protocol
 from typing import Tuple
 
+import chess
 import matplotlib.axes
+import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 from pytest import MonkeyPatch
 
+from games.visualization.board.adapter.chess import ChessBoardWrapper
+from games.visualization.board.adapter.chess import chess_board_to_grid
 from games.visualization.board.background.base import Background
+from games.visualization.board.background.chess import ChessBackground
+from games.visualization.board.figures import FigurePool
+from games.visualization.board.figures import pyplot_figure_count
 from games.visualization.board.geometry.base import Geometry
+from games.visualization.board.geometry.chess import ChessGeometry
 from games.visualization.board.renderer import MatplotlibBoardRenderer
 from games.visualization.board.renderer import RenderSpec
 from games.visualization.board.renderer import RenderTheme
@@ -357,3 +365,182 @@ def test_render_theme_subplot_kwargs() -> None:
     assert theme.subplot_kwargs() == {
         "facecolor": "#181818",
     }
+
+
+class BatchedCell(DummyCell):
+    """CellValue drawing all of its cells in one call."""
+
+    batches: List[int] = []
+
+    @classmethod
+    def draw_many(cls, ax: Any, cells: List[Any], board_size: int) -> bool:
+        """Record the size of the batch."""
+        cls.batches.append(len(cells))
+        return True
+
+
+@pytest.mark.renderer
+def test_renderer_batches_cells_by_type(
+    background_spy: BackgroundSpy,
+    geometry_spy: GeometrySpy,
+    text_spy: List[Tuple[Tuple[Any, ...], Dict[str, Any]]],
+) -> None:
+    """Batched renderer should hand each cell type's cells over at once."""
+    renderer = MatplotlibBoardRenderer(
+        background=background_spy, geometry=geometry_spy, batch_cells=True
+    )
+    grid: Grid = np.full((3, 3), None, dtype=object)
+    grid[0, 0] = BatchedCell()
+    grid[1, 1] = BatchedCell()
+    grid[2, 2] = DummyCell()
+    BatchedCell.batches.clear()
+
+    renderer.render(grid)
+
+    assert BatchedCell.batches == [2]
+    assert len(text_spy) == 1
+
+
+@pytest.mark.renderer
+def test_renderer_requires_codebook_for_encoded_grids(
+    make_renderer: RendererFactory,
+) -> None:
+    """Renderer should refuse encoded grids it cannot decode."""
+    renderer = make_renderer()
+
+    with pytest.raises(ValueError):
+        renderer.render(np.zeros((3, 3), dtype=np.int8))
+
+
+def _chess_grids() -> List[Grid]:
+    """Return the grids of a short chess game."""
+    board = chess.Board()
+    grids = [chess_board_to_grid(ChessBoardWrapper(board))]
+
+    for san in ("e4", "e5", "Nf3"):
+        board.push_san(san)
+        grids.append(chess_board_to_grid(ChessBoardWrapper(board)))
+
+    return grids
+
+
+def _chess_renderer() -> MatplotlibBoardRenderer:
+    """Return a chess renderer."""
+    return MatplotlibBoardRenderer(
+        background=ChessBackground(), geometry=ChessGeometry()
+    )
+
+
+@pytest.mark.renderer
+def test_renderer_runs_overlays_after_cells() -> None:
+    """Overlays should see every piece already on the axes."""
+    renderer = _chess_renderer()
+    seen: List[int] = []
+
+    def count_pieces(ax: Any) -> None:
+        """Record how many piece glyphs the axes hold."""
+        seen.append(len(ax.texts))
+
+    ax = renderer.render(_chess_grids()[0], overlays=[count_pieces], return_ax=True)
+    plt.close(ax.figure)
+    renderer.render_array(_chess_grids()[0], overlays=[count_pieces])
+
+    assert seen == [32, 32]
+
+
+@pytest.mark.renderer
+def test_render_array_returns_rgb_view() -> None:
+    """Renderer should return the canvas pixels as an RGB view."""
+    spec = RenderSpec(figsize=(2.0, 1.5), dpi=40)
+
+    pixels = _chess_renderer().render_array(_chess_grids()[0], spec=spec)
+
+    assert pixels.dtype == np.uint8
+    assert pixels.shape == (60, 80, 3)
+    assert pixels.base is not None
+
+
+@pytest.mark.renderer
+def test_render_arrays_fills_preallocated_batch() -> None:
+    """Renderer should write every frame into the given batch array."""
+    renderer = _chess_renderer()
+    spec = RenderSpec(figsize=(2.0, 2.0), dpi=40)
+    grids = _chess_grids()
+    out = np.zeros((len(grids), 80, 80, 3), dtype=np.uint8)
+
+    frames = renderer.render_arrays(grids, out=out, spec=spec)
+
+    assert frames is out
+    for index, grid in enumerate(grids):
+        expected = renderer.render_array(grid, spec=spec).astype(int)
+        assert np.abs(frames[index].astype(int) - expected).max() <= 2
+
+
+@pytest.mark.renderer
+def test_render_arrays_allocates_batch() -> None:
+    """Renderer should allocate one array for all frames when none is given."""
+    spec = RenderSpec(figsize=(1.0, 1.0), dpi=30)
+
+    frames = _chess_renderer().render_arrays(iter(_chess_grids()), spec=spec)
+
+    assert frames.shape == (4, 30, 30, 3)
+    assert not np.array_equal(frames[0], frames[1])
+
+
+@pytest.mark.renderer
+def test_render_arrays_rejects_mismatched_output() -> None:
+    """Renderer should refuse output arrays of the wrong length or shape."""
+    renderer = _chess_renderer()
+    spec = RenderSpec(figsize=(1.0, 1.0), dpi=30)
+    grids = _chess_grids()
+
+    with pytest.raises(ValueError):
+        renderer.render_arrays(grids, out=np.zeros((2, 30, 30, 3), np.uint8))
+
+    out = np.zeros((len(grids), 20, 20, 3), np.uint8)
+    with pytest.raises(ValueError):
+        renderer.render_arrays(grids, out=out, spec=spec)
+
+
+@pytest.mark.renderer
+def test_pooled_render_array_copies_pixels() -> None:
+    """Pooled renders should return their own pixels and free the figure."""
+    pool = FigurePool()
+    renderer = _chess_renderer()
+    renderer.figure_pool = pool
+    spec = RenderSpec(figsize=(1.0, 1.0), dpi=30)
+    grids = _chess_grids()
+    before = pyplot_figure_count()
+
+    first = renderer.render_array(grids[0], spec=spec)
+    renderer.render_array(grids[1], spec=spec)
+
+    assert (pool.created, pool.in_use) == (1, 0)
+    assert pyplot_figure_count() == before
+    assert np.array_equal(first, _chess_renderer().render_array(grids[0], spec=spec))
+
+
+@pytest.mark.renderer
+def test_renderer_rendering_closes_figure() -> None:
+    """Axes rendered in a with block should be closed when it exits."""
+    before = pyplot_figure_count()
+
+    with _chess_renderer().rendering(_chess_grids()[0]) as ax:
+        assert ax.figure.number in plt.get_fignums()
+        assert pyplot_figure_count() == before + 1
+
+    assert pyplot_figure_count() == before
+
+
+@pytest.mark.renderer
+def test_renderer_closes_shown_figures_when_not_interactive(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """Shown figures should not pile up on non-interactive backends."""
+    monkeypatch.setattr("matplotlib.pyplot.show", lambda: None)
+    monkeypatch.setattr("matplotlib.pyplot.isinteractive", lambda: False)
+    before = pyplot_figure_count()
+
+    _chess_renderer().render(_chess_grids()[0], spec=RenderSpec(dpi=20))
+
+    assert pyplot_figure_count() == before
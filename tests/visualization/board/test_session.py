@@ -0,0 +1,125 @@
+"""Tests for module games.visualization.board.session."""
+
+from typing import Any
+
+import chess
+import numpy as np
+import pytest
+
+from games.visualization.board.adapter.chess import CHESS_CODEBOOK
+from games.visualization.board.adapter.chess import ChessBoardWrapper
+from games.visualization.board.adapter.chess import chess_board_to_codes
+from games.visualization.board.adapter.chess import chess_board_to_grid
+from games.visualization.board.background.chess import ChessBackground
+from games.visualization.board.cells.chess import ChessPiece
+from games.visualization.board.diff import cell_key
+from games.visualization.board.geometry.chess import ChessGeometry
+from games.visualization.board.renderer import MatplotlibBoardRenderer
+from games.visualization.board.renderer import RenderSpec
+from games.visualization.board.session import RenderSession
+from games.visualization.board.types import Grid
+
+
+SPEC = RenderSpec(figsize=(2.0, 2.0), dpi=50)
+
+
+def _renderer() -> MatplotlibBoardRenderer:
+    """Return a chess renderer."""
+    return MatplotlibBoardRenderer(
+        background=ChessBackground(), geometry=ChessGeometry()
+    )
+
+
+def _grid(board: chess.Board) -> Grid:
+    """Return the grid of a chess position."""
+    return chess_board_to_grid(ChessBoardWrapper(board))
+
+
+def _pixels(ax: Any) -> Any:
+    """Return a copy of the rendered pixels of an axes' figure."""
+    return np.asarray(ax.figure.canvas.buffer_rgba()).copy()
+
+
+@pytest.mark.renderer
+def test_session_draws_initial_grid() -> None:
+    """Test every piece of the starting position gets its own artists."""
+    with RenderSession(_renderer(), _grid(chess.Board()), spec=SPEC) as session:
+        assert len(session.cell_artists) == 32
+        assert all(artists for artists in session.cell_artists.values())
+
+
+@pytest.mark.renderer
+def test_session_updates_only_changed_cells() -> None:
+    """Test a move replaces the artists of its two squares only."""
+    board = chess.Board()
+
+    with RenderSession(_renderer(), _grid(board), spec=SPEC) as session:
+        untouched = session.cell_artists[(0, 0)]
+        board.push_san("e4")
+
+        changed = session.update(_grid(board))
+
+        assert sorted(changed) == [(1, 4), (3, 4)]
+        assert (1, 4) not in session.cell_artists
+        assert (3, 4) in session.cell_artists
+        assert session.cell_artists[(0, 0)] is untouched
+        assert session.update(_grid(board)) == []
+
+
+@pytest.mark.renderer
+def test_session_matches_full_render() -> None:
+    """Test blitted frames look the same as rendering from scratch."""
+    board = chess.Board()
+    renderer = _renderer()
+
+    with RenderSession(renderer, _grid(board), spec=SPEC) as session:
+        for san in ("e4", "e5", "Nf3", "Nc6", "Bb5", "a6", "Bxc6", "dxc6", "O-O"):
+            board.push_san(san)
+            session.update(_grid(board))
+
+        ax = renderer.render(_grid(board), spec=SPEC, return_ax=True)
+        ax.figure.canvas.draw()
+
+        # clipping at region edges may shift antialiased pixels by a level
+        blitted = _pixels(session.ax).astype(int)
+        assert np.abs(blitted - _pixels(ax).astype(int)).max() <= 2
+
+
+@pytest.mark.renderer
+def test_session_rejects_other_grid_sizes() -> None:
+    """Test a grid of a different size cannot be shown in a session."""
+    with RenderSession(_renderer(), _grid(chess.Board()), spec=SPEC) as session:
+        with pytest.raises(ValueError):
+            session.update(np.full((3, 3), None, dtype=object))
+
+
+@pytest.mark.renderer
+def test_cell_key_compares_appearance() -> None:
+    """Test distinct but equal-looking cells share a key."""
+    rook = ChessPiece(chess.Piece(chess.ROOK, chess.WHITE))
+    again = ChessPiece(chess.Piece(chess.ROOK, chess.WHITE))
+    black = ChessPiece(chess.Piece(chess.ROOK, chess.BLACK))
+
+    assert rook is not again
+    assert cell_key(rook) == cell_key(again)
+    assert cell_key(rook) != cell_key(black)
+    assert cell_key(None) is None
+
+
+@pytest.mark.renderer
+def test_session_updates_encoded_grids() -> None:
+    """Test encoded grids redraw only the squares whose codes changed."""
+    board = chess.Board()
+    renderer = MatplotlibBoardRenderer(
+        background=ChessBackground(),
+        geometry=ChessGeometry(),
+        codebook=CHESS_CODEBOOK,
+    )
+
+    with RenderSession(renderer, chess_board_to_codes(board), spec=SPEC) as session:
+        assert len(session.cell_artists) == 32
+        board.push_san("Nf3")
+
+        changed = session.update(chess_board_to_codes(board))
+
+        assert sorted(changed) == [(0, 6), (2, 5)]
@@ -0,0 +1,50 @@
+"""Tests for module games.visualization.lazy."""
+
+import subprocess
+import sys
+
+import pytest
+
+import games.visualization.board.scene as scene_package
+
+
+def _imported_after(statement: str, module: str) -> bool:
+    """Return whether a fresh interpreter has imported a module after a statement."""
+    probe = f"import sys; {statement}; print({module!r} in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, check=True, text=True
+    ).stdout
+    return output.strip() == "True"
+
+
+def test_board_package_defers_matplotlib() -> None:
+    """Test importing the visualization packages imports no matplotlib."""
+    statement = (
+        "import games.visualization.board, games.visualization.board.scene, "
+        "games.visualization.board.background"
+    )
+
+    assert not _imported_after(statement, "matplotlib")
+
+
+def test_scene_loads_only_its_game() -> None:
+    """Test a Go scene imports neither python-chess nor pyplot."""
+    statement = "from games.visualization.board.scene import GoScene"
+
+    assert not _imported_after(statement, "chess")
+    assert not _imported_after(statement, "matplotlib.pyplot")
+
+
+def test_lazy_exports_resolve_and_cache() -> None:
+    """Test exports resolve to their submodule's objects and are cached."""
+    from games.visualization.board.scene.chess import ChessScene
+
+    assert scene_package.ChessScene is ChessScene
+    assert vars(scene_package)["ChessScene"] is ChessScene
+    assert {"ChessScene", "GoScene"} <= set(dir(scene_package))
+
+
+def test_lazy_exports_reject_unknown_names() -> None:
+    """Test names that are not exported still raise AttributeError."""
+    with pytest.raises(AttributeError):
+        scene_package.CheckersScene